@@ -1,22 +1,152 @@
+import os
 import json
-import boto3
 import uuid
 import time
 import random
-from decimal import Decimal
+import collections
 
-# Initialize DynamoDB Resource Instance
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('AuditSessions')
+# Shared with the Pi server (deployed next to this file, together with HID_Timing_Calibration.json)
+from HID_Timing_Model import TimingModel, Round_Up
+
+# DynamoDB table and endpoint (DYNAMODB_ENDPOINT: DynamoDB Local or another stand-in)
+TABLE_NAME = os.environ.get('SESSIONS_TABLE', 'AuditSessions')
+DYNAMODB_ENDPOINT = os.environ.get('DYNAMODB_ENDPOINT')
+# Batch write retries for UnprocessedItems (throttling), with exponential backoff
+BATCH_ATTEMPTS = 5
+BATCH_BACKOFF = 0.05
+# Items per BatchWriteItem request (DynamoDB limit)
+BATCH_LIMIT = 25
+
+# Low-level DynamoDB client, built on first use (see get_client)
+dynamodb_client = None
+
+# estimated_duration: timing model for the pacing profile the Pi runs with (its --Pacing,
+# costs from the Pi's --Calibrate run when the calibration file is deployed alongside)
+PACING_PROFILE = os.environ.get('PACING_PROFILE', 'BIOS')
+timing_model = TimingModel.Load(PACING_PROFILE)
+
+# Session lifetime in DynamoDB (TTL attribute)
+SESSION_TTL = 600
+# Largest number of sessions one batch request may create
+MAX_BATCH_SIZE = 100
+
+# Warm-container challenge pool: sessions generated and stored ahead of time with one
+# batch write, then handed out with no DynamoDB round trip (0 disables the pool)
+POOL_SIZE = int(os.environ.get('CHALLENGE_POOL_SIZE', '0'))
+# Pooled sessions older than this are dropped (they keep at least SESSION_TTL - POOL_MAX_AGE to live)
+POOL_MAX_AGE = int(os.environ.get('CHALLENGE_POOL_MAX_AGE', '60'))
+# At or below this many pooled sessions a request tops the pool up by at most BATCH_LIMIT sessions
+# (one batch write round trip), so no single request pays for refilling the whole pool
+POOL_LOW_WATER = int(os.environ.get('CHALLENGE_POOL_LOW_WATER', str(POOL_SIZE // 2)))
+
+# Survives between invocations of a warm container: deque of (item, response_body)
+challenge_pool = collections.deque()
+
+# Session id layout (lowercase base36, fixed width so ids sort by creation time)
+ID_ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyz'
+ID_EPOCH = 1704067200  # 2024-01-01 UTC, 6 time chars last until 2093
+ID_TIME_CHARS = 6
+ID_CONTAINER_CHARS = 4
+ID_COUNTER_CHARS = 3
+# Random tail: batch writes take no condition, so ids from two containers that drew the
+# same prefix in the same second must still differ
+ID_RANDOM_CHARS = 3
+# Single-session writes are conditional: a taken id is never overwritten
+CONDITIONAL_PUT = os.environ.get('CONDITIONAL_PUT', '1') != '0'
+ID_ATTEMPTS = 3
+
+# OS entropy: containers restored from one snapshot share the state of the seeded PRNG
+id_random = random.SystemRandom()
+
+def encode_base36(value, width):
+    chars = []
+    for _ in range(width):
+        value, digit = divmod(value, 36)
+        chars.append(ID_ALPHABET[digit])
+    return ''.join(reversed(chars))
+
+def new_container_prefix():
+    return ''.join(id_random.choices(ID_ALPHABET, k=ID_CONTAINER_CHARS))
+
+# Per-container id state (Lambda runs one invocation per container at a time)
+# The prefix is drawn on first use, not at import: an init phase captured in a snapshot
+# would otherwise hand the same prefix to every container restored from it
+id_state = {'prefix': None, 'second': -1, 'counter': 0}
+
+def forget_container_prefix(*_):
+    id_state['prefix'] = None
+
+try:
+    # Lambda SnapStart runtime hooks: a restored container draws its own prefix even when
+    # ids were generated before the snapshot was taken
+    from snapshot_restore_py import register_after_restore
+    register_after_restore(forget_container_prefix)
+except ImportError:
+    pass
 
 def generate_short_unique_id():
     """
-    Generate a short but unique identifier (8 characters)
-    Format: <timestamp_last6><random_2chars>
+    Generate a short, k-sortable unique identifier (16 characters)
+    Format: <seconds since ID_EPOCH, 6><container prefix, 4><counter, 3><random, 3>
+    Unique within a container (the second never goes back; past 46,656 ids in one second
+    it borrows the next one); across containers two ids only meet if they share the second,
+    the prefix, the counter and the random tail - conditional puts catch even that case
     """
-    timestamp_part = str(int(time.time()))[-6:]
-    random_part = ''.join(random.choices('abcdefghijklmnopqrstuvwxyz0123456789', k=2))
-    return f"{timestamp_part}{random_part}"
+    if id_state['prefix'] is None:
+        id_state['prefix'] = new_container_prefix()
+    second = int(time.time()) - ID_EPOCH
+    if second <= id_state['second']:
+        # Same second (or the clock stepped back): keep counting on the last second used
+        second = id_state['second']
+        id_state['counter'] += 1
+        if id_state['counter'] == 36 ** ID_COUNTER_CHARS:
+            second += 1
+            id_state['counter'] = 0
+    else:
+        id_state['counter'] = 0
+    id_state['second'] = second
+    return (encode_base36(second, ID_TIME_CHARS) + id_state['prefix']
+            + encode_base36(id_state['counter'], ID_COUNTER_CHARS)
+            + ''.join(id_random.choices(ID_ALPHABET, k=ID_RANDOM_CHARS)))
+
+def get_client():
+    """
+    Import boto3 and build the DynamoDB client on first use
+    The low-level client skips the resource layer (its model loading and type
+    conversion); a cold start that fails validation never imports boto3 at all
+    """
+    global dynamodb_client
+    if dynamodb_client is None:
+        import boto3
+        dynamodb_client = boto3.client('dynamodb', endpoint_url=DYNAMODB_ENDPOINT)
+    return dynamodb_client
+
+def to_attribute(value):
+    """
+    Python value -> DynamoDB attribute value (low-level client wire format, no Decimal)
+    """
+    if isinstance(value, bool):
+        return {'BOOL': value}
+    if isinstance(value, str):
+        return {'S': value}
+    if isinstance(value, (int, float)):
+        return {'N': repr(value)}
+    if isinstance(value, dict):
+        return {'M': {key: to_attribute(item) for key, item in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return {'L': [to_attribute(item) for item in value]}
+    if value is None:
+        return {'NULL': True}
+    raise TypeError(f"Cannot store {type(value).__name__} in DynamoDB")
+
+def to_item(item):
+    return {key: to_attribute(value) for key, value in item.items()}
+
+def is_condition_failure(error):
+    """
+    botocore ClientError raised by a failed ConditionExpression
+    """
+    return getattr(error, 'response', {}).get('Error', {}).get('Code') == 'ConditionalCheckFailedException'
 
 def generate_random_string(length=8):
     """
@@ -32,10 +162,10 @@ def generate_random_script():
     2. action_code (string format for Android simplicity)
     
     Pattern: Type → Wait 2-3s → Delete → Wait 2-3s → Repeat (2-3 times)
+    estimated_duration: timing model prediction (keystrokes, WAITs, feedback), rounded up to 0.1 s
     """
     action_script = []
     code_parts = []
-    total_time = 0.0
     
     # Generate 2-3 sequences
     num_sequences = random.randint(2, 3)
@@ -58,10 +188,9 @@ def generate_random_script():
         wait_time = round(random.uniform(2.0, 5.0), 1)
         action_script.append({
             "cmd": "WAIT",
-            "params": {"seconds": Decimal(str(wait_time))}
+            "params": {"seconds": wait_time}
         })
         code_parts.append(f'W{wait_time}')
-        total_time += wait_time
         
         # 3. Delete the HID string
         action_script.append({
@@ -77,19 +206,17 @@ def generate_random_script():
         post_delete_wait = round(random.uniform(2.0, 5.0), 1)
         action_script.append({
             "cmd": "WAIT",
-            "params": {"seconds": Decimal(str(post_delete_wait))}
+            "params": {"seconds": post_delete_wait}
         })
         code_parts.append(f'W{post_delete_wait}')
-        total_time += post_delete_wait
     
     # Final wait before key press
     final_wait = round(random.uniform(2.0, 5.0), 1)
     action_script.append({
         "cmd": "WAIT",
-        "params": {"seconds": Decimal(str(final_wait))}
+        "params": {"seconds": final_wait}
     })
     code_parts.append(f'W{final_wait}')
-    total_time += final_wait
     
     # Final key press
     key_choice = random.choice(["UP", "DOWN","LEFT","RIGHT"])
@@ -105,63 +232,158 @@ def generate_random_script():
     # Join all parts with semicolon for action_code
     action_code = ';'.join(code_parts)
     
-    return action_script, action_code, round(total_time, 1)
+    return action_script, action_code, Round_Up(timing_model.Estimate_Script(action_script))
+
+def build_session(session_id=None):
+    """
+    Generate one session: (DynamoDB item, API response body)
+    """
+    # Generate session_id (short and unique)
+    session_id = session_id or generate_short_unique_id()
+
+    # Timestamps
+    created_at = int(time.time())
+    ttl = created_at + SESSION_TTL  # 10 minutes TTL
+
+    # Generate both formats
+    action_script, action_code, estimated_duration = generate_random_script()
+
+    # Generate audit video name
+    audit_video_name = f"{session_id}.mp4"
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super(DecimalEncoder, self).default(obj)
+    # Prepare DynamoDB item (with readable JSON array)
+    item = {
+        'session_id': session_id,
+        'created_at': created_at,
+        'ttl': ttl,
+        'action_script': action_script,  # JSON array for database readability
+        'status': 'CREATED',
+        'verified': False,
+        'audit_video_name': audit_video_name,
+        # Pacing the Pi runs the script at (the verifier's fallback when a trace does not carry it)
+        'pacing_profile': PACING_PROFILE
+    }
+
+    # Prepare API response (with simplified string format)
+    response_body = {
+        "session_id": session_id,
+        "payload_type": "RAW_CHALLENGE",
+        "timestamp": created_at,
+        "audit_video_name": audit_video_name,
+        "estimated_duration": estimated_duration,
+        "data": {
+            "action_code": action_code  # String format for Android
+        }
+    }
+    return item, response_body
+
+def build_sessions(count):
+    """
+    Generate count sessions (ids from one container never repeat, as one batch write requires)
+    """
+    return [build_session() for _ in range(count)]
+
+def store_session():
+    """
+    Generate and store one session, refusing to overwrite an existing id
+    A collision means another container drew the same prefix: draw a new one and retry
+    """
+    for attempt in range(ID_ATTEMPTS):
+        item, response_body = build_session()
+        if not CONDITIONAL_PUT:
+            get_client().put_item(TableName=TABLE_NAME, Item=to_item(item))
+            return response_body
+        try:
+            get_client().put_item(TableName=TABLE_NAME, Item=to_item(item),
+                                  ConditionExpression='attribute_not_exists(session_id)')
+            return response_body
+        except Exception as e:
+            if not is_condition_failure(e):
+                raise
+            print(f"Session id collision on {item['session_id']}, new container prefix")
+            id_state['prefix'] = new_container_prefix()
+    raise RuntimeError(f"No free session id after {ID_ATTEMPTS} attempts")
+
+def write_sessions(items):
+    """
+    Store sessions with BatchWriteItem (BATCH_LIMIT items per round trip, unprocessed items retried)
+    BatchWriteItem takes no conditions: uniqueness rests on the id layout (random tail included)
+    """
+    client = get_client()
+    requests = [{'PutRequest': {'Item': to_item(item)}} for item in items]
+    for first in range(0, len(requests), BATCH_LIMIT):
+        pending = {TABLE_NAME: requests[first:first + BATCH_LIMIT]}
+        for attempt in range(BATCH_ATTEMPTS):
+            pending = client.batch_write_item(RequestItems=pending).get('UnprocessedItems')
+            if not pending:
+                break
+            time.sleep(BATCH_BACKOFF * 2 ** attempt)
+        else:
+            raise RuntimeError(f"{len(pending[TABLE_NAME])} sessions left unprocessed after {BATCH_ATTEMPTS} attempts")
+
+def take_pooled_session():
+    """
+    Hand out a session that is already stored, topping the pool up at POOL_LOW_WATER
+    Each top-up is one BatchWriteItem request (at most BATCH_LIMIT sessions): a large pool
+    fills up over several requests instead of stalling the one that finds it empty
+    """
+    now = int(time.time())
+    while challenge_pool and now - challenge_pool[0][0]['created_at'] > POOL_MAX_AGE:
+        challenge_pool.popleft()
+    if len(challenge_pool) <= POOL_LOW_WATER:
+        sessions = build_sessions(max(1, min(BATCH_LIMIT, POOL_SIZE - len(challenge_pool))))
+        # Persisted before any of them is handed out: a client never sees an unstored session
+        write_sessions([item for item, _ in sessions])
+        challenge_pool.extend(sessions)
+    return challenge_pool.popleft()[1]
+
+def requested_batch_size(event):
+    """
+    Batch endpoint: "count" from the query string (API Gateway) or the event itself
+    Returns None for a single-session request
+    """
+    params = (event or {}).get('queryStringParameters') or event or {}
+    if 'count' not in params:
+        return None
+    count = int(params['count'])
+    if not 1 <= count <= MAX_BATCH_SIZE:
+        raise ValueError(f"count must be between 1 and {MAX_BATCH_SIZE}")
+    return count
+
+def api_response(status_code, body):
+    return {
+        'statusCode': status_code,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*'
+        },
+        'body': json.dumps(body)
+    }
 
 def lambda_handler(event, context):
     try:
-        # Generate session_id (short and unique)
-        session_id = generate_short_unique_id()
-        
-        # Timestamps
-        created_at = int(time.time())
-        ttl = created_at + 600  # 10 minutes TTL
-        
-        # Generate both formats
-        action_script, action_code, estimated_duration = generate_random_script()
-        
-        # Generate audit video name
-        audit_video_name = f"{session_id}.mp4"
-        
-        # Prepare DynamoDB item (with readable JSON array)
-        item = {
-            'session_id': session_id,
-            'created_at': created_at,
-            'ttl': ttl,
-            'action_script': action_script,  # JSON array for database readability
-            'status': 'CREATED',
-            'verified': False,
-            'audit_video_name': audit_video_name
-        }
-        
+        count = requested_batch_size(event)
+    except (TypeError, ValueError) as e:
+        return api_response(400, {
+            'error': 'Bad Request',
+            'details': str(e)
+        })
+
+    try:
+        if count is not None:
+            # Batch endpoint: N sessions stored with one batch write
+            sessions = build_sessions(count)
+            write_sessions([item for item, _ in sessions])
+            return api_response(200, {
+                "count": count,
+                "sessions": [response_body for _, response_body in sessions]
+            })
+
+        if POOL_SIZE > 0:
+            return api_response(200, take_pooled_session())
+
         # Insert into DynamoDB
-        table.put_item(Item=item)
-        
-        # Prepare API response (with simplified string format)
-        response_body = {
-            "session_id": session_id,
-            "payload_type": "RAW_CHALLENGE",
-            "timestamp": created_at,
-            "audit_video_name": audit_video_name,
-            "estimated_duration": estimated_duration,
-            "data": {
-                "action_code": action_code  # String format for Android
-            }
-        }
-        
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            },
-            'body': json.dumps(response_body, cls=DecimalEncoder)
-        }
+        return api_response(200, store_session())
 
     except Exception as e:
         print(f"Error: {str(e)}")
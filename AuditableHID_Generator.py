@@ -0,0 +1,157 @@
+import os
+import sys
+import json
+import argparse
+
+import numpy as np
+
+from HID_Timing_Model import TimingModel, FEEDBACK_SECONDS
+
+# Same alphabet, keys and ranges as AuditableHID_Backend.generate_random_script
+TEXT_ALPHABET = np.frombuffer(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789', dtype=np.uint8)
+FINAL_KEYS = ("UP", "DOWN", "LEFT", "RIGHT")
+MIN_SEQUENCES, MAX_SEQUENCES = 2, 3
+MIN_TEXT_LENGTH, MAX_TEXT_LENGTH = 6, 10
+# Waits are drawn from 2.0-5.0 s and kept as whole tenths (round(uniform(2, 5), 1))
+MIN_WAIT, MAX_WAIT = 2.0, 5.0
+
+# action_code parts formatted once per possible value
+WAIT_CODES = [f'W{tenths / 10}' for tenths in range(int(MAX_WAIT * 10) + 1)]
+DELETE_CODES = [f'D{length}' for length in range(MAX_TEXT_LENGTH + 1)]
+KEY_CODES = [f'K"{key}"' for key in FINAL_KEYS]
+
+# Same estimated_duration as the backend (PACING_PROFILE, calibration file next to HID_Timing_Model)
+timing_model = TimingModel.Load(os.environ.get('PACING_PROFILE', 'BIOS'))
+
+class ChallengeBatch:
+    """
+    A batch of challenges held as arrays, one row per challenge
+    Rows are emitted on demand as (action_script, action_code, estimated_duration),
+    the same triple generate_random_script returns
+    """
+    def __init__(self, sequences, text_lengths, text_codes, waits, final_wait, final_key):
+        self.sequences = sequences        # (n,) sequences used per challenge
+        self.text_lengths = text_lengths  # (n, MAX_SEQUENCES)
+        self.text_codes = text_codes      # (n, MAX_SEQUENCES, MAX_TEXT_LENGTH) ASCII bytes
+        self.waits = waits                # (n, MAX_SEQUENCES, 2) tenths: after TYPE, after DELETE
+        self.final_wait = final_wait      # (n,) tenths
+        self.final_key = final_key        # (n,) index into FINAL_KEYS
+        # Python-side copies for emitting rows, converted once per batch (see rows)
+        self.columns = None
+
+    def __len__(self):
+        return len(self.sequences)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self.challenge(row)
+
+    def estimated_durations(self, model=None):
+        """
+        Timing model prediction of every challenge, rounded up to 0.1 s like the backend,
+        computed on the whole batch: per challenge 2n+1 WAITs, n TYPE + n DELETE + 1 PRESS actions
+        """
+        model = model or timing_model
+        used = np.arange(MAX_SEQUENCES) < self.sequences[:, None]
+        tenths = (self.waits.sum(axis=2) * used).sum(axis=1) + self.final_wait
+        typed = (self.text_lengths * used).sum(axis=1)
+        seconds = model.Linear_Seconds(Wait_Seconds=tenths / 10, Typed=typed, Deleted=typed, Keys=1,
+                                       Waits=2 * self.sequences + 1, Actions=4 * self.sequences + 2,
+                                       Tail=FEEDBACK_SECONDS["HID"])
+        return np.ceil(np.round(seconds * 10, 6)) / 10
+
+    def rows(self):
+        """
+        Whole-batch conversion for emitting rows: NumPy scalar indexing per field costs more than
+        building the script, and NumPy scalars would leak into it (np.float64 reprs, DynamoDB numbers)
+        """
+        if self.columns is None:
+            self.columns = (
+                self.sequences.tolist(),
+                self.text_lengths.tolist(),
+                self.text_codes.tobytes().decode('ascii'),
+                self.waits.tolist(),
+                self.final_wait.tolist(),
+                self.final_key.tolist(),
+                self.estimated_durations().tolist(),
+            )
+        return self.columns
+
+    def texts(self, row):
+        sequences, text_lengths, text_blob = self.rows()[:3]
+        first = row * MAX_SEQUENCES * MAX_TEXT_LENGTH
+        return [text_blob[first + index * MAX_TEXT_LENGTH:first + index * MAX_TEXT_LENGTH + text_lengths[row][index]]
+                for index in range(sequences[row])]
+
+    def action_code(self, row):
+        waits, final_wait, final_key = self.rows()[3:6]
+        parts = []
+        for text, (after_type, after_delete) in zip(self.texts(row), waits[row]):
+            parts += [f'H"{text}"', WAIT_CODES[after_type], DELETE_CODES[len(text)], WAIT_CODES[after_delete]]
+        parts += [WAIT_CODES[final_wait[row]], KEY_CODES[final_key[row]]]
+        return ';'.join(parts)
+
+    def action_script(self, row):
+        waits, final_wait, final_key = self.rows()[3:6]
+        script = []
+        for text, (after_type, after_delete) in zip(self.texts(row), waits[row]):
+            script += [
+                {"cmd": "HID", "params": {"action": "TYPE", "text": text}},
+                {"cmd": "WAIT", "params": {"seconds": after_type / 10}},
+                {"cmd": "HID", "params": {"action": "DELETE", "count": len(text)}},
+                {"cmd": "WAIT", "params": {"seconds": after_delete / 10}},
+            ]
+        script += [
+            {"cmd": "WAIT", "params": {"seconds": final_wait[row] / 10}},
+            {"cmd": "HID", "params": {"action": "PRESS", "key": FINAL_KEYS[final_key[row]]}},
+        ]
+        return script
+
+    def challenge(self, row):
+        return self.action_script(row), self.action_code(row), self.rows()[6][row]
+
+def draw_wait_tenths(rng, shape):
+    return np.rint(rng.uniform(MIN_WAIT, MAX_WAIT, size=shape) * 10).astype(np.int64)
+
+def generate_batch(count, seed=None, rng=None):
+    """
+    Draw count challenges at once; the same seed always yields the same batch
+    """
+    rng = rng if rng is not None else np.random.default_rng(seed)
+    return ChallengeBatch(
+        sequences=rng.integers(MIN_SEQUENCES, MAX_SEQUENCES + 1, size=count),
+        text_lengths=rng.integers(MIN_TEXT_LENGTH, MAX_TEXT_LENGTH + 1, size=(count, MAX_SEQUENCES)),
+        text_codes=TEXT_ALPHABET[rng.integers(0, len(TEXT_ALPHABET), size=(count, MAX_SEQUENCES, MAX_TEXT_LENGTH))],
+        waits=draw_wait_tenths(rng, (count, MAX_SEQUENCES, 2)),
+        final_wait=draw_wait_tenths(rng, count),
+        final_key=rng.integers(0, len(FINAL_KEYS), size=count),
+    )
+
+def iter_challenges(total, seed=None, batch_size=100000):
+    """
+    Stream total challenges in batches of batch_size (bounded memory for millions of scripts)
+    Reproducible for the same seed and batch_size
+    """
+    rng = np.random.default_rng(seed)
+    for first in range(0, total, batch_size):
+        yield from generate_batch(min(batch_size, total - first), rng=rng)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Bulk, reproducible challenge generation (JSON lines)')
+    parser.add_argument('--count', type=int, default=1000, help='Number of challenges')
+    parser.add_argument('--seed', type=int, help='Random seed (same seed, same challenges)')
+    parser.add_argument('--batch-size', type=int, default=100000, help='Challenges drawn per batch')
+    parser.add_argument('--output', help='Write to this file instead of stdout')
+    args = parser.parse_args()
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for action_script, action_code, estimated_duration in iter_challenges(args.count, args.seed, args.batch_size):
+            output.write(json.dumps({
+                "action_script": action_script,
+                "action_code": action_code,
+                "estimated_duration": estimated_duration
+            }) + '\n')
+    finally:
+        if output is not sys.stdout:
+            output.close()
@@ -0,0 +1,271 @@
+import sys
+import json
+import time
+
+import numpy as np
+
+from HID_Timing_Model import TimingModel, DEFAULT_COSTS, DEFAULT_PACING_PROFILE, Script_Actions, Decode_Trace
+# Same table, client and wire format as the backend that stored the sessions
+from AuditableHID_Backend import get_client, to_attribute, TABLE_NAME, BATCH_LIMIT, BATCH_ATTEMPTS, BATCH_BACKOFF
+
+# Step kinds shared by action_script entries and execution trace steps
+KIND_UNKNOWN = -1
+KIND_TYPE = 0
+KIND_DELETE = 1
+KIND_WAIT = 2
+KIND_PRESS = 3
+
+# action_script ("cmd", params "action") -> kind (see generate_random_script)
+SCRIPT_KINDS = {
+    ("HID", "TYPE"): KIND_TYPE,
+    ("HID", "DELETE"): KIND_DELETE,
+    ("HID", "PRESS"): KIND_PRESS,
+    ("WAIT", None): KIND_WAIT,
+}
+
+# Bluetooth_HID_Server trace command -> kind (action_code H / D / K / W)
+TRACE_KINDS = {
+    "TYPE": KIND_TYPE,
+    "DELETE_TEXT": KIND_DELETE,
+    "HID": KIND_PRESS,
+    "WAIT": KIND_WAIT,
+}
+
+# Timing models per (pacing, execution mode), shared by every session of a run
+timing_models = {}
+
+def session_timing_model(pacing, mode):
+    """
+    Shared timing model for the pacing a session ran at (profile name or trace "Pacing" object)
+    TIMELINE scripts run against absolute deadlines: the scripted offsets are the pacing
+    sleeps alone, execution costs never add up
+    """
+    key = (json.dumps(pacing, sort_keys=True), mode)
+    if key not in timing_models:
+        if mode == "TIMELINE":
+            timing_models[key] = TimingModel(pacing, {name: 0.0 for name in DEFAULT_COSTS})
+        else:
+            timing_models[key] = TimingModel.Load(pacing)
+    return timing_models[key]
+
+def expected_steps(action_script, model=None):
+    """
+    Lower a stored action_script into (kinds, expected_seconds)
+    Every step is timed by the shared timing model (pacing sleeps, requested WAIT seconds, execution costs)
+    """
+    model = model or session_timing_model(DEFAULT_PACING_PROFILE, "INTERPRET")
+    kinds = []
+    durations = []
+    for step in action_script:
+        params = step.get("params", {})
+        cmd = step.get("cmd")
+        kind = SCRIPT_KINDS.get((cmd, params.get("action") if cmd == "HID" else None), KIND_UNKNOWN)
+        duration = 0.0
+        if kind != KIND_UNKNOWN:
+            # DynamoDB hands numbers back as Decimal: the model converts them
+            for action in Script_Actions([step]):
+                duration = model.Action_Seconds(action["Command"], action["Parameters"])
+        kinds.append(kind)
+        durations.append(duration)
+    return kinds, durations
+
+def build_batch(sessions, traces, pacing=None):
+    """
+    Pack a batch into padded (sessions x steps) arrays
+    This is the only per-step Python loop - scoring runs on whole arrays
+    Each session is timed at the pacing it ran at: the trace's "Pacing", else the stored
+    item's pacing_profile, else pacing (default: the server's default profile)
+    """
+    count = len(sessions)
+    rows_expected, cols_expected, kinds_expected, durations_expected = [], [], [], []
+    rows_observed, cols_observed, kinds_observed, starts, ends = [], [], [], [], []
+    has_trace = np.zeros(count, dtype=bool)
+    width = 1
+
+    for row, session in enumerate(sessions):
+        trace = traces.get(session["session_id"])
+        if trace is not None and not isinstance(trace, dict):
+            # As returned with AUDIT_COMPLETE (--Trace JSON / ZLIB), or already decoded
+            trace = Decode_Trace(trace)
+        session_pacing = (trace or {}).get("Pacing") or session.get("pacing_profile") or pacing or DEFAULT_PACING_PROFILE
+        model = session_timing_model(session_pacing, (trace or {}).get("Mode", "INTERPRET"))
+
+        kinds, durations = expected_steps(session.get("action_script", []), model)
+        rows_expected.extend([row] * len(kinds))
+        cols_expected.extend(range(len(kinds)))
+        kinds_expected.extend(kinds)
+        durations_expected.extend(durations)
+        width = max(width, len(kinds))
+
+        if trace is None:
+            continue
+        has_trace[row] = True
+        for index, command, start, end in trace["Steps"]:
+            rows_observed.append(row)
+            cols_observed.append(index)
+            kinds_observed.append(TRACE_KINDS.get(command, KIND_UNKNOWN))
+            starts.append(start)
+            ends.append(end)
+            width = max(width, index + 1)
+
+    batch = {
+        "session_id": [session["session_id"] for session in sessions],
+        "has_trace": has_trace,
+        "valid": np.zeros((count, width), dtype=bool),
+        "expected_kind": np.full((count, width), KIND_UNKNOWN, dtype=np.int8),
+        "expected": np.zeros((count, width)),
+        "observed_kind": np.full((count, width), KIND_UNKNOWN, dtype=np.int8),
+        "start": np.full((count, width), np.nan),
+        "end": np.full((count, width), np.nan),
+    }
+    batch["valid"][rows_expected, cols_expected] = True
+    batch["expected_kind"][rows_expected, cols_expected] = kinds_expected
+    batch["expected"][rows_expected, cols_expected] = durations_expected
+    batch["observed_kind"][rows_observed, cols_observed] = kinds_observed
+    batch["start"][rows_observed, cols_observed] = starts
+    batch["end"][rows_observed, cols_observed] = ends
+    return batch
+
+def score_batch(batch, wait_absolute=0.05, wait_relative=0.02, key_absolute=0.25, key_relative=0.5, max_gap=None):
+    """
+    Score every session of a packed batch at once
+
+    WAIT steps     : |observed - requested| <= wait_absolute + wait_relative * requested
+    Keystroke steps: observed <= expected * (1 + key_relative) + key_absolute
+                     (faster pacing than expected is fine, slower means the keys did not go out)
+    Between steps  : idle time <= max_gap (defaults to wait_absolute - unexplained pauses fail)
+
+    TIMELINE traces carry no WAIT steps: a run of untraced WAITs is measured between
+    the traced steps around it (their start distance against the scripted offsets)
+    """
+    if max_gap is None:
+        max_gap = wait_absolute
+    valid = batch["valid"]
+    expected_kind = batch["expected_kind"]
+    expected = batch["expected"]
+    start = batch["start"]
+    end = batch["end"]
+    width = start.shape[1]
+    is_wait = valid & (expected_kind == KIND_WAIT)
+    traced = ~np.isnan(start)
+
+    # Nearest traced step at or before / at or after every column (-1 / width : none)
+    columns = np.arange(width)
+    previous_traced = np.maximum.accumulate(np.where(traced, columns, -1), axis=1)
+    next_traced = np.minimum.accumulate(np.where(traced, columns, width)[:, ::-1], axis=1)[:, ::-1]
+
+    def gather(values, index):
+        inside = (index >= 0) & (index < width)
+        return np.where(inside, np.take_along_axis(values, np.clip(index, 0, width - 1), axis=1), np.nan)
+
+    # Scripted start offset of every step
+    offset = np.cumsum(expected, axis=1) - expected
+    missing_wait = is_wait & ~traced
+    run_observed = gather(start, next_traced) - gather(start, previous_traced)
+    run_expected = gather(offset, next_traced) - gather(offset, previous_traced)
+    run_error = run_observed - run_expected
+    run_wait = run_expected - gather(expected, previous_traced)
+
+    error = np.where(missing_wait, run_error, (end - start) - expected)
+    wait_band = wait_absolute + wait_relative * np.where(missing_wait, run_wait, expected)
+    observed_kind = np.where(missing_wait, KIND_WAIT, batch["observed_kind"])
+    next_start = np.full_like(start, np.nan)
+    next_start[:, :-1] = start[:, 1:]
+
+    # NaN (step never ran) compares False : the step fails
+    with np.errstate(invalid='ignore'):
+        wait_ok = np.abs(error) <= wait_band
+        key_ok = (error + expected >= 0) & (error <= expected * key_relative + key_absolute)
+        gap = next_start - end
+        gap_ok = ~(gap > max_gap) & ~(gap < -max_gap)
+
+    # The last step has no successor (NaN gap passes), neither has a step followed by an untraced WAIT
+    step_ok = valid & (observed_kind == expected_kind) & np.where(is_wait, wait_ok, key_ok) & gap_ok
+    failed = valid & ~step_ok
+    # Steps in the trace the script never asked for
+    unexpected = ~valid & ~np.isnan(start)
+
+    steps = valid.sum(axis=1)
+    passed = step_ok.sum(axis=1)
+    verified = batch["has_trace"] & (passed == steps) & ~unexpected.any(axis=1)
+    return {
+        "session_id": batch["session_id"],
+        "verified": verified,
+        "score": np.where(batch["has_trace"], passed / np.maximum(steps, 1), 0.0),
+        "steps": steps,
+        "passed": passed,
+        "failed_step": np.where(failed.any(axis=1), failed.argmax(axis=1), -1),
+        "max_wait_error": np.where(is_wait & ~np.isnan(error), np.abs(error), 0.0).max(axis=1),
+    }
+
+def verify_sessions(sessions, traces, pacing=None, **tolerance):
+    """
+    Verify stored sessions (items with session_id and action_script) against
+    their execution traces (session_id -> trace) and return one record per session
+    """
+    results = score_batch(build_batch(sessions, traces, pacing), **tolerance)
+    return [
+        {
+            "session_id": session_id,
+            "verified": bool(results["verified"][row]),
+            "score": round(float(results["score"][row]), 4),
+            "failed_step": int(results["failed_step"][row]),
+            "max_wait_error": round(float(results["max_wait_error"][row]), 4),
+        }
+        for row, session_id in enumerate(results["session_id"])
+    ]
+
+# BatchWriteItem cannot update: verification results go out as PartiQL statements (BATCH_LIMIT per request)
+MARK_STATEMENT = f'UPDATE "{TABLE_NAME}" SET "verified" = ? SET "status" = ? SET "verification_score" = ? WHERE "session_id" = ?'
+# Statement errors worth another attempt (throttling); anything else - e.g. a session that expired - is reported
+RETRY_ERRORS = {'ProvisionedThroughputExceeded', 'ThrottlingError', 'RequestLimitExceeded', 'InternalServerError',
+                'TransactionConflict'}
+
+def mark_sessions(records, client=None):
+    """
+    Write verification results back to the AuditSessions table with BatchExecuteStatement
+    (BATCH_LIMIT sessions per round trip, throttled statements retried with backoff)
+    Returns {session_id: error code} for the sessions that could not be updated
+    """
+    client = client or get_client()
+    statements = [
+        {
+            'Statement': MARK_STATEMENT,
+            'Parameters': [
+                to_attribute(record["verified"]),
+                to_attribute('VERIFIED' if record["verified"] else 'REJECTED'),
+                to_attribute(record["score"]),
+                to_attribute(record["session_id"]),
+            ]
+        }
+        for record in records
+    ]
+    failed = {}
+    for first in range(0, len(statements), BATCH_LIMIT):
+        pending = statements[first:first + BATCH_LIMIT]
+        for attempt in range(BATCH_ATTEMPTS):
+            responses = client.batch_execute_statement(Statements=pending)['Responses']
+            retry = []
+            for statement, response in zip(pending, responses):
+                code = response.get('Error', {}).get('Code')
+                if code in RETRY_ERRORS:
+                    retry.append(statement)
+                elif code is not None:
+                    failed[statement['Parameters'][-1]['S']] = code
+            pending = retry
+            if not pending:
+                break
+            time.sleep(BATCH_BACKOFF * 2 ** attempt)
+        else:
+            raise RuntimeError(f"{len(pending)} verification results left unwritten after {BATCH_ATTEMPTS} attempts")
+    return failed
+
+if __name__ == '__main__':
+    # Usage: python3 AuditableHID_Verifier.py batch.json
+    # batch.json: [{"session_id": ..., "action_script": [...], "trace": "AUDIT_COMPLETE:TRACE..."}, ...]
+    with open(sys.argv[1]) as batch_file:
+        entries = json.load(batch_file)
+    records = verify_sessions(entries, {entry["session_id"]: entry.get("trace") for entry in entries if entry.get("trace")})
+    for record in records:
+        print(json.dumps(record))
+    print(f"Verified {sum(record['verified'] for record in records)}/{len(records)} sessions")
@@ -15,7 +15,6 @@
 """
 
 " Python Imports "
-import bluetooth
 import time
 import sys
 import signal
@@ -23,11 +22,46 @@ import traceback
 import os
 import json
 import fcntl
+import select
+import collections
+import threading
+import gc
+import queue
+import codecs
+import asyncio
+import concurrent.futures
+import socket
+import statistics
+import difflib
+import bisect
+import zlib
+import base64
+import hmac
+import hashlib
+import secrets
 from decimal import Decimal
+from types import MappingProxyType
+
+# PyBluez Is Only Needed By The RFCOMM Transport (TCP / UNIX Run On Any Linux Box)
+try:
+    import bluetooth
+except ImportError:
+    bluetooth = None
 
 # Import GPIOZero into LED & Buzzer Instance (Direct Call in Future)
 # GPIOZero Has LED Library and Buzzer Library. Direct Call and Use.
-from gpiozero import LED, Buzzer
+# Only Needed For The Physical Audit Signals (--TestMode Runs Without It, See Hardware)
+try:
+    from gpiozero import LED, Buzzer
+except ImportError:
+    LED = Buzzer = None
+
+# Pacing Profiles And Script Timing - Shared With The Backend (HID_Timing_Model.py Next To This File)
+from HID_Timing_Model import (PACING_PROFILES, DEFAULT_PACING_PROFILE,
+                              Resolve_Pacing, Row_Delete_Count, FEEDBACK_SECONDS, TimingModel, Fit_Costs, Save_Calibration,
+                              Calibration_Path, CALIBRATION_LENGTHS, CALIBRATION_WAITS, Decode_Trace)
+# Keyboard Layouts (US, UK, DE, FR, JIS ...) Compiled Into Report Tables (HID_Layouts.py Next To This File)
+from HID_Layouts import RELEASE_REPORT, DEFAULT_LAYOUT, Load_Layout, Layout_Names, Load_Layout_File
 
 """
 +============================================================================================================+
@@ -35,9 +69,32 @@ from gpiozero import LED, Buzzer
 | Handle Physical Hardware Audit Signals - LEDs and Buzzer                                                   |                          
 +============================================================================================================+
 """
+class NullIndicator:
+    """No-Op LED / Buzzer Stand-In (Test Mode Without gpiozero)"""
+
+    def __init__(Self, Pin):
+        Self.Pin = Pin
+
+    def on(Self):
+        pass
+
+    def off(Self):
+        pass
+
 class Hardware:
     """Hardware Class Object Initialization"""
-    def __init__(Self) :
+
+    #Python Define
+    # '2.0' is Abnormal Payload Handling
+    DEFAULT_LED_SLEEP_TIME = 2.0
+    DEFAULT_LED_COLOR = "White"
+    DEFAULT_BUZZER_OCCUR = 1
+    DEFAULT_BUZZER_LAST = 2.0
+    DEFAULT_SLEEP_TIME = 2.0
+    # Buzzer Pattern Lengths (Seconds)
+    BUZZER_PATTERNS = {"Short": 0.1, "Long": 0.5}
+
+    def __init__(Self, Test_Mode=False) :
         # GPIO Mapping Based on Raspberry Pi Zero 2 W Board Layout
         # GND  : Physical PIN 6  
         # GPIOs :
@@ -49,18 +106,34 @@ class Hardware:
 
         # Attrib Initialization
 
+        # gpiozero Missing : Test Mode Signals Into No-Op Stand-Ins, Live Audits Need The Real GPIOs
+        Led_Class, Buzzer_Class = LED, Buzzer
+        if LED is None:
+            if not Test_Mode:
+                raise RuntimeError("gpiozero Is Not Installed - Audit LEDs / Buzzer Need It (Or Run With --TestMode)")
+            print("[Hardware_Class] gpiozero Not Installed - LED / Buzzer Signals Are No-Ops In Test Mode")
+            Led_Class = Buzzer_Class = NullIndicator
+
         # LEDs GPIO Settings
         # Read and understand as "gpiozero(23)". 
         Self.LEDs = {
-            "Red":LED(23), 
-            "Yellow":LED(25),
-            "Blue":LED(24),
-            "White":LED(26)
+            "Red":Led_Class(23), 
+            "Yellow":Led_Class(25),
+            "Blue":Led_Class(24),
+            "White":Led_Class(26)
         }
 
         # Buzzer GPIO Settings
         # Read and understand as "gpiozero(27)". 
-        Self.Buzzer = Buzzer(27)
+        Self.Buzzer = Buzzer_Class(27)
+
+        # Indicator Engine (Fire-And-Forget Feedback Signals)
+        # Indicator_Schedule : Device -> Merged On-Intervals [(Start, End), ...] In time.monotonic() Seconds
+        # Indicator_State    : Device -> Last Level Driven By The Engine
+        Self.Indicator_Schedule = {}
+        Self.Indicator_State = {}
+        Self.Indicator_Condition = threading.Condition()
+        Self.Indicator_Thread = None
 
     # Hardware Runner
     # self.hw.run("LED", {"Color": "RED", "Duration": 1.0})
@@ -70,13 +143,11 @@ class Hardware:
     
     def Run(Self, Command, Parameters):
         """GPIO Hardware Executor"""
-        # Python Define
-        # '2.0' is Abnormal Payload Handling
-        DEFAULT_LED_SLEEP_TIME = 2.0 
-        DEFAULT_LED_COLOR = "White"
-        DEFAULT_BUZZER_OCCUR = 1
-        DEFAULT_BUZZER_LAST = 2.0
-        DEFAULT_SLEEP_TIME = 2.0
+        # Python Define (Class Defaults)
+        DEFAULT_LED_SLEEP_TIME = Self.DEFAULT_LED_SLEEP_TIME
+        DEFAULT_LED_COLOR = Self.DEFAULT_LED_COLOR
+        DEFAULT_BUZZER_OCCUR = Self.DEFAULT_BUZZER_OCCUR
+        DEFAULT_SLEEP_TIME = Self.DEFAULT_SLEEP_TIME
 
         # Try Execute Logic 
         try:
@@ -100,13 +171,8 @@ class Hardware:
                 for Iteration in range(int(Parameters.get("Repeat", DEFAULT_BUZZER_OCCUR))):
                     # GPIO ON Logic
                     Self.Buzzer.on()
-                    # Sleep Condition
-                    if Parameters.get("Pattern") == "Short":
-                        duration = 0.1
-                    elif Parameters.get("Pattern") == "Long" :
-                        duration = 0.5
-                    else : 
-                        duration = DEFAULT_BUZZER_LAST
+                    # Sleep Condition (Short / Long / Default)
+                    duration = Self.BUZZER_PATTERNS.get(Parameters.get("Pattern"), Self.DEFAULT_BUZZER_LAST)
                     # Sleep Logic
                     time.sleep(duration)
                     # GPIO OFF Logic
@@ -120,6 +186,199 @@ class Hardware:
         except Exception as Error:
             print(f"[Hardware_Class] Failed To Execute {Command}: {Error}")
 
+    # Indicator Engine
+    # self.hw.signal("LED", {"Color": "Blue", "Duration": 0.1})
+    # self.hw.signal("BEEP", {"Repeat": 2, "Pattern": "Short"})
+
+    def Signal(Self, Command, Parameters):
+        """
+        Fire-And-Forget Feedback Signal (LED / BEEP) - Returns Immediately
+        The Indicator Thread Drives The GPIOs; Overlapping Requests On The Same Device
+        Are Coalesced (On-Intervals Merged) Instead Of Queued Back To Back
+        """
+        try:
+            Now = time.monotonic()
+
+            # LED : One On-Interval Of Duration Seconds
+            if Command == "LED":
+                Device = Self.LEDs.get(Parameters.get("Color", Self.DEFAULT_LED_COLOR))
+                if not Device:
+                    return
+                Intervals = [(Now, Now + float(Parameters.get("Duration", Self.DEFAULT_LED_SLEEP_TIME)))]
+
+            # BEEP : Repeat On-Intervals Separated By A Gap Of The Same Length
+            elif Command == "BEEP":
+                Device = Self.Buzzer
+                Duration = Self.BUZZER_PATTERNS.get(Parameters.get("Pattern"), Self.DEFAULT_BUZZER_LAST)
+                Repeat = int(Parameters.get("Repeat", Self.DEFAULT_BUZZER_OCCUR))
+                Intervals = [(Now + 2 * Index * Duration, Now + (2 * Index + 1) * Duration) for Index in range(Repeat)]
+
+            else:
+                print(f"[Hardware_Class] Signal Not Supported For {Command}")
+                return
+
+            with Self.Indicator_Condition:
+                Self.Indicator_Schedule[Device] = Self.Merge_Intervals(Self.Indicator_Schedule.get(Device, []) + Intervals)
+                # Indicator Thread Starts On First Use (Daemon : Never Holds Up Shutdown)
+                if Self.Indicator_Thread is None:
+                    Self.Indicator_Thread = threading.Thread(target=Self.Indicator_Loop, name="Indicator", daemon=True)
+                    Self.Indicator_Thread.start()
+                Self.Indicator_Condition.notify()
+
+        # Exception Error Handling
+        except Exception as Error:
+            print(f"[Hardware_Class] Failed To Signal {Command}: {Error}")
+
+    @staticmethod
+    def Merge_Intervals(Intervals):
+        """Union Of Overlapping / Touching (Start, End) Intervals, Sorted"""
+        Merged = []
+        for Start, End in sorted(Intervals):
+            if Merged and Start <= Merged[-1][1]:
+                Merged[-1] = (Merged[-1][0], max(Merged[-1][1], End))
+            else:
+                Merged.append((Start, End))
+        return Merged
+
+    def Indicator_Loop(Self):
+        """Indicator Thread : Drive Every Scheduled Device, Sleep Until The Next Edge Or A New Request"""
+        with Self.Indicator_Condition:
+            while True:
+                Now = time.monotonic()
+                Next_Edge = None
+
+                for Device, Intervals in list(Self.Indicator_Schedule.items()):
+                    # Drop Finished Intervals
+                    Intervals = [Interval for Interval in Intervals if Interval[1] > Now]
+                    Active = any(Start <= Now for Start, End in Intervals)
+
+                    # GPIO Level Change Only On Edges
+                    if Active != Self.Indicator_State.get(Device, False):
+                        try:
+                            if Active:
+                                Device.on()
+                            else:
+                                Device.off()
+                        except Exception as Error:
+                            print(f"[Hardware_Class] Indicator GPIO Error: {Error}")
+                        Self.Indicator_State[Device] = Active
+
+                    if Intervals:
+                        Self.Indicator_Schedule[Device] = Intervals
+                        # Next Edge : Start Of A Pending Interval Or End Of The Running One
+                        Start, End = Intervals[0]
+                        Edge = Start if Start > Now else End
+                        Next_Edge = Edge if Next_Edge is None else min(Next_Edge, Edge)
+                    else:
+                        del Self.Indicator_Schedule[Device]
+
+                # Idle Until The Next Edge (Or Forever), Woken Early By Signal()
+                Self.Indicator_Condition.wait(None if Next_Edge is None else max(0.0, Next_Edge - Now))
+
+"""
++============================================================================================================+
+| Input Field Shadow Model                                                                                   |
+| What This Keyboard Typed Into The Focused Field : Length And Cursor, Or Unknown                            |
++============================================================================================================+
+| Known After : FIELD Command (Declared Contents) Or A DELETE_ROW On A Known Field (Field Is Empty)          |
+| Tracked     : Printable Characters (Insert At The Cursor), LEFT / RIGHT / HOME / END, BACKSPACE / DELETE   |
+| Unknown On  : ENTER / TAB / UP / DOWN / ESC / F-Keys ... (Focus Or Field May Change), Failed Writes,       |
+|               Raw Scan Codes, A New Client Session                                                         |
+| DELETE_ROW On A Known Field Sends Exactly Cursor Backspaces + (Length - Cursor) DELETEs                    |
+| A Blind DELETE_ROW (HOME + 30/50/80 DELETEs) Leaves The Field Unknown : The Row May Have Been Longer       |
++============================================================================================================+
+"""
+class InputFieldModel:
+
+    #Python Define
+    # Named Keys That Leave Every Field Untouched (Lock Toggles)
+    NEUTRAL_KEYS = frozenset(("CAPSLOCK", "NUMLOCK", "SCROLLLOCK"))
+
+    def __init__(Self):
+        # Attrib Initialization
+        Self.Known = False
+        Self.Length = 0
+        Self.Cursor = 0
+
+    def Reset(Self, Length=0, Cursor=None):
+        """Field State Is Known : Length Characters, Cursor Position (Default : At The End)"""
+        Self.Known = True
+        Self.Length = Length
+        Self.Cursor = Length if Cursor is None else Cursor
+
+    def Forget(Self):
+        Self.Known = False
+        Self.Length = 0
+        Self.Cursor = 0
+
+    def Copy(Self):
+        Field = InputFieldModel()
+        Field.Known, Field.Length, Field.Cursor = Self.Known, Self.Length, Self.Cursor
+        return Field
+
+    def Declare(Self, Parameters):
+        """
+        FIELD Command : {"Length": 12, "Cursor": 4} (Default : Empty, Cursor At The End), {"Known": false} Forgets
+        Raises ValueError On Invalid Parameters (The State Is Left Unchanged)
+        """
+        if not Parameters.get("Known", True):
+            Self.Forget()
+            return
+        Length = Parameters.get("Length", 0)
+        Cursor = Parameters.get("Cursor", Length)
+        for Name, Value in (("Length", Length), ("Cursor", Cursor)):
+            if not isinstance(Value, int) or isinstance(Value, bool) or Value < 0:
+                raise ValueError(f"FIELD {Name} Must Be A Non-Negative Integer")
+        if Cursor > Length:
+            raise ValueError("FIELD Cursor Must Not Be Past The End")
+        Self.Reset(Length, Cursor)
+
+    def Type_Text(Self, Text):
+        """Characters Inserted At The Cursor - ENTER / TAB (Or Any Control Character) Leave The Field"""
+        if not Self.Known:
+            return
+        if any(ord(Char) < 32 for Char in Text):
+            Self.Forget()
+            return
+        Self.Length += len(Text)
+        Self.Cursor += len(Text)
+
+    def Press(Self, Key_Name):
+        """One Key Typed By Name (Single Characters Insert Themselves)"""
+        if len(Key_Name) == 1:
+            return Self.Type_Text(Key_Name)
+        Key_Name = Key_Name.upper()
+        if not Self.Known or Key_Name in Self.NEUTRAL_KEYS:
+            return
+        if Key_Name == "LEFT":
+            Self.Cursor = max(0, Self.Cursor - 1)
+        elif Key_Name == "RIGHT":
+            Self.Cursor = min(Self.Length, Self.Cursor + 1)
+        elif Key_Name == "HOME":
+            Self.Cursor = 0
+        elif Key_Name == "END":
+            Self.Cursor = Self.Length
+        elif Key_Name == "BACKSPACE":
+            if Self.Cursor > 0:
+                Self.Cursor -= 1
+                Self.Length -= 1
+        elif Key_Name in ("DELETE", "DEL"):
+            if Self.Cursor < Self.Length:
+                Self.Length -= 1
+        elif Key_Name == "SPACE":
+            Self.Type_Text(" ")
+        else:
+            Self.Forget()
+
+    def Clear_Keys(Self):
+        """(Backspaces, Deletes) Emptying The Field, None While Its State Is Unknown"""
+        if not Self.Known:
+            return None
+        return Self.Cursor, Self.Length - Self.Cursor
+
+    def Snapshot(Self):
+        return {"Known": Self.Known, "Length": Self.Length, "Cursor": Self.Cursor}
+
 """
 +============================================================================================================+
 | RaspberryKeyboard Class                                                                                    |
@@ -141,66 +400,82 @@ class RaspberryKeyboard:
     MOD_RALT = 0x40
     MOD_RGUI = 0x80
 
-    def __init__(Self, Test_Mode=False):
+    # Boot Keyboard Report Layout : [Modifier, Reserved, Key1 .. Key6]
+    REPORT_LENGTH = 8
+    # All-Zero Report Releases Every Key (Shared With The Layout Tables, Never Rebuilt)
+    RELEASE_REPORT = RELEASE_REPORT
+    # Compiled Strings Kept For Repeated Passwords / Challenge Strings
+    COMPILED_CACHE_LIMIT = 64
+
+    # Report Sequencer Modes
+    # SINGLE   : One Key Per Press Report, All-Zero Release After Every Key (Legacy)
+    # ROLLOVER : Next Distinct Key Pressed Before The Previous One Is Released
+    SEQUENCE_SINGLE = "SINGLE"
+    SEQUENCE_ROLLOVER = "ROLLOVER"
+    SEQUENCE_MODES = (SEQUENCE_SINGLE, SEQUENCE_ROLLOVER)
+    # Boot Report Has Six Key Slots (More Would Be An ErrorRollOver Report)
+    ROLLOVER_MAX_KEYS = 6
+
+    # HID Writer Modes
+    # BLOCKING : Blocking write(), Sleep-And-Retry On EAGAIN (Legacy)
+    # POLL     : Non-Blocking FD, poll() For POLLOUT Before And After Every Report
+    #            (POLLOUT = Gadget Driver Has Handed The Previous Report To The Host)
+    WRITER_BLOCKING = "BLOCKING"
+    WRITER_POLL = "POLL"
+    WRITER_MODES = (WRITER_BLOCKING, WRITER_POLL)
+    # Longest Wait For The Host To Poll (Suspended Host / Unplugged Cable)
+    POLL_TIMEOUT_MS = 1000
+    # Per-Report Timestamps Kept For Inspection (POLL Writer)
+    REPORT_LOG_LENGTH = 512
+    # Write Path Counters (Exported By ServerStats)
+    # Reports : Written / Recorded, EAGAIN : Driver Buffer Full, Reopens : Endpoint Shutdown (108),
+    # Poll_Timeouts : Host Did Not Poll Within POLL_TIMEOUT_MS, Failures : Report Given Up
+    WRITE_COUNTERS = ("Reports", "EAGAIN", "Reopens", "Poll_Timeouts", "Failures")
+
+    def __init__(Self, Test_Mode=False, Sequence_Mode="SINGLE", Rollover_Keys=2, Pacing=None, Writer_Mode="BLOCKING",
+                 Device=None, Layout=None):
         #Python Define 
         # HID Device Path
         HID_DEVICE_PATH = '/dev/hidg0'
         
         # Attrib Initialization
-        Self.Device = HID_DEVICE_PATH 
+        # Device Override : Any Writable Path Standing In For The Gadget (e.g. A FIFO Read By --Decode)
+        Self.Device = Device or HID_DEVICE_PATH 
         Self.Debug = False
         # If Test_Mode True, Skip Actual HID Writes
         Self.Test_Mode = Test_Mode  
         Self.Last_Char = None
         Self.Last_Nodifier = 0
+        # Report Sequencer : Mode And Number Of Keys Held At Once In ROLLOVER Mode
+        Self.Sequence_Mode = Sequence_Mode if Sequence_Mode in Self.SEQUENCE_MODES else Self.SEQUENCE_SINGLE
+        Self.Rollover_Keys = max(1, min(int(Rollover_Keys), Self.ROLLOVER_MAX_KEYS))
+        # Pacing Profile : Name And Delays (See PACING_PROFILES)
+        Self.Pacing_Profile, Self.Pacing = Resolve_Pacing(Pacing)
+        # Keyboard Layout Of The Host : Compiled Character Tables (See HID_Layouts.KeyboardLayout)
+        Self.Layout = Load_Layout(Layout)
         # File Descriptor For Non-Blocking Writes
         Self.HID_FD = None  
-
-        # Character Map with Arrow Keys and Special Keys
+        # HID Writer Mode (BLOCKING / POLL) And The poll() Object Of The POLL Writer
+        Self.Writer_Mode = Writer_Mode if Writer_Mode in Self.WRITER_MODES else Self.WRITER_BLOCKING
+        Self.Poller = None
+        # POLL Writer : (Write_Time, Complete_Time) Per Report, time.monotonic() Seconds
+        # Complete_Time Is None When The Host Did Not Consume The Report Within POLL_TIMEOUT_MS
+        Self.Report_Log = collections.deque(maxlen=Self.REPORT_LOG_LENGTH)
+        # Dedicated Writer Thread (HIDOutputQueue) - None : Write Inline In The Caller
+        Self.Output = None
+        # Real-Time Pacer (--Realtime, See RealtimePacer) - None : time.sleep After Every Report
+        Self.Pacer = None
+        # ServerStats Receiving The Report_Jitter Of Every Sequence (None : Not Measured)
+        Self.Stats = None
+        # Recording Sink (RecordingHIDSink) - Takes Every Report Instead Of The Device / Test Print
+        Self.Sink = None
+        # Write Path Counters (See WRITE_COUNTERS)
+        Self.Write_Counters = dict.fromkeys(Self.WRITE_COUNTERS, 0)
+        # Shadow Model Of The Focused Input Field (Exact DELETE_ROW, See InputFieldModel)
+        Self.Field = InputFieldModel()
+
+        # Named Keys : Arrow Keys and Special Keys (Characters Come From The Keyboard Layout)
         Self.Char_map = {
-            # Lowercase Letters
-            'a': (0x04, 0), 'b': (0x05, 0), 'c': (0x06, 0), 'd': (0x07, 0), 'e': (0x08, 0),
-            'f': (0x09, 0), 'g': (0x0a, 0), 'h': (0x0b, 0), 'i': (0x0c, 0), 'j': (0x0d, 0),
-            'k': (0x0e, 0), 'l': (0x0f, 0), 'm': (0x10, 0), 'n': (0x11, 0), 'o': (0x12, 0),
-            'p': (0x13, 0), 'q': (0x14, 0), 'r': (0x15, 0), 's': (0x16, 0), 't': (0x17, 0),
-            'u': (0x18, 0), 'v': (0x19, 0), 'w': (0x1a, 0), 'x': (0x1b, 0), 'y': (0x1c, 0),
-            'z': (0x1d, 0),
-
-            # Uppercase letters (with Left Shift modifier = 0x02)
-            'A': (0x04, 0x02), 'B': (0x05, 0x02), 'C': (0x06, 0x02), 'D': (0x07, 0x02), 'E': (0x08, 0x02),
-            'F': (0x09, 0x02), 'G': (0x0a, 0x02), 'H': (0x0b, 0x02), 'I': (0x0c, 0x02), 'J': (0x0d, 0x02),
-            'K': (0x0e, 0x02), 'L': (0x0f, 0x02), 'M': (0x10, 0x02), 'N': (0x11, 0x02), 'O': (0x12, 0x02),
-            'P': (0x13, 0x02), 'Q': (0x14, 0x02), 'R': (0x15, 0x02), 'S': (0x16, 0x02), 'T': (0x17, 0x02),
-            'U': (0x18, 0x02), 'V': (0x19, 0x02), 'W': (0x1a, 0x02), 'X': (0x1b, 0x02), 'Y': (0x1c, 0x02),
-            'Z': (0x1d, 0x02),
-
-            # Numbers
-            '1': (0x1e, 0), '2': (0x1f, 0), '3': (0x20, 0), '4': (0x21, 0), '5': (0x22, 0),
-            '6': (0x23, 0), '7': (0x24, 0), '8': (0x25, 0), '9': (0x26, 0), '0': (0x27, 0),
-
-            # Special Characters
-            ' ': (0x2c, 0),       # Space
-            '\n': (0x28, 0),      # Enter
-            '\t': (0x2b, 0),      # Tab
-            '-': (0x2d, 0),       # Minus
-            '=': (0x2e, 0),       # Equals
-            '[': (0x2f, 0),       # Left bracket
-            ']': (0x30, 0),       # Right bracket
-            '\\': (0x31, 0),      # Backslash
-            ';': (0x33, 0),       # Semicolon
-            "'": (0x34, 0),       # Apostrophe
-            '`': (0x35, 0),       # Grave accent
-            ',': (0x36, 0),       # Comma
-            '.': (0x37, 0),       # Period
-            '/': (0x38, 0),       # Forward slash
-
-            # Shifted Special Characters
-            '!': (0x1e, 0x02), '@': (0x1f, 0x02), '#': (0x20, 0x02), '$': (0x21, 0x02), '%': (0x22, 0x02),
-            '^': (0x23, 0x02), '&': (0x24, 0x02), '*': (0x25, 0x02), '(': (0x26, 0x02), ')': (0x27, 0x02),
-            '_': (0x2d, 0x02), '+': (0x2e, 0x02), '{': (0x2f, 0x02), '}': (0x30, 0x02), '|': (0x31, 0x02),
-            ':': (0x33, 0x02), '"': (0x34, 0x02), '~': (0x35, 0x02), '<': (0x36, 0x02), '>': (0x37, 0x02),
-            '?': (0x38, 0x02),
-
             # ============== ARROW KEYS ==============
             'UP': (0x52, 0),       # Up Arrow
             'DOWN': (0x51, 0),     # Down Arrow
@@ -234,21 +509,217 @@ class RaspberryKeyboard:
             'SCROLLLOCK': (0x47, 0),
         }
 
+        # Precompiled Report Table Of The Named Keys (Built Once From Char_map)
+        # Entry Layout : (Scan_Code, Modifier, Press_Report, Release_Report) - As The Layout Tables
+        # Key_Table    : Read-Only Mapping Of Named Keys ("UP", "F1", ...)
+        Self.Key_Table = Self.Build_Key_Table(Self.Char_map)
+        # Compile_String Results : (Text, Mode, Rollover_Keys, Layout) -> (Reports, Skipped_Chars)
+        Self.Compiled_Cache = {}
+
+    @staticmethod
+    def Build_Key_Table(Char_Map):
+        """Precompile Char_map Into An Immutable Press/Release Report Table"""
+        Keys = {}
+
+        for Key, (Scan_Code, Modifier) in Char_Map.items():
+            # Prebuilt 8-Byte Reports : Press Carries The Modifier, Release Is All 0
+            Keys[Key] = (
+                Scan_Code,
+                Modifier,
+                bytes([Modifier, 0, Scan_Code, 0, 0, 0, 0, 0]),
+                RaspberryKeyboard.RELEASE_REPORT
+            )
+
+        return MappingProxyType(Keys)
+
+    def Lookup_Char(Self, Char):
+        """Return The Precompiled Entry For A Single Character On The Active Layout (None If Unmapped)"""
+        return Self.Layout.Lookup(Char)
+
+    def Compile_String(Self, Text, Mode=None, Layout=None):
+        """
+        Compile A Whole String Into A Ready-To-Write Report Sequence In One Pass
+        Returns (Reports, Skipped_Chars) : Reports Is A Tuple Of 8-Byte Reports,
+        Skipped_Chars Holds Every Character Without A Mapping (Control Chars, Not On The Layout)
+        Mode : SINGLE / ROLLOVER (None = Keyboard Sequence_Mode)
+        Layout : KeyboardLayout (None = Keyboard Layout)
+        """
+        if Mode not in Self.SEQUENCE_MODES:
+            Mode = Self.Sequence_Mode
+        Layout = Layout or Self.Layout
+
+        # Repeated Passwords / Challenge Strings : No Work At All
+        Cache_Key = (Text, Mode, Self.Rollover_Keys, Layout)
+        Compiled = Self.Compiled_Cache.get(Cache_Key)
+        if Compiled is not None:
+            return Compiled
+
+        if Mode == Self.SEQUENCE_ROLLOVER:
+            Compiled = Self.Compile_Rollover(Text, Layout)
+        else:
+            Compiled = Self.Compile_Single(Text, Layout)
+
+        # Bounded Cache : Drop Everything Once Full (Challenge Strings Rotate Anyway)
+        if len(Self.Compiled_Cache) >= Self.COMPILED_CACHE_LIMIT:
+            Self.Compiled_Cache.clear()
+        Self.Compiled_Cache[Cache_Key] = Compiled
+        return Compiled
+
+    def Compile_Single(Self, Text, Layout=None):
+        """SINGLE Sequencer : Prebuilt Press Report + All-Zero Release For Every Character (Every Stroke Of Dead Keys)"""
+
+        # Local Bindings Keep The Loop Tight On The Pi Zero
+        Layout = Layout or Self.Layout
+        Table = Layout.Table
+        Table_Size = len(Table)
+        Extra = Layout.Extra.get
+        Reports = []
+        Append = Reports.append
+        Skipped = []
+
+        for Char in Text:
+            Code_Point = ord(Char)
+            Entry = Table[Code_Point] if Code_Point < Table_Size else None
+            if Entry is None:
+                # Miss Path : Dead Key Characters (Several Strokes) And Code Points Past The Table
+                Entry = Extra(Char)
+                if Entry is None:
+                    Skipped.append(Char)
+                else:
+                    Reports.extend(Entry[2:])
+                continue
+            Append(Entry[2])
+            Append(Entry[3])
+
+        return (tuple(Reports), ''.join(Skipped))
+
+    def Compile_Rollover(Self, Text, Layout=None):
+        """
+        ROLLOVER Sequencer : Plan Reports Using The Six Key Slots Of The Boot Report
+        - Each Report Introduces Exactly One New Key (Host Sees An Unambiguous Key-Down Order)
+        - The Oldest Held Key Leaves The Window In The Same Report The New Key Enters
+        - All-Zero Release Only Before A Repeated Key, A Modifier Change, And At The End
+        N Characters Cost About N + 1 Reports Instead Of 2N
+        Dead Key Characters Are Typed Stroke By Stroke, Nothing Held (The Host Composes In Order)
+        """
+        Layout = Layout or Self.Layout
+        Table = Layout.Table
+        Table_Size = len(Table)
+        Extra = Layout.Extra.get
+        Depth = Self.Rollover_Keys
+        Release = Self.RELEASE_REPORT
+        Reports = []
+        Append = Reports.append
+        Skipped = []
+
+        # Keys Currently Held Down (Oldest First) And Their Shared Modifier
+        Held = []
+        Held_Modifier = 0
+
+        for Char in Text:
+            Code_Point = ord(Char)
+            Entry = Table[Code_Point] if Code_Point < Table_Size else None
+            if Entry is None:
+                Entry = Extra(Char)
+                if Entry is None:
+                    Skipped.append(Char)
+                    continue
+            if len(Entry) > 4:
+                if Held:
+                    Append(Release)
+                    Held = []
+                Reports.extend(Entry[2:])
+                continue
+            Scan_Code, Modifier = Entry[0], Entry[1]
+
+            # Repeated Key Or Modifier Change : Host Needs A Clean Release First
+            if Held and (Modifier != Held_Modifier or Scan_Code in Held):
+                Append(Release)
+                Held = []
+
+            # Window Full : Oldest Key Is Released By Omission
+            if len(Held) >= Depth:
+                del Held[0]
+            Held.append(Scan_Code)
+            Held_Modifier = Modifier
+
+            # [Modifier, Reserved, Key1 .. Key6]
+            Append(bytes([Modifier, 0] + Held + [0] * (Self.ROLLOVER_MAX_KEYS - len(Held))))
+
+        # Release Everything Still Held
+        if Held:
+            Append(Release)
+
+        return (tuple(Reports), ''.join(Skipped))
+
+    def Clear_Compiled_Cache(Self):
+        """Forget Every Compiled String (Passwords Should Not Outlive The Session)"""
+        Self.Compiled_Cache.clear()
+
+    def Set_Pacing(Self, Spec):
+        """
+        Select The Pacing Profile (Name Or CUSTOM Object, See Resolve_Pacing)
+        Returns The Previous (Profile_Name, Delays) For Restore_Pacing, None If Spec Is Invalid
+        """
+        try:
+            Name, Delays = Resolve_Pacing(Spec)
+        except (ValueError, TypeError) as Error:
+            print(f"[RaspberryKeyboard_Func_Set_Pacing] Keeping {Self.Pacing_Profile} Pacing : {Error}")
+            return None
+        Previous = (Self.Pacing_Profile, Self.Pacing)
+        Self.Pacing_Profile, Self.Pacing = Name, Delays
+        return Previous
+
+    def Restore_Pacing(Self, Previous):
+        """Restore A Pacing Profile Returned By Set_Pacing"""
+        if Previous is not None:
+            Self.Pacing_Profile, Self.Pacing = Previous
+
+    def Set_Layout(Self, Spec):
+        """
+        Select The Keyboard Layout (Name Or {"Name": ...}, See HID_Layouts.Load_Layout) - Compiled On First Use
+        Returns The Previous KeyboardLayout For Restore_Layout, None If Spec Is Invalid
+        """
+        try:
+            Layout = Load_Layout(Spec)
+        except ValueError as Error:
+            print(f"[RaspberryKeyboard_Func_Set_Layout] Keeping {Self.Layout.Name} Layout : {Error}")
+            return None
+        Previous = Self.Layout
+        Self.Layout = Layout
+        return Previous
+
+    def Restore_Layout(Self, Previous):
+        """Restore A Keyboard Layout Returned By Set_Layout"""
+        if Previous is not None:
+            Self.Layout = Previous
+
     def Open_HID_Device(Self):
         """Open HID Device With Non-Blocking Mode"""
-        if Self.Test_Mode:
+        if Self.Test_Mode or Self.Sink is not None:
             return True
         try:
             if Self.HID_FD is None:
-                # The "Rules" for how to talk to it (Bit Writing : O_WRONLY-Write-Only OR(Human Readable is AND) O_NONBLOCK-Non-Block(Do not Freeze This Running Program) ).
-                # Old Logic : Self.HID_FD = os.open(Self.Device, os.O_WRONLY | os.O_NONBLOCK)
-                # New Logic Reason : BIOS Password need Accuracy, not Fast-Response as delivered in NONBLOCK mode.
-                Self.HID_FD = os.open(Self.Device, os.O_WRONLY)
+                Self.Open_Device_FD()
             return True
         except Exception as e:
             print(f"[RaspberryKeyboard_Func_Open_Hid_Device] Failed to open {Self.Device}: {e}")
             return False
 
+    def Open_Device_FD(Self):
+        """(Re)Open The HID Device File Descriptor For The Active Writer Mode"""
+        if Self.Writer_Mode == Self.WRITER_POLL:
+            # POLL Writer : Never Block In write(), poll() Tells When The Driver Is Ready
+            Self.HID_FD = os.open(Self.Device, os.O_WRONLY | os.O_NONBLOCK)
+            Self.Poller = select.poll()
+            Self.Poller.register(Self.HID_FD, select.POLLOUT)
+        else:
+            # The "Rules" for how to talk to it (Bit Writing : O_WRONLY-Write-Only OR(Human Readable is AND) O_NONBLOCK-Non-Block(Do not Freeze This Running Program) ).
+            # Old Logic : Self.HID_FD = os.open(Self.Device, os.O_WRONLY | os.O_NONBLOCK)
+            # New Logic Reason : BIOS Password need Accuracy, not Fast-Response as delivered in NONBLOCK mode.
+            Self.HID_FD = os.open(Self.Device, os.O_WRONLY)
+        return Self.HID_FD
+
 
     def Close_HID_Device(Self):
         """Close HID Device"""
@@ -260,25 +731,37 @@ class RaspberryKeyboard:
                 # Ignore Errors If The Device Already Closed Or Gone
                 pass
             Self.HID_FD = None
+            Self.Poller = None
 
     def Type_Raw_Report(Self, Report, Max_Retries=5):
         """Writes Raw 8-Byte(Keystrokes) Reports To The HID Device With Retry Logic"""
+        Counters = Self.Write_Counters
+        if Self.Sink is not None:
+            Counters["Reports"] += 1
+            return Self.Sink.Write(Report)
         if Self.Test_Mode:
+            Counters["Reports"] += 1
             print(f"[TEST_MODE] Send : {Report.hex()}")
             return True
 
+        # POLL Writer : Host-Poll-Synchronized Writes Instead Of Sleep-And-Retry
+        if Self.Writer_Mode == Self.WRITER_POLL:
+            return Self.Type_Raw_Report_Polled(Report, Max_Retries)
+
         for Attempt_Iteration in range(Max_Retries):
             try:
                 # Reopen Device If Needed
                 if Self.HID_FD is None:
-                    Self.HID_FD = os.open(Self.Device, os.O_WRONLY)
+                    Self.Open_Device_FD()
 
                 # Write to Pipe
                 os.write(Self.HID_FD, Report)
+                Counters["Reports"] += 1
                 return True
 
             except BlockingIOError:
                 # Buffer Full, Wait And Retry
+                Counters["EAGAIN"] += 1
                 time.sleep(0.05)
                 print(f"[RaspberryKeyboard_Func_Type_Raw_Report] Buffer Full Triggered]")
                 continue
@@ -287,52 +770,208 @@ class RaspberryKeyboard:
                 # EAGAIN (Error 11): Resource Temporarily Unavailable (Blocked).
                 # In Non-Blocking Mode, This Means The Buffer Full ; Wait & Try Again.
                 if Error.errno == 11:  
+                    Counters["EAGAIN"] += 1
                     time.sleep(0.05)
                     continue
                 # ESHUTDOWN (Error 108): Cannot Send After Transport Endpoint Shutdown.
                 # Usually The USB Cable Unplugged / Driver Crashed.
                 elif Error.errno == 108:
                     # Reopen The Device
+                    Counters["Reopens"] += 1
                     Self.Close_HID_Device()
                     time.sleep(0.1)
                     try:
-                        Self.HID_FD = os.open(Self.Device, os.O_WRONLY)
+                        Self.Open_Device_FD()
                     except:
                         pass
                     continue
                 else:
                     # Unknown Error Handler
                     print(f"[Type_Raw_Report] HID_ERROR - OSError : {Error.errno}: {Error}")
+                    Counters["Failures"] += 1
                     return False
             except Exception as Error:
                 print(f"[Type_Raw_Report] Attempt {Attempt_Iteration} - Error : {Error}")
+                Counters["Failures"] += 1
                 return False
 
         print(f"[Type_Raw_Report] HID Error - Failed After {Max_Retries} Retries")
+        Counters["Failures"] += 1
+        return False
+
+    def Wait_Writable(Self):
+        """Block Until The Gadget Driver Accepts A New Report (POLLOUT), False On Timeout/Error"""
+        for Descriptor, Events in Self.Poller.poll(Self.POLL_TIMEOUT_MS):
+            if Events & (select.POLLERR | select.POLLHUP | select.POLLNVAL):
+                raise OSError(108, "HID Device Endpoint Shutdown")
+            if Events & select.POLLOUT:
+                return True
+        return False
+
+    def Type_Raw_Report_Polled(Self, Report, Max_Retries=5):
+        """
+        POLL Writer : Release Each Report Exactly When The Previous One Was Consumed
+        1. poll() Until The Driver Has No Pending Report
+        2. Non-Blocking write()
+        3. poll() Again : POLLOUT Means The Host Has Polled This Report (Completion Timestamp)
+        """
+        Counters = Self.Write_Counters
+        for Attempt_Iteration in range(Max_Retries):
+            try:
+                # Reopen Device If Needed
+                if Self.HID_FD is None:
+                    Self.Open_Device_FD()
+
+                # Host Has Not Polled For POLL_TIMEOUT_MS : Try Again
+                if not Self.Wait_Writable():
+                    print(f"[Type_Raw_Report_Polled] Host Poll Timeout (Attempt {Attempt_Iteration})")
+                    Counters["Poll_Timeouts"] += 1
+                    continue
+
+                Write_Time = time.monotonic()
+                os.write(Self.HID_FD, Report)
+
+                # Completion : Driver Ready Again = Report Handed To The Host
+                Complete_Time = time.monotonic() if Self.Wait_Writable() else None
+                Self.Report_Log.append((Write_Time, Complete_Time))
+                Counters["Reports"] += 1
+                return True
+
+            except BlockingIOError:
+                # Raced With The Driver : poll() Again Instead Of Sleeping
+                Counters["EAGAIN"] += 1
+                continue
+
+            except OSError as Error:
+                # ESHUTDOWN (Error 108): USB Cable Unplugged / Driver Crashed - Reopen The Device
+                if Error.errno == 108:
+                    Counters["Reopens"] += 1
+                    Self.Close_HID_Device()
+                    time.sleep(0.1)
+                    try:
+                        Self.Open_Device_FD()
+                    except:
+                        pass
+                    continue
+                print(f"[Type_Raw_Report_Polled] HID_ERROR - OSError : {Error.errno}: {Error}")
+                Counters["Failures"] += 1
+                return False
+            except Exception as Error:
+                print(f"[Type_Raw_Report_Polled] Attempt {Attempt_Iteration} - Error : {Error}")
+                Counters["Failures"] += 1
+                return False
+
+        print(f"[Type_Raw_Report_Polled] HID Error - Failed After {Max_Retries} Retries")
+        Counters["Failures"] += 1
         return False
 
     def Send_Key_With_Modifier(Self, Scan_Code, Modifier=0x00):
         """Send A Key Press(Scan_Code) With Optional Modifier"""
 
         try:
+            # Raw Scan Code : Its Effect On The Focused Field Is Not Tracked
+            Self.Field.Forget()
             # Press
             Keystroke = bytes([Modifier, 0, Scan_Code, 0, 0, 0, 0, 0])
+            # Writer Thread Active : Queue Press + Release Like Any Other Sequence
+            if Self.Output is not None:
+                return Self.Type_Report_Sequence((Keystroke, Self.RELEASE_REPORT))
             if not Self.Type_Raw_Report(Keystroke):
                 return False
-             # Slightly longer delay for BIOS Compatibility
-            time.sleep(0.03) 
+            # Press Delay From The Active Pacing Profile (BIOS : Slightly Longer For Compatibility)
+            time.sleep(Self.Pacing["Key_Press"])
 
             # Release (All 0)
-            if not Self.Type_Raw_Report(bytes([0]*8)):
+            if not Self.Type_Raw_Report(Self.RELEASE_REPORT):
                 return False
-            time.sleep(0.03)
+            time.sleep(Self.Pacing["Key_Release"])
 
             return True
         
         except Exception as Error:
-            print(f"[Send_Key_With_Modifier] Send Modifier Modified Keystroke : {e}")
+            print(f"[Send_Key_With_Modifier] Send Modifier Modified Keystroke : {Error}")
             return False
 
+    def Type_Report_Sequence(Self, Reports):
+        """Output A Precompiled Report Sequence With The Active Pacing Profile (Queued If Output Is Set)"""
+        Press_Delay = Self.Pacing["Key_Press"]
+        Release_Delay = Self.Pacing["Key_Release"]
+        # Writer Thread : Hand Over The Reports With The Pacing Of This Moment
+        if Self.Output is not None:
+            Self.Output.Put_Reports(Reports, Press_Delay, Release_Delay)
+            return True
+        return Self.Write_Report_Sequence(Reports, Press_Delay, Release_Delay)
+
+    def Write_Report_Sequence(Self, Reports, Press_Delay, Release_Delay):
+        """Write A Report Sequence To The HID Device, Sleeping After Every Press / Release"""
+        if Self.Pacer is not None:
+            return Self.Write_Report_Sequence_Paced(Reports, Press_Delay, Release_Delay)
+        Success = True
+        Release = Self.RELEASE_REPORT
+        # Write Start And Nominal Gap Of Every Report (Report_Jitter, Only With Stats Attached)
+        Write_Times = [] if Self.Stats is not None else None
+        Gaps = []
+        for Report in Reports:
+            # Same Delays As Send_Key_With_Modifier After Every Press / Release
+            Gap = Release_Delay if Report is Release else Press_Delay
+            if Write_Times is not None:
+                Write_Times.append(time.monotonic())
+                Gaps.append(Gap)
+            if not Self.Type_Raw_Report(Report):
+                Success = False
+            time.sleep(Gap)
+        if Write_Times:
+            Self.Stats.Observe_Many("Report_Jitter", Report_Jitter(Write_Times, Gaps))
+        return Success
+
+    def Write_Report_Sequence_Paced(Self, Reports, Press_Delay, Release_Delay):
+        """
+        Real-Time Variant Of Write_Report_Sequence : Every Report Is Due At An Absolute Deadline
+        (Sequence Start Plus The Gaps Before It), GC Held Off Until The Last Report Was Written
+        """
+        Success = True
+        Release = Self.RELEASE_REPORT
+        Pacer = Self.Pacer
+        Catch_Up = Pacer.Catch_Up
+        Write_Times = [] if Self.Stats is not None else None
+        Gaps = []
+        GC_Enabled = Pacer.Begin_Burst()
+        try:
+            Deadline = time.monotonic()
+            for Report in Reports:
+                Gap = Release_Delay if Report is Release else Press_Delay
+                Now = time.monotonic()
+                # Small Lateness Comes Off The Next Gap, A Stall (EAGAIN Retries) Restarts The Schedule :
+                # Never A Catch-Up Burst Of Keys The Host Would Drop
+                if Now - Deadline > Catch_Up:
+                    Deadline = Now
+                if Write_Times is not None:
+                    Write_Times.append(Now)
+                    Gaps.append(Gap)
+                if not Self.Type_Raw_Report(Report):
+                    Success = False
+                Deadline += Gap
+                Pacer.Sleep_Until(Deadline)
+        finally:
+            Pacer.End_Burst(GC_Enabled)
+        if Write_Times:
+            Self.Stats.Observe_Many("Report_Jitter", Report_Jitter(Write_Times, Gaps))
+        return Success
+
+    def Sleep(Self, Seconds):
+        """Keystroke Gap On The Calling Thread (Real-Time Pacer : Deadline Sleep With Spin Tail)"""
+        if Self.Pacer is not None:
+            Self.Pacer.Sleep_Until(time.monotonic() + Seconds)
+        else:
+            time.sleep(Seconds)
+
+    def Pause(Self, Seconds):
+        """Keystroke Gap : Sleep Inline, Or Queue It Behind The Pending Reports"""
+        if Self.Output is not None:
+            Self.Output.Put_Pause(Seconds)
+        else:
+            Self.Sleep(Seconds)
+
     def Type_Key(Self, Key_Name):
         """ Press Key By Name """
 
@@ -342,30 +981,29 @@ class RaspberryKeyboard:
         
         # Key String Uppercase Handler & Handle "Words" vs "Single Characters"
         # This is used to Filter the Non-(Modified)-String : Because > 1 is not Single Key.
-        if len(Key_Name) > 1: 
-            Key_Search = Key_Name.upper() 
+        if len(Key_Name) > 1:
+            # Valid "Words" (Fallback : Name As Given)
+            Entry = Self.Key_Table.get(Key_Name.upper()) or Self.Key_Table.get(Key_Name)
         # This is the Proper Bind Search (All Above Codes are Used for Condition Filtering to Reach Here)
         else:
-            Key_Search = Key_Name
-
-        # Search in Char_map
-        # Valid "Words"
-        if Key_Search in Self.Char_map:
-            Scan_Code, Modifier = Self.Char_map[Key_Search]
-        # Fallback : "Single Characters with Modifier"
-        elif Key_Name in Self.Char_map:
-            Scan_Code, Modifier = Self.Char_map[Key_Name]
+            Entry = Self.Lookup_Char(Key_Name)
 
         # Fallback : Error Handler
-        else:
-            # Key_Name and Key_Search are not In The Dictionary
+        if Entry is None:
+            # Key_Name is not In The Precompiled Tables
             if Self.Debug:
                 # ord() Check Invisible Characters Like Spaces Or Newlines.
                 print(f"[HID_DEBUG] Unknown Key Found: '{Key_Name}' (ord={[ord(Character) for Character in Key_Name]})")
             return False
 
-        # Success: Send The Report Hardware Pipe (HID_FD)
-        return Self.Send_Key_With_Modifier(Scan_Code, Modifier)
+        # Success: Send The Prebuilt Press/Release Reports Through The Hardware Pipe (HID_FD)
+        Success = Self.Type_Report_Sequence(Entry[2:])
+        # Shadow Field : Track The Key, Or Give Up If It May Not Have Reached The Host
+        if Success:
+            Self.Field.Press(Key_Name)
+        else:
+            Self.Field.Forget()
+        return Success
 
     def Type_Char(Self, Char):
         """Type A Single Character"""
@@ -381,20 +1019,29 @@ class RaspberryKeyboard:
         
         return Self.Type_Key(Char)
 
-    def Type_String(Self, String):
-        """Type A String Of Characters"""
+    def Type_String(Self, String, Mode=None):
+        """Type A String Of Characters (Mode : SINGLE / ROLLOVER, None = Sequence_Mode)"""
 
         # If Passes None or Empty String 
         if String is None:
             return False
         
-        # Not Empty String
-        Success = True
-        for Char in String:
-            # Error Indicator
-            if not Self.Type_Char(Char):
-                Success = False
-                print("Type_String] : Invoked [Type_Char] : Failure")
+        # Not Empty String : Compile Once (Cached), Then Stream The Reports
+        Reports, Skipped = Self.Compile_String(String, Mode)
+        Success = Self.Type_Report_Sequence(Reports)
+
+        # Shadow Field : Only Mapped Characters Were Typed
+        if not Success:
+            Self.Field.Forget()
+        elif Skipped:
+            Self.Field.Type_Text(''.join(Char for Char in String if Self.Lookup_Char(Char)))
+        else:
+            Self.Field.Type_Text(String)
+
+        # Error Indicator : Characters Without A Mapping Were Not Typed
+        if Skipped:
+            Success = False
+            print(f"[Type_String] : Skipped {len(Skipped)} Unmapped Characters: {Skipped!r}")
         return Success
 
     def Press_Up(Self):
@@ -442,22 +1089,23 @@ class RaspberryKeyboard:
         print("[HID] Pressing ENTER")
         return Self.Type_Key('ENTER')
 
+    # Number Of DELETE Presses Used By Delete_Row For A Given Time Class (Shared With The Timing Model)
+    Row_Delete_Count = staticmethod(Row_Delete_Count)
+
     def Delete_Row(Self, Method="BIOS", Time=30):
         """
         Delete Entire Row - BIOS Compatible Methods
-        "BIOS": HOME : Delete Multiple Times (Safest For BIOS)
+        Known Field (Shadow Model) : Exactly The Keystrokes Needed (See Delete_Known_Row)
+        "BIOS": HOME : Delete Multiple Times (Safest For BIOS) - Fallback While The Field Is Unknown
+        A Blind Clear Proves Nothing (The Row May Be Longer Than The Count) : The Field Stays Unknown
         """
 
-        DELETE_TIME_30 = 30 
-        DELETE_TIME_50 = 50 
-        DELETE_TIME_80 = 80 
-        
-        if Time <= 30:
-            Delete_Count = DELETE_TIME_30
-        elif Time <= 50:
-            Delete_Count = DELETE_TIME_50
-        else:
-            Delete_Count = DELETE_TIME_80
+        # Exact Clear : Only What This Keyboard Typed Is There
+        Clear_Keys = Self.Field.Clear_Keys()
+        if Clear_Keys is not None:
+            return Self.Delete_Known_Row(*Clear_Keys)
+
+        Delete_Count = Self.Row_Delete_Count(Time)
         
         # Print Deletion
         print(f"[Delete_Row] Deleting ROW (Method={Method}, Count={Delete_Count})")
@@ -465,21 +1113,41 @@ class RaspberryKeyboard:
         # BIOS-Safe Method: Go To Start, Delete Forward Many Times
         # Go to beginning of line
         Self.Type_Key('HOME')
-        time.sleep(0.05)
+        Self.Pause(Self.Pacing["Row_Home"])
+
+        # Prebuilt DELETE Press/Release Reports
+        Delete_Reports = Self.Key_Table['DELETE'][2:]
 
         # Press DELETE Multiple Times (Enough To Clear A Typical Row)
         # Most BIOS are 50-80 Chars Max in Password Field
         for Iteration in range(Delete_Count):
             # DELETE Key
-            if not Self.Send_Key_With_Modifier(0x4c, 0):  
+            if not Self.Type_Report_Sequence(Delete_Reports):  
                 # Exit If Send Fails
+                Self.Field.Forget()
                 return False  
             # Small Delay Between Deletes
-            time.sleep(0.02)  
+            Self.Pause(Self.Pacing["Row_Delete"])
 
         # Moved outside the loop
+        Self.Field.Forget()
         return True  
 
+    def Delete_Known_Row(Self, Backspaces, Deletes):
+        """Clear A Field Of Known Contents : Backspaces Before The Cursor, DELETEs After It (No HOME Needed)"""
+        print(f"[Delete_Row] Clearing Known Field (Backspace x {Backspaces}, Delete x {Deletes})")
+
+        for Key_Name, Count in (('BACKSPACE', Backspaces), ('DELETE', Deletes)):
+            Reports = Self.Key_Table[Key_Name][2:]
+            for Iteration in range(Count):
+                if not Self.Type_Report_Sequence(Reports):
+                    Self.Field.Forget()
+                    return False
+                Self.Pause(Self.Pacing["Row_Delete"])
+
+        Self.Field.Reset()
+        return True
+
     def Delete_String(Self, Text):
         """Delete String By Calculate and Pressing Corresponding Backspace For Each Character"""
 
@@ -488,7 +1156,10 @@ class RaspberryKeyboard:
             return False
         
         # Characters Count
-        Char_Count = len(Text)
+        return Self.Delete_Chars(len(Text))
+
+    def Delete_Chars(Self, Char_Count):
+        """Delete Char_Count Characters By Pressing Backspace For Each One"""
         print(f"[HID] Deleting {Char_Count} Characters (Backspace x {Char_Count})")
         Success = True
 
@@ -497,7 +1168,7 @@ class RaspberryKeyboard:
             if not Self.Press_Backspace():
                 Success = False
             # Delay between Backspaces
-            time.sleep(0.03)  
+            Self.Pause(Self.Pacing["Backspace_Gap"])
         return Success
 
     def __del__(Self):
@@ -507,6 +1178,1209 @@ class RaspberryKeyboard:
         Self.Close_HID_Device()
 
 
+"""
++============================================================================================================+
+| Report Recording & Host-Side Decoding                                                                      |
+| Measure Keyboard Output Without Hardware - What Would The Host Have Seen, And How Fast                     |
++============================================================================================================+
+| RecordingHIDSink : Timestamped Reports In A Ring Buffer (Replaces /dev/hidg0 And The Test_Mode Print)      |
+| HIDReportDecoder : Replays Reports Like A Host - Typed Text, Named Keys, Stuck Keys, Throughput, Jitter    |
+| A FIFO Works Too : mkfifo /tmp/hidg ; --Device /tmp/hidg On The Server, --Decode /tmp/hidg On The Reader   |
++============================================================================================================+
+"""
+class RecordingHIDSink:
+
+    #Python Define
+    DEFAULT_CAPACITY = 65536
+
+    def __init__(Self, Capacity=DEFAULT_CAPACITY):
+        # Attrib Initialization
+        # (time.monotonic(), Report) - Oldest Entries Are Overwritten Once Full
+        Self.Reports = collections.deque(maxlen=Capacity)
+        # Reports Written Since Creation (Including Overwritten Ones)
+        Self.Total_Reports = 0
+
+    def __len__(Self):
+        return len(Self.Reports)
+
+    def Write(Self, Report):
+        """Record One Report - Same Contract As Type_Raw_Report (Never Fails)"""
+        Self.Reports.append((time.monotonic(), Report))
+        Self.Total_Reports += 1
+        return True
+
+    def Snapshot(Self):
+        return list(Self.Reports)
+
+    def Clear(Self):
+        Self.Reports.clear()
+
+class HIDReportDecoder:
+
+    #Python Define
+    # Host Typematic Delay : Keys Held Longer Start Auto-Repeating On Most Hosts
+    AUTO_REPEAT_DELAY = 0.5
+    SHIFT_MASK = RaspberryKeyboard.MOD_LSHIFT | RaspberryKeyboard.MOD_RSHIFT
+    # Right Alt Is AltGr On Layouts With A Third Layer (Other Layouts : Ordinary Modifier)
+    ALTGR_MASK = RaspberryKeyboard.MOD_RALT
+    # Key Slot Value Of An ErrorRollOver Report (Host Ignores The Whole Report)
+    ERROR_ROLLOVER = 0x01
+
+    def __init__(Self, Char_Map, Layout=None):
+        # (Scan_Code, Shifted, AltGr) -> Key : Single Characters Win Over Named Aliases ('\n' Over "ENTER")
+        Self.Key_Names = {}
+        # Dead Keys : (Scan_Code, Shifted, AltGr) -> Accent, Then (Accent, Letter) -> Composed Character
+        Self.Dead_Keys = {}
+        Self.Compose = {}
+        Layout = Layout or Load_Layout()
+
+        Single_Strokes = [(Char, Strokes[0]) for Char, Strokes in Layout.Strokes.items() if len(Strokes) == 1]
+        for Key, (Scan_Code, Modifier) in list(Char_Map.items()) + Single_Strokes:
+            Entry = Self.Level(Scan_Code, Modifier)
+            Current = Self.Key_Names.get(Entry)
+            if Current is None or (len(Key) == 1 and len(Current) > 1):
+                Self.Key_Names[Entry] = Key
+
+        # Dead Key Characters Are (Dead Stroke, Letter Stroke) - Accent + Space Types The Accent Itself
+        for (Scan_Code, Modifier), Accent in Layout.Dead_Keys.items():
+            Self.Dead_Keys[Self.Level(Scan_Code, Modifier)] = Accent
+        for Char, Strokes in Layout.Strokes.items():
+            if len(Strokes) == 2:
+                Accent = Self.Dead_Keys.get(Self.Level(*Strokes[0]))
+                Letter = Self.Key_Names.get(Self.Level(*Strokes[1]))
+                if Accent is not None and Letter is not None:
+                    Self.Compose[(Accent, Letter)] = Char
+
+    @classmethod
+    def Level(Cls, Scan_Code, Modifier):
+        return (Scan_Code, bool(Modifier & Cls.SHIFT_MASK), bool(Modifier & Cls.ALTGR_MASK))
+
+    def Decode(Self, Recording, Expected=None):
+        """
+        Replay [(Time, Report), ...] Like A Host And Summarize It (JSON-Friendly Dict)
+        Text Is The Field Content (BACKSPACE Applied), Keys Lists Named / Modified Key Presses
+        Expected : Text The Script Meant To Type - Adds Dropped / Extra Character Counts
+        """
+        Text = []
+        Keys = []
+        # Scan_Code -> Press Time Of Every Key Currently Held
+        Held = {}
+        Presses = 0
+        Char_Presses = 0
+        Long_Holds = 0
+        Rollover_Errors = 0
+        # Accent Of A Dead Key Waiting For The Next Character
+        Pending_Accent = None
+
+        for Time_Stamp, Report in Recording:
+            Modifier = Report[0]
+            Pressed = [Code for Code in Report[2:] if Code]
+            if Self.ERROR_ROLLOVER in Pressed:
+                Rollover_Errors += 1
+                continue
+
+            # Released Keys - Held Past The Typematic Delay Means The Host Repeated Them
+            for Code in [Code for Code in Held if Code not in Pressed]:
+                if Time_Stamp - Held.pop(Code) > Self.AUTO_REPEAT_DELAY:
+                    Long_Holds += 1
+
+            # Newly Pressed Keys In Slot Order (Already Held Keys Do Not Type Again)
+            for Code in Pressed:
+                if Code in Held:
+                    continue
+                Held[Code] = Time_Stamp
+                Presses += 1
+                Level = Self.Level(Code, Modifier)
+                Other_Modifiers = Modifier & ~(Self.SHIFT_MASK | Self.ALTGR_MASK)
+                Key = Self.Key_Names.get(Level)
+                if Level in Self.Dead_Keys and not Other_Modifiers:
+                    Pending_Accent = Self.Dead_Keys[Level]
+                    continue
+                if Key is None and Level[2]:
+                    # Right Alt Without An AltGr Character : Ordinary Modifier
+                    Key = Self.Key_Names.get((Code, Level[1], False))
+                    Other_Modifiers = Modifier & ~Self.SHIFT_MASK
+                if Key is None:
+                    Key = f"0x{Code:02x}"
+                if Other_Modifiers:
+                    Keys.append(f"MOD_{Other_Modifiers:02x}+{Key}")
+                elif Key == "BACKSPACE":
+                    if Text:
+                        Text.pop()
+                    Keys.append(Key)
+                elif len(Key) == 1:
+                    # After A Dead Key : Composed Letter, Or The Accent Followed By The Character
+                    if Pending_Accent is not None:
+                        Text.extend(Self.Compose.get((Pending_Accent, Key), Pending_Accent + Key))
+                        Pending_Accent = None
+                    else:
+                        Text.append(Key)
+                    Char_Presses += 1
+                else:
+                    Keys.append(Key)
+
+        Times = [Time_Stamp for Time_Stamp, Report in Recording]
+        Intervals = [Later - Earlier for Earlier, Later in zip(Times, Times[1:])]
+        Duration = Times[-1] - Times[0] if Times else 0.0
+
+        Summary = {
+            "Text": ''.join(Text),
+            "Keys": Keys,
+            "Reports": len(Recording),
+            "Key_Presses": Presses,
+            # Keys Still Down After The Last Report : The Host Keeps Repeating Them
+            "Stuck_Keys": [Self.Key_Names.get((Code, False, False), f"0x{Code:02x}") for Code in Held],
+            "Long_Holds": Long_Holds,
+            "Rollover_Errors": Rollover_Errors,
+            "Duration": round(Duration, 6),
+            "Chars_Per_Second": round(Char_Presses / Duration, 3) if Duration > 0 else 0.0,
+            "Interval_Mean": round(statistics.fmean(Intervals), 6) if Intervals else 0.0,
+            "Interval_Jitter": round(statistics.pstdev(Intervals), 6) if len(Intervals) > 1 else 0.0,
+            "Interval_Max": round(max(Intervals), 6) if Intervals else 0.0,
+        }
+
+        if Expected is not None:
+            Matcher = difflib.SequenceMatcher(None, Expected, Summary["Text"], autojunk=False)
+            Matched = sum(Block.size for Block in Matcher.get_matching_blocks())
+            Summary["Expected_Match"] = Summary["Text"] == Expected
+            Summary["Dropped_Chars"] = len(Expected) - Matched
+            Summary["Extra_Chars"] = len(Summary["Text"]) - Matched
+        return Summary
+
+def Decode_HID_Stream(Path, Char_Map, Expected=None, Layout=None):
+    """Read 8-Byte Reports From A FIFO / Capture File Until EOF Or Ctrl+C, Then Decode Them"""
+    Recording = []
+    with open(Path, 'rb') as Stream:
+        try:
+            while True:
+                Report = Stream.read(RaspberryKeyboard.REPORT_LENGTH)
+                if len(Report) < RaspberryKeyboard.REPORT_LENGTH:
+                    break
+                Recording.append((time.monotonic(), Report))
+        except KeyboardInterrupt:
+            pass
+    return HIDReportDecoder(Char_Map, Layout).Decode(Recording, Expected)
+
+"""
++============================================================================================================+
+| Script Compiler & Timeline Scheduler                                                                       |
+| Ahead-Of-Time Lowering Of A Whole Action Script Into Absolute (Offset, Event) Entries                      |
++============================================================================================================+
+| Timeline Entry : (Offset_Seconds, Kind, Payload, Action_Index)                                             |
+|   Kind "REPORT" : Payload Is An 8-Byte HID Report                                                          |
+|   Kind "GPIO"   : Payload Is (Device, Level) - gpiozero LED / Buzzer On (True) Or Off (False)              |
+|                   On-Intervals Of One Device Are Merged (A Feedback Pulse Never Cuts An LED Short)         |
+|   Kind "END"    : Payload Is None - Script End (Trailing WAITs), The Scheduler Returns After It            |
+| Offsets Are Relative To The Script Start; The Scheduler Sleeps To Absolute Monotonic Deadlines,            |
+| So Write Latency Never Accumulates Across WAITs (Total Duration Stays The Nominal Duration)                 |
+| With --Realtime, Lateness Past The Pacer's Catch_Up (A Stall) Shifts The Rest Of The Schedule Instead :    |
+| The Reports Due During The Stall Are Not Sent As A Catch-Up Burst (Same As Write_Report_Sequence_Paced)    |
++============================================================================================================+
+"""
+class ScriptCompileError(ValueError):
+    """Script Rejected Before Any Key Was Pressed"""
+
+class TimelineScheduler:
+
+    def __init__(Self, Keyboard):
+        # Attrib Initialization
+        Self.Keyboard = Keyboard
+        # Lateness Of The Last Run : Largest (Actual - Deadline) Over All Entries, Seconds
+        Self.Max_Lateness = 0.0
+        # ServerStats Receiving The Lateness Of Every Run (None : Not Recorded)
+        Self.Stats = None
+
+    def Sleep_Until(Self, Deadline):
+        """Sleep To An Absolute time.monotonic() Deadline (No-Op If Already Past, Spin Tail With The Real-Time Pacer)"""
+        Pacer = Self.Keyboard.Pacer
+        if Pacer is not None:
+            Pacer.Sleep_Until(Deadline)
+            return
+        Remaining = Deadline - time.monotonic()
+        if Remaining > 0:
+            time.sleep(Remaining)
+
+    def Execute(Self, Timeline, Trace=None):
+        """Run A Compiled Timeline - False If Any Report Write Failed (Trace : ExecutionTrace Touched Per Event)"""
+        Pacer = Self.Keyboard.Pacer
+        # Real-Time Pacer : A Timeline Is One Burst, GC Held Off Until Its Last Event
+        GC_Enabled = Pacer.Begin_Burst() if Pacer is not None else False
+        try:
+            return Self.Run_Timeline(Timeline, Trace)
+        finally:
+            if Pacer is not None:
+                Pacer.End_Burst(GC_Enabled)
+
+    def Run_Timeline(Self, Timeline, Trace):
+        Success = True
+        Max_Lateness = 0.0
+        # Write Start And Scripted Offset Of Every Report (Report_Jitter, Only With Stats Attached)
+        Write_Times = [] if Self.Stats is not None else None
+        Offsets = []
+        # Real-Time Pacer : A Stall Longer Than Catch_Up Restarts The Schedule From Where It Ended
+        Pacer = Self.Keyboard.Pacer
+        Catch_Up = Pacer.Catch_Up if Pacer is not None else None
+        Began = Start = time.monotonic()
+
+        for Offset, Kind, Payload, Action_Index in Timeline:
+            Deadline = Start + Offset
+            Self.Sleep_Until(Deadline)
+            Now = time.monotonic()
+            Lateness = Now - Deadline
+            Max_Lateness = max(Max_Lateness, Lateness)
+            if Catch_Up is not None and Lateness > Catch_Up:
+                Start += Lateness
+
+            if Kind == "REPORT":
+                if Write_Times is not None:
+                    Write_Times.append(Now)
+                    Offsets.append(Offset)
+                if not Self.Keyboard.Type_Raw_Report(Payload):
+                    Success = False
+            elif Kind == "END":
+                # Nothing Ran : Not Part Of Any Action's Trace
+                continue
+            else:
+                Device, Level = Payload
+                try:
+                    if Level:
+                        Device.on()
+                    else:
+                        Device.off()
+                except Exception as Error:
+                    print(f"[TimelineScheduler] GPIO Error At Action {Action_Index}: {Error}")
+            if Trace is not None:
+                Trace.Touch(Action_Index)
+
+        Self.Max_Lateness = Max_Lateness
+        # Some Keystrokes May Not Have Reached The Host : The Shadow Field Is No Longer Trustworthy
+        if not Success:
+            Self.Keyboard.Field.Forget()
+        if Self.Stats is not None:
+            Self.Stats.Observe("Timeline_Lateness", Max_Lateness)
+            # Nominal Gap Of A Report Pair : Distance Of Their Scripted Offsets
+            Self.Stats.Observe_Many("Report_Jitter", Report_Jitter(
+                Write_Times, [Offsets[Index + 1] - Offsets[Index] for Index in range(len(Offsets) - 1)]))
+        print(f"[TimelineScheduler] Timeline Done: {len(Timeline)} Events, "
+              f"Nominal {Timeline[-1][0] if Timeline else 0.0:.3f}s, Actual {time.monotonic() - Began:.3f}s, "
+              f"Max Lateness {Max_Lateness * 1000:.1f}ms")
+        return Success
+
+"""
++============================================================================================================+
+| Real-Time HID Output (--Realtime)                                                                          |
+| Even Keystroke Spacing For Hosts That Drop Keys When Reports Arrive Unevenly (BIOS / UEFI Prompts)         |
++============================================================================================================+
+| Writer Thread : SCHED_FIFO Priority And A Pinned CPU When Permitted (root / CAP_SYS_NICE), Else Logged     |
+| Sleeps        : Absolute Monotonic Deadlines - time.sleep Until Spin_Tail Before, Then Spin On The Clock   |
+| GC            : Startup Objects Frozen (gc.freeze), Collection Held Off While A Report Burst Is Written    |
+| GIL           : Shorter Switch Interval - A Busy Main Thread Hands The GIL Back Within The Spin Tail       |
+| Jitter        : |Actual - Nominal| Spacing Of Consecutive Reports, ServerStats Metric Report_Jitter        |
++============================================================================================================+
+"""
+def Report_Jitter(Write_Times, Gaps):
+    """Spacing Error Of Every Consecutive Report Pair (Gaps[i] : Nominal Gap Between Report i And i + 1)"""
+    return [abs(Write_Times[Index] - Write_Times[Index - 1] - Gaps[Index - 1]) for Index in range(1, len(Write_Times))]
+
+class RealtimePacer:
+
+    #Python Define
+    # Last Part Of Every Sleep Is Busy-Waited (Seconds) - time.sleep Alone Overshoots By Up To ~1 ms On A Pi
+    DEFAULT_SPIN_TAIL = 0.001
+    # Lateness Taken Off The Next Gap (Seconds) - A Later Write Restarts The Schedule Instead
+    DEFAULT_CATCH_UP = 0.002
+    # SCHED_FIFO Priority (1-99) : Below The Kernel's IRQ Threads (50), USB Interrupts Still Come First
+    DEFAULT_PRIORITY = 10
+    # GIL Switch Interval While Real-Time (Seconds, CPython Default 0.005)
+    SWITCH_INTERVAL = 0.0005
+
+    def __init__(Self, Priority=DEFAULT_PRIORITY, CPU=None, Spin_Tail=DEFAULT_SPIN_TAIL, Catch_Up=DEFAULT_CATCH_UP):
+        # Attrib Initialization
+        # SCHED_FIFO Priority Of The Writer Thread (None : Normal Scheduling) And Its CPU (None : Any)
+        Self.Priority = Priority
+        Self.CPU = CPU
+        Self.Spin_Tail = max(0.0, Spin_Tail)
+        Self.Catch_Up = max(0.0, Catch_Up)
+        # What Enter_Thread Could Apply (Reported With STATS)
+        Self.Status = {"Scheduler": "OTHER", "CPU": None, "Spin_Tail": Self.Spin_Tail, "Frozen_Objects": 0,
+                       "Switch_Interval": sys.getswitchinterval()}
+
+    def Enter_Thread(Self):
+        """Make The Calling Thread (The Writer Thread) Real-Time - Missing Privileges Are Logged, Never Fatal"""
+        if Self.Priority:
+            try:
+                # Linux : PID 0 Is The Calling Thread, Not The Whole Process
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(Self.Priority))
+                Self.Status["Scheduler"] = f"FIFO:{Self.Priority}"
+            except (OSError, AttributeError) as Error:
+                print(f"[RealtimePacer] SCHED_FIFO {Self.Priority} Not Applied (Needs root / CAP_SYS_NICE): {Error}")
+        if Self.CPU is not None:
+            try:
+                os.sched_setaffinity(0, {Self.CPU})
+                Self.Status["CPU"] = Self.CPU
+            except (OSError, AttributeError) as Error:
+                print(f"[RealtimePacer] Pinning To CPU {Self.CPU} Failed: {Error}")
+        # Modules, Layout Tables And Compiled Strings Live Until Shutdown : Later Collections Skip Them
+        gc.collect()
+        gc.freeze()
+        Self.Status["Frozen_Objects"] = gc.get_freeze_count()
+        sys.setswitchinterval(Self.SWITCH_INTERVAL)
+        Self.Status["Switch_Interval"] = Self.SWITCH_INTERVAL
+        print(f"[RealtimePacer] Writer Thread : {json.dumps(Self.Status)}")
+
+    def Sleep_Until(Self, Deadline):
+        """Sleep To An Absolute time.monotonic() Deadline : time.sleep Up To Spin_Tail Before It, Then Spin"""
+        Remaining = Deadline - time.monotonic() - Self.Spin_Tail
+        if Remaining > 0:
+            time.sleep(Remaining)
+        while time.monotonic() < Deadline:
+            pass
+
+    def Begin_Burst(Self):
+        """Hold Off GC Collections Until End_Burst - Returns Whether GC Was Enabled (Pass It To End_Burst)"""
+        Enabled = gc.isenabled()
+        gc.disable()
+        return Enabled
+
+    def End_Burst(Self, Enabled):
+        if Enabled:
+            gc.enable()
+
+"""
++============================================================================================================+
+| HIDOutputQueue Class                                                                                       |
+| Dedicated HID Writer Thread Fed By A Bounded Queue - Network Receive Overlaps Keyboard Output              |
++============================================================================================================+
+"""
+class HIDOutputQueue:
+
+    #Python Define
+    # Queue Bound : Producer Blocks (Backpressure) Once This Many Items Are Pending
+    DEFAULT_QUEUE_LIMIT = 1024
+
+    def __init__(Self, Keyboard, Queue_Limit=DEFAULT_QUEUE_LIMIT):
+        # Attrib Initialization
+        Self.Keyboard = Keyboard
+        # Items : ("REPORTS", Reports, Press_Delay, Release_Delay) / ("PAUSE", Seconds) / ("CALL", Function, Args)
+        Self.Queue = queue.Queue(maxsize=Queue_Limit)
+        Self.Thread = None
+        # Backpressure_Handler(True) When A Put Blocks On A Full Queue, (False) Once It Got Through
+        Self.Backpressure_Handler = None
+        # Report Write Failure Since The Last Reset_Job_Status (Read Only From The Writer Thread)
+        Self.Job_Failed = False
+        # Set By Discard_Pending : Queued Keystrokes / Pauses Are Skipped Until The End Marker
+        Self.Discarding = False
+
+    def Start(Self):
+        """Start The Writer Thread (Daemon : Never Holds Up Shutdown)"""
+        if Self.Thread is None:
+            Self.Thread = threading.Thread(target=Self.Writer_Loop, name="HID_Writer", daemon=True)
+            Self.Thread.start()
+
+    def Stop(Self):
+        """Finish Pending Items, Then Stop The Writer Thread"""
+        if Self.Thread is not None:
+            Self.Queue.put(None)
+            Self.Thread.join()
+            Self.Thread = None
+
+    def Put(Self, Item):
+        """Queue An Item - Signals Backpressure And Blocks While The Queue Is Full"""
+        try:
+            Self.Queue.put_nowait(Item)
+        except queue.Full:
+            Handler = Self.Backpressure_Handler
+            if Handler:
+                Handler(True)
+            Self.Queue.put(Item)
+            if Handler:
+                Handler(False)
+
+    def Put_Reports(Self, Reports, Press_Delay, Release_Delay):
+        Self.Put(("REPORTS", Reports, Press_Delay, Release_Delay))
+
+    def Put_Pause(Self, Seconds):
+        Self.Put(("PAUSE", Seconds))
+
+    def Put_Call(Self, Function, *Args):
+        Self.Put(("CALL", Function, Args))
+
+    def Reset_Job_Status(Self):
+        """Queued At The Start Of A Job : Clears Job_Failed In Order With The Reports"""
+        Self.Job_Failed = False
+
+    def Drain(Self):
+        """Block Until Every Queued Item Was Executed"""
+        Self.Queue.join()
+
+    def Discard_Pending(Self):
+        """
+        Skip Every Keystroke And Pause Queued So Far (Preempted Session)
+        CALL Items Still Run : Responses And Bookkeeping Stay In Order
+        """
+        # Dropped Keystrokes Were Already Counted By The Shadow Field
+        Self.Keyboard.Field.Forget()
+        Self.Discarding = True
+        Self.Put_Call(Self.End_Discard)
+
+    def End_Discard(Self):
+        Self.Discarding = False
+
+    def Writer_Loop(Self):
+        """Writer Thread : Execute Queued Items In Order"""
+        # Real-Time Output : Priority / Affinity Apply To This Thread Only
+        if Self.Keyboard.Pacer is not None:
+            Self.Keyboard.Pacer.Enter_Thread()
+        while True:
+            Item = Self.Queue.get()
+            try:
+                # Stop Sentinel
+                if Item is None:
+                    return
+                Kind = Item[0]
+                if Kind == "CALL":
+                    Item[1](*Item[2])
+                elif Self.Discarding:
+                    # Preempted Output : Dropped Unwritten
+                    Self.Job_Failed = True
+                elif Kind == "REPORTS":
+                    if not Self.Keyboard.Write_Report_Sequence(Item[1], Item[2], Item[3]):
+                        Self.Job_Failed = True
+                        Self.Keyboard.Field.Forget()
+                elif Kind == "PAUSE":
+                    Self.Keyboard.Sleep(Item[1])
+            except Exception as Error:
+                # Never Let One Bad Item Kill The Writer Thread
+                Self.Job_Failed = True
+                print(f"[HIDOutputQueue] [Writer_Loop] Item Failed: {Error}")
+            finally:
+                Self.Queue.task_done()
+
+"""
++============================================================================================================+
+| Action Code Interpreter                                                                                    |
+| Compact Script Format Emitted By AuditableHID_Backend.generate_random_script                                |
++============================================================================================================+
+| H"text" : Type Text            -> {"Command": "TYPE", "Parameters": {"Text": "text"}}                      |
+| W2.3    : Wait 2.3 Seconds     -> {"Command": "WAIT", "Parameters": {"Seconds": 2.3}}                      |
+| D6      : 6 Backspaces         -> {"Command": "DELETE_TEXT", "Parameters": {"Count": 6}}                   |
+| K"UP"   : Press A Named Key    -> {"Command": "HID", "Parameters": {"Key": "UP"}}                          |
+| Tokens Are Separated By ';' - Inside Quotes, \" And \\ Escape A Quote / Backslash                          |
++============================================================================================================+
+"""
+ACTION_CODE_OPCODES = "HWDK"
+
+def Looks_Like_Action_Code(Payload):
+    """
+    Cheap Pre-Check Before Parsing : Starts With An Opcode And Holds At Least Two Tokens
+    (A Single Token Like "D6" Is Far More Likely A Plain Text Password Than A Script)
+    """
+    Payload = Payload.strip()
+    return len(Payload) > 1 and Payload[0] in ACTION_CODE_OPCODES and ';' in Payload
+
+def Parse_Action_Code(Code):
+    """Single-Pass Tokenizer : action_code String -> Action List (ValueError On Any Malformed Token)"""
+    Code = Code.strip()
+    Length = len(Code)
+    Actions = []
+    Index = 0
+
+    while Index < Length:
+        Opcode = Code[Index]
+        Index += 1
+
+        # Quoted Operand : H"text" / K"KEY"
+        if Opcode == 'H' or Opcode == 'K':
+            if Index >= Length or Code[Index] != '"':
+                raise ValueError(f"Expected '\"' After {Opcode} At {Index}")
+            Index += 1
+            Chars = []
+            while True:
+                if Index >= Length:
+                    raise ValueError(f"Unterminated {Opcode} String")
+                Char = Code[Index]
+                Index += 1
+                if Char == '\\' and Index < Length:
+                    Chars.append(Code[Index])
+                    Index += 1
+                elif Char == '"':
+                    break
+                else:
+                    Chars.append(Char)
+            Operand = ''.join(Chars)
+            if Opcode == 'H':
+                Actions.append({"Command": "TYPE", "Parameters": {"Text": Operand}})
+            else:
+                if not Operand:
+                    raise ValueError("Empty K Key Name")
+                Actions.append({"Command": "HID", "Parameters": {"Key": Operand}})
+
+        # Numeric Operand : W2.3 / D6 (Runs Up To The Next ';')
+        elif Opcode == 'W' or Opcode == 'D':
+            Start = Index
+            while Index < Length and Code[Index] != ';':
+                Index += 1
+            Number = Code[Start:Index].strip()
+            if Opcode == 'W':
+                Seconds = float(Number)
+                if not 0.0 <= Seconds < float('inf'):
+                    raise ValueError(f"Invalid W Seconds: {Number}")
+                Actions.append({"Command": "WAIT", "Parameters": {"Seconds": Seconds}})
+            else:
+                if not Number.isdigit():
+                    raise ValueError(f"Invalid D Count: {Number}")
+                Actions.append({"Command": "DELETE_TEXT", "Parameters": {"Count": int(Number)}})
+
+        else:
+            raise ValueError(f"Unknown Opcode {Opcode!r} At {Index - 1}")
+
+        # Token Separator (Trailing ';' Allowed)
+        if Index < Length:
+            if Code[Index] != ';':
+                raise ValueError(f"Expected ';' At {Index}")
+            Index += 1
+
+    return Actions
+
+"""
++============================================================================================================+
+| Streaming Action Parser                                                                                    |
+| Incremental JSON Action List Parser - Yields Each Action As Soon As Its Closing Brace Arrives              |
++============================================================================================================+
+| States : OPEN (Expect '[') -> FIRST / VALUE (Expect '{') -> IN_VALUE -> SEPARATOR (Expect ',' Or ']')    |
+|          -> DONE                                                                                           |
+| Only The Action Currently Being Received Is Buffered; Finished Actions Are Dropped From The Buffer         |
+| Anything But An Action After The '[' Raises NotAScriptError : Plain Text That Starts With '[' (Head)       |
+| Discard() : Aborted Script - SKIP Drops Everything Up To Its Closing ']' (Never Typed As Plain Text)       |
++============================================================================================================+
+"""
+class NotAScriptError(ValueError):
+    """Streamed Payload Was Not An Action List After All - Nothing Executed, Text Received So Far In Head"""
+
+    def __init__(Self, Message, Head):
+        super().__init__(Message)
+        Self.Head = Head
+
+class StreamingActionParser:
+
+    #Python Define
+    # Largest Single Action Held While Incomplete
+    MAX_ACTION_SIZE = 1 << 20
+
+    def __init__(Self):
+        # Attrib Initialization
+        # Incremental UTF-8 Decoder : Multi-Byte Characters May Be Split Across Reads
+        Self.Decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        Self.Buffer = ''
+        Self.Position = 0
+        Self.State = "OPEN"
+        # Text Received Before The First Action Started (Handed Back With NotAScriptError)
+        Self.Head = ''
+        # IN_VALUE Scanner State
+        Self.Depth = 0
+        Self.In_String = False
+        Self.Escape = False
+        Self.Element_Start = 0
+
+    @property
+    def Finished(Self):
+        return Self.State == "DONE"
+
+    @property
+    def Discarding(Self):
+        return Self.State == "SKIP"
+
+    def Discard(Self):
+        """Abort The Script : The Rest Of It Is Skipped Unexecuted Up To Its Closing ']' (Leftover Kept)"""
+        if Self.State == "DONE":
+            return
+        if Self.State != "IN_VALUE":
+            # Between Actions (Or Past A Malformed Element) : At List Level
+            Self.Depth = 0
+            Self.In_String = Self.Escape = False
+        Self.State = "SKIP"
+        Self.Buffer = Self.Buffer[Self.Position:]
+        Self.Position = 0
+
+    def Leftover(Self):
+        """Text Received After The Closing ']' (Start Of The Next Message)"""
+        return Self.Buffer[Self.Position:] + Self.Decoder.decode(b'', final=True)
+
+    def Feed(Self, Data):
+        """Append Received Bytes, Return Every Action Completed By Them (ValueError On Malformed Scripts)"""
+        Text = Self.Decoder.decode(Data)
+        if Self.State == "OPEN" or Self.State == "FIRST":
+            Self.Head += Text
+        Buffer = Self.Buffer + Text
+        Length = len(Buffer)
+        Index = Self.Position
+        Actions = []
+
+        try:
+            while Index < Length and Self.State != "DONE":
+                Char = Buffer[Index]
+                State = Self.State
+
+                if State == "SKIP":
+                    # Aborted Script : Same Bracket Scan, Ends On The List's Own ']'
+                    if Self.In_String:
+                        if Self.Escape:
+                            Self.Escape = False
+                        elif Char == '\\':
+                            Self.Escape = True
+                        elif Char == '"':
+                            Self.In_String = False
+                    elif Char == '"':
+                        Self.In_String = True
+                    elif Char == '{' or Char == '[':
+                        Self.Depth += 1
+                    elif Char == '}' or Char == ']':
+                        if Self.Depth == 0:
+                            Self.State = "DONE"
+                        else:
+                            Self.Depth -= 1
+
+                elif State == "IN_VALUE":
+                    # Bracket Depth Outside Of Strings Finds The End Of The Action Object
+                    if Self.In_String:
+                        if Self.Escape:
+                            Self.Escape = False
+                        elif Char == '\\':
+                            Self.Escape = True
+                        elif Char == '"':
+                            Self.In_String = False
+                    elif Char == '"':
+                        Self.In_String = True
+                    elif Char == '{' or Char == '[':
+                        Self.Depth += 1
+                    elif Char == '}' or Char == ']':
+                        Self.Depth -= 1
+                        if Self.Depth == 0:
+                            Actions.append(json.loads(Buffer[Self.Element_Start:Index + 1]))
+                            Self.State = "SEPARATOR"
+
+                elif Char in ' \t\r\n\ufeff':
+                    pass
+
+                elif State == "OPEN":
+                    if Char != '[':
+                        raise NotAScriptError("Script Must Start With '['", Self.Head)
+                    Self.State = "FIRST"
+
+                elif State == "FIRST" or State == "VALUE":
+                    if Char == '{':
+                        Self.State = "IN_VALUE"
+                        Self.Depth = 1
+                        Self.Element_Start = Index
+                    elif Char == ']' and State == "FIRST":
+                        Self.State = "DONE"
+                    elif State == "FIRST":
+                        raise NotAScriptError(f"Expected An Action Object At {Char!r}", Self.Head)
+                    else:
+                        raise ValueError(f"Expected An Action Object At {Char!r}")
+
+                else:
+                    if Char == ',':
+                        Self.State = "VALUE"
+                    elif Char == ']':
+                        Self.State = "DONE"
+                    else:
+                        raise ValueError(f"Expected ',' Or ']' At {Char!r}")
+
+                Index += 1
+        except ValueError:
+            # Malformed Script : A Later Discard() Resumes Right After The Offending Character, At List Level
+            Self.State = "ERROR"
+            Self.Buffer = Buffer[Index + 1:]
+            Self.Position = 0
+            raise
+
+        # Keep Only The Action In Progress (Or The Leftover After ']')
+        if Self.State == "IN_VALUE":
+            Keep_From = Self.Element_Start
+            Self.Element_Start = 0
+        else:
+            Keep_From = Index
+        Self.Buffer = Buffer[Keep_From:]
+        Self.Position = Index - Keep_From
+        if len(Self.Buffer) > Self.MAX_ACTION_SIZE:
+            raise ValueError(f"Action Exceeds {Self.MAX_ACTION_SIZE} Characters")
+
+        return Actions
+
+"""
++============================================================================================================+
+| Protocol Framing                                                                                           |
+| Incremental Message Reassembly For The Client Socket                                                       |
++============================================================================================================+
+| RAW    : Every recv() Chunk Is One Message (Legacy, Messages Must Fit One RFCOMM Read)                     |
+| LENGTH : 4-Byte Big-Endian Unsigned Length, Then The Message Bytes                                         |
+| LINE   : Messages Terminated By "\n" (Plain Text Messages Cannot Contain A Newline)                       |
+| Negotiation : Client Answers READY_FOR_AUDIT With "FRAMING:LENGTH" Or "FRAMING:LINE"                       |
+|               Server Replies "FRAMING_OK:<MODE>" - Both Directions Are Framed From Then On                 |
++============================================================================================================+
+"""
+class FrameDecoder:
+
+    #Python Define
+    FRAMING_RAW = "RAW"
+    FRAMING_LENGTH = "LENGTH"
+    FRAMING_LINE = "LINE"
+    FRAMING_MODES = (FRAMING_RAW, FRAMING_LENGTH, FRAMING_LINE)
+    NEGOTIATION_PREFIX = b"FRAMING:"
+    LENGTH_PREFIX_SIZE = 4
+    # Largest Accepted Message (Protects The Pi Zero From A Runaway Length Prefix)
+    MAX_FRAME_SIZE = 1 << 20
+    # recv() Size : RAW Keeps The Legacy 1024 Bytes, Framed Sessions Read Bigger Chunks
+    RAW_RECV_SIZE = 1024
+    FRAMED_RECV_SIZE = 16384
+
+    def __init__(Self, Mode="RAW"):
+        # Attrib Initialization
+        Self.Mode = Mode if Mode in Self.FRAMING_MODES else Self.FRAMING_RAW
+        Self.Buffer = bytearray()
+        # LINE Mode : Buffer Prefix Already Searched For "\n" (No Rescans On Partial Reads)
+        Self.Scan_Offset = 0
+        Self.Recv_Size = Self.RAW_RECV_SIZE if Self.Mode == Self.FRAMING_RAW else Self.FRAMED_RECV_SIZE
+
+    def Feed(Self, Data):
+        """Append Received Bytes, Return Every Message Completed By Them (ValueError On Oversized Frames)"""
+        if Self.Mode == Self.FRAMING_RAW:
+            return [bytes(Data)]
+
+        Self.Buffer += Data
+        Frames = []
+
+        if Self.Mode == Self.FRAMING_LENGTH:
+            # Multiple Messages Per Read, Messages Across Reads
+            while len(Self.Buffer) >= Self.LENGTH_PREFIX_SIZE:
+                Length = int.from_bytes(Self.Buffer[:Self.LENGTH_PREFIX_SIZE], 'big')
+                if Length > Self.MAX_FRAME_SIZE:
+                    raise ValueError(f"Frame Of {Length} Bytes Exceeds {Self.MAX_FRAME_SIZE}")
+                End = Self.LENGTH_PREFIX_SIZE + Length
+                if len(Self.Buffer) < End:
+                    break
+                Frames.append(bytes(Self.Buffer[Self.LENGTH_PREFIX_SIZE:End]))
+                del Self.Buffer[:End]
+
+        else:
+            while True:
+                Index = Self.Buffer.find(b'\n', Self.Scan_Offset)
+                if Index < 0:
+                    Self.Scan_Offset = len(Self.Buffer)
+                    if Self.Scan_Offset > Self.MAX_FRAME_SIZE:
+                        raise ValueError(f"Line Exceeds {Self.MAX_FRAME_SIZE} Bytes")
+                    break
+                # Tolerate "\r\n" Line Endings
+                Frames.append(bytes(Self.Buffer[:Index]).rstrip(b'\r'))
+                del Self.Buffer[:Index + 1]
+                Self.Scan_Offset = 0
+
+        return Frames
+
+    def Encode(Self, Payload):
+        """Frame An Outgoing Message In The Session Mode"""
+        if Self.Mode == Self.FRAMING_LENGTH:
+            return len(Payload).to_bytes(Self.LENGTH_PREFIX_SIZE, 'big') + Payload
+        if Self.Mode == Self.FRAMING_LINE:
+            return Payload + b'\n'
+        return Payload
+
+class ClientSession:
+    """Per-Connection State Of One Client"""
+    def __init__(Self, Sock, Info):
+        Self.Sock = Sock
+        Self.Info = Info
+        # Every Session Starts Unframed (RAW) Until The Client Negotiates Framing
+        Self.Decoder = FrameDecoder()
+        # Script Currently Being Streamed (StreamingActionParser), None Between Scripts
+        Self.Stream = None
+        # ExecutionTrace Of The Streamed Script (None : Tracing Disabled / No Script)
+        Self.Trace = None
+        # Async Server Bookkeeping (See AsyncBluetoothHIDServer)
+        Self.Serial = 0
+        Self.Alive = True
+        Self.Pacing = None
+        Self.Layout = None
+        Self.Pending_Jobs = 0
+        Self.Preempted = False
+        Self.Preempting = False
+        Self.Job_Released = None
+        Self.Task = None
+
+"""
++============================================================================================================+
+| Transport Layer                                                                                            |
+| Listening Socket Per Medium - The Session Protocol Only Uses send / recv / close / fileno                  |
++============================================================================================================+
+| RFCOMM : Bluetooth Classic Serial Port (Default)                                                           |
+| TCP    : Wi-Fi / LAN (Much Higher Bandwidth And Lower Latency For Bulk Scripts)                            |
+|          Loopback Unless A Host Is Given - LAN Exposure Should Pair With --Secret-File                     |
+| UNIX   : Unix Domain Socket For On-Device Tools, Tests And Benchmarks                                      |
+| Shared Secret (--Secret-File) : Server Sends AUTH_CHALLENGE:<Nonce>, Client Answers                        |
+|                                 AUTH:<Hex HMAC-SHA256(Secret, Nonce)>, Then READY_FOR_AUDIT / AUTH_FAILED  |
++============================================================================================================+
+"""
+class RFCOMMTransport:
+
+    #Python Define
+    Name = "RFCOMM"
+
+    def __init__(Self, Port=1, UUID="8CE255C0-200A-11E0-AC64-0800200C9A66", Service_Name="RaspberryKeyboard"):
+        Self.Port = Port
+        Self.UUID = UUID
+        Self.Service_Name = Service_Name
+        # Exceptions Meaning The Client (Or The Listener) Is Gone
+        Self.Errors = (ConnectionResetError, OSError)
+        if bluetooth is not None:
+            Self.Errors = (bluetooth.btcommon.BluetoothError,) + Self.Errors
+
+    def Describe(Self):
+        return f"RFCOMM Channel {Self.Port}"
+
+    def Open(Self):
+        if bluetooth is None:
+            raise RuntimeError("PyBluez Is Not Installed (import bluetooth Failed)")
+
+        # Server_Sock : Create a New 'bluetooth Socket' Variable - Attach an Software Python Object
+        # bluetooth.BluetoothSocket() : Socket Creation
+        # bluetooth.RFCOMM : Protocol Definition
+        Server_Sock = bluetooth.BluetoothSocket(bluetooth.RFCOMM)
+
+        # Channel Binding (Port = Channel in RFCOMM Protocol)
+        # It Support 1 - 30 Protocol
+        Server_Sock.bind(("", Self.Port))
+        # Bluetooth RFCOMM Listen to ONLY 1 Device. 
+        Server_Sock.listen(1)
+
+        # Bluetooth Advertisement Service Registration
+        bluetooth.advertise_service(
+            Server_Sock,
+            Self.Service_Name,
+            service_id=Self.UUID,
+            service_classes=[Self.UUID, bluetooth.SERIAL_PORT_CLASS],
+            profiles=[bluetooth.SERIAL_PORT_PROFILE]
+            )
+        return Server_Sock
+
+    def Accept(Self, Server_Sock):
+        return Server_Sock.accept()
+
+    def Close(Self, Server_Sock):
+        Server_Sock.close()
+
+class TCPTransport:
+
+    #Python Define
+    Name = "TCP"
+    # Loopback Only By Default : Sessions Can Type Keystrokes, The LAN Needs An Explicit Host
+    DEFAULT_HOST = "127.0.0.1"
+    DEFAULT_PORT = 8765
+    LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+    Errors = (ConnectionError, OSError)
+
+    def __init__(Self, Host=DEFAULT_HOST, Port=DEFAULT_PORT, Backlog=4):
+        Self.Host = Host
+        Self.Port = Port
+        Self.Backlog = Backlog
+
+    def Describe(Self):
+        return f"TCP {Self.Host}:{Self.Port}"
+
+    def Is_Loopback(Self):
+        return Self.Host in Self.LOOPBACK_HOSTS
+
+    def Open(Self):
+        Server_Sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Restart Without Waiting For TIME_WAIT Of The Previous Run
+        Server_Sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        Server_Sock.bind((Self.Host, Self.Port))
+        Server_Sock.listen(Self.Backlog)
+        return Server_Sock
+
+    def Accept(Self, Server_Sock):
+        Client_Sock, Client_Info = Server_Sock.accept()
+        # Short Status Messages Must Not Wait For Nagle Coalescing
+        Client_Sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return Client_Sock, Client_Info
+
+    def Close(Self, Server_Sock):
+        Server_Sock.close()
+
+class UnixTransport:
+
+    #Python Define
+    Name = "UNIX"
+    DEFAULT_PATH = "/run/bluetooth_hid.sock"
+    Errors = (ConnectionError, OSError)
+
+    def __init__(Self, Path=DEFAULT_PATH, Backlog=4):
+        Self.Path = Path
+        Self.Backlog = Backlog
+
+    def Describe(Self):
+        return f"UNIX {Self.Path}"
+
+    def Open(Self):
+        # Stale Socket File Left By A Previous Run
+        if os.path.exists(Self.Path):
+            os.unlink(Self.Path)
+        Server_Sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        Server_Sock.bind(Self.Path)
+        Server_Sock.listen(Self.Backlog)
+        return Server_Sock
+
+    def Accept(Self, Server_Sock):
+        Client_Sock, _ = Server_Sock.accept()
+        # Unix Peers Have No Address : Log The Socket Path Instead
+        return Client_Sock, Self.Path
+
+    def Close(Self, Server_Sock):
+        Server_Sock.close()
+        try:
+            os.unlink(Self.Path)
+        except OSError:
+            pass
+
+TRANSPORTS = {"RFCOMM": RFCOMMTransport, "TCP": TCPTransport, "UNIX": UnixTransport}
+
+def Make_Transport(Name, Address=None):
+    """
+    Build A Transport From Its Name And Optional Address
+    - RFCOMM : Channel Number ("1")
+    - TCP    : "[Host:]Port" ("8765" : Loopback, "0.0.0.0:8765" : Every Interface)
+    - UNIX   : Socket Path
+    Raises ValueError On Unknown Transports Or Malformed Addresses
+    """
+    Name = Name.upper()
+    if Name not in TRANSPORTS:
+        raise ValueError(f"Unknown Transport: {Name}")
+    if Address is None:
+        return TRANSPORTS[Name]()
+
+    if Name == "RFCOMM":
+        return RFCOMMTransport(Port=int(Address))
+    if Name == "TCP":
+        Host, Separator, Port = Address.rpartition(':')
+        return TCPTransport(Host=Host or TCPTransport.DEFAULT_HOST, Port=int(Port))
+    return UnixTransport(Path=Address)
+
+
+"""
++============================================================================================================+
+| Server Statistics                                                                                          |
+| Latency Histograms Queried With STATS Over The Client Socket Or Exported As A Prometheus Textfile          |
++============================================================================================================+
+| Action_Latency    : Execute_Action Per Command (With --WriterThread : Time To Queue, Not To Type)          |
+| Wait_Drift        : Actual Minus Requested WAIT Duration                                                   |
+| Timeline_Lateness : Largest Deadline Lateness Of Each TIMELINE Script                                      |
+| Report_Jitter     : |Actual - Nominal| Spacing Of Consecutive Reports (Compare With / Without --Realtime)  |
+| Session_Duration  : Client Connect To Disconnect                                                           |
+| Script_Overrun    : Measured Script Duration Beyond The Timing Model Prediction (Stale Calibration)        |
++============================================================================================================+
+"""
+class LatencyHistogram:
+
+    def __init__(Self, Bounds):
+        # Attrib Initialization
+        # Counts[i] : Observations In (Bounds[i - 1], Bounds[i]] - Last Slot Is +Inf
+        Self.Bounds = Bounds
+        Self.Counts = [0] * (len(Bounds) + 1)
+        Self.Count = 0
+        Self.Sum = 0.0
+        Self.Max = 0.0
+
+    def Observe(Self, Seconds):
+        Self.Counts[bisect.bisect_left(Self.Bounds, Seconds)] += 1
+        Self.Count += 1
+        Self.Sum += Seconds
+        if Seconds > Self.Max:
+            Self.Max = Seconds
+
+    def Quantile(Self, Fraction):
+        """Upper Bound Of The Bucket Holding The Fraction-th Observation (Max For +Inf)"""
+        Target = Fraction * Self.Count
+        Cumulative = 0
+        for Index, Count in enumerate(Self.Counts):
+            Cumulative += Count
+            if Cumulative >= Target:
+                return Self.Bounds[Index] if Index < len(Self.Bounds) else Self.Max
+        return Self.Max
+
+    def Summary(Self):
+        if not Self.Count:
+            return {"Count": 0}
+        return {
+            "Count": Self.Count,
+            "Mean": round(Self.Sum / Self.Count, 6),
+            "P50": Self.Quantile(0.5),
+            "P99": Self.Quantile(0.99),
+            "Max": round(Self.Max, 6),
+        }
+
+class ServerStats:
+
+    #Python Define
+    # Bucket Upper Bounds (Seconds)
+    LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    DRIFT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+    SESSION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+    OVERRUN_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+    JITTER_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05)
+    # Metric -> (Prometheus Name, Help, Label Name, Buckets)
+    METRICS = {
+        "Action_Latency": ("hid_action_latency_seconds", "Execute_Action Latency Per Command", "command", LATENCY_BUCKETS),
+        "Wait_Drift": ("hid_wait_drift_seconds", "Actual Minus Requested WAIT Duration", None, DRIFT_BUCKETS),
+        "Timeline_Lateness": ("hid_timeline_lateness_seconds", "Largest Deadline Lateness Per TIMELINE Script", None, DRIFT_BUCKETS),
+        "Report_Jitter": ("hid_report_jitter_seconds", "Spacing Error Of Consecutive HID Reports Against Their Pacing Gap", None, JITTER_BUCKETS),
+        "Session_Duration": ("hid_session_duration_seconds", "Client Session Duration", None, SESSION_BUCKETS),
+        "Script_Overrun": ("hid_script_overrun_seconds", "Script Duration Beyond The Timing Model Prediction", None, OVERRUN_BUCKETS),
+    }
+    # Commands With Their Own Action_Latency Label - Anything Else Is OTHER (Bounded Label Set)
+    COMMAND_LABELS = ("HID", "TYPE", "DELETE_TEXT", "DELETE_ROW", "PACING", "LAYOUT", "FIELD", "LED", "BEEP", "WAIT")
+
+    def __init__(Self):
+        # Attrib Initialization
+        Self.Lock = threading.Lock()
+        # (Metric, Label) -> LatencyHistogram
+        Self.Histograms = {}
+        Self.Started = time.monotonic()
+
+    def Observe(Self, Metric, Seconds, Label=""):
+        with Self.Lock:
+            Histogram = Self.Histograms.get((Metric, Label))
+            if Histogram is None:
+                Histogram = Self.Histograms[(Metric, Label)] = LatencyHistogram(Self.METRICS[Metric][3])
+            Histogram.Observe(max(0.0, Seconds))
+
+    def Observe_Many(Self, Metric, Values, Label=""):
+        """Observe A Batch Under One Lock (Per-Report Values Recorded After A Sequence, Not Between Its Writes)"""
+        if not Values:
+            return
+        with Self.Lock:
+            Histogram = Self.Histograms.get((Metric, Label))
+            if Histogram is None:
+                Histogram = Self.Histograms[(Metric, Label)] = LatencyHistogram(Self.METRICS[Metric][3])
+            for Seconds in Values:
+                Histogram.Observe(max(0.0, Seconds))
+
+    def Observe_Action(Self, Command, Seconds):
+        Self.Observe("Action_Latency", Seconds, Command if Command in Self.COMMAND_LABELS else "OTHER")
+
+    def Snapshot(Self, Counters):
+        """JSON-Friendly Summary : Counters Plus Count / Mean / P50 / P99 / Max Per Histogram"""
+        Histograms = {}
+        with Self.Lock:
+            for (Metric, Label), Histogram in sorted(Self.Histograms.items()):
+                Histograms.setdefault(Metric, {})[Label or "ALL"] = Histogram.Summary()
+        return {
+            "Uptime": round(time.monotonic() - Self.Started, 3),
+            "Counters": Counters,
+            "Histograms": Histograms,
+        }
+
+    def Prometheus_Text(Self, Counters):
+        """Prometheus Text Exposition Format (node_exporter Textfile Collector)"""
+        Lines = []
+        for Name, Value in Counters.items():
+            Metric_Name = f"hid_{Name.lower()}_total"
+            Lines.append(f"# TYPE {Metric_Name} counter")
+            Lines.append(f"{Metric_Name} {Value}")
+
+        with Self.Lock:
+            for Metric, (Metric_Name, Help, Label_Name, Bounds) in Self.METRICS.items():
+                Series = sorted((Label, Histogram) for (Name, Label), Histogram in Self.Histograms.items() if Name == Metric)
+                if not Series:
+                    continue
+                Lines.append(f"# HELP {Metric_Name} {Help}")
+                Lines.append(f"# TYPE {Metric_Name} histogram")
+                for Label, Histogram in Series:
+                    Label_Text = f'{Label_Name}="{Label}",' if Label_Name else ""
+                    Cumulative = 0
+                    for Bound, Count in zip(Bounds + ("+Inf",), Histogram.Counts):
+                        Cumulative += Count
+                        Lines.append(f'{Metric_Name}_bucket{{{Label_Text}le="{Bound}"}} {Cumulative}')
+                    Series_Labels = f"{{{Label_Text.rstrip(',')}}}" if Label_Text else ""
+                    Lines.append(f"{Metric_Name}_sum{Series_Labels} {Histogram.Sum:.6f}")
+                    Lines.append(f"{Metric_Name}_count{Series_Labels} {Histogram.Count}")
+        return '\n'.join(Lines) + '\n'
+
+    def Write_Textfile(Self, Path, Counters):
+        """Atomic Replace : The Collector Never Reads A Half-Written File"""
+        Temporary_Path = f"{Path}.tmp"
+        with open(Temporary_Path, 'w') as Metrics_File:
+            Metrics_File.write(Self.Prometheus_Text(Counters))
+        os.replace(Temporary_Path, Path)
+
+"""
++============================================================================================================+
+| Execution Trace                                                                                            |
+| Start / End Of Every Action, Returned With AUDIT_COMPLETE (--Trace) To Align The Audit Video In One Pass   |
++============================================================================================================+
+| AUDIT_COMPLETE:TRACE:{"Wall":..,"Mono":..,"Steps":[[Index,"TYPE",Start,End],..]}                           |
+| AUDIT_COMPLETE:TRACE_ZLIB:<base64(zlib(Same JSON))>                                                        |
+| Also "Mode" (INTERPRET / TIMELINE) And "Pacing" ({"Profile": Name, Delays...} At The Script Start) :       |
+| The Verifier Times Every Step With The Profile The Script Actually Ran At                                  |
+|                                                                                                            |
+| Start / End Are Seconds Since The Anchors : Wall Clock = Wall + Start, Monotonic = Mono + Start            |
+| (One Anchor Pair Per Script - An NTP Step Mid-Script Cannot Skew The Steps Against Each Other)             |
+| TIMELINE Mode : Steps Span The Action's First To Last Event (WAIT / PACING Have No Events, No Step)        |
++============================================================================================================+
+"""
+class ExecutionTrace:
+
+    #Python Define
+    TRACE_JSON = "JSON"
+    TRACE_ZLIB = "ZLIB"
+    TRACE_MODES = (TRACE_JSON, TRACE_ZLIB)
+
+    def __init__(Self, Commands=None, Mode="INTERPRET", Pacing_Profile=DEFAULT_PACING_PROFILE, Pacing=None):
+        # Attrib Initialization
+        # Anchors Taken Together : Every Step Offset Maps To Both Clocks
+        Self.Mono_Start = time.monotonic()
+        Self.Wall_Start = time.time()
+        # Action Index -> [Command, Start, End]
+        Self.Steps = {}
+        # Command Per Action Index (TIMELINE : Touch Only Knows The Index)
+        Self.Commands = Commands or []
+        # Execution Mode And Session Pacing The Script Started With (Resolve_Pacing Accepts It Back)
+        Self.Mode = Mode
+        Self.Pacing = {"Profile": Pacing_Profile, **(Pacing or PACING_PROFILES[DEFAULT_PACING_PROFILE])}
+
+    def Begin(Self, Command):
+        """Next Action Starts Now (INTERPRET / Streamed Scripts : Actions Run One After Another)"""
+        Now = time.monotonic() - Self.Mono_Start
+        Self.Steps[len(Self.Steps)] = [Command, Now, Now]
+
+    def End(Self):
+        Self.Steps[len(Self.Steps) - 1][2] = time.monotonic() - Self.Mono_Start
+
+    def Touch(Self, Index):
+        """One Event Of Action Index Ran Now (TIMELINE : Actions Overlap, Each Spans First To Last Event)"""
+        Now = time.monotonic() - Self.Mono_Start
+        Step = Self.Steps.get(Index)
+        if Step is None:
+            Command = Self.Commands[Index] if Index < len(Self.Commands) else None
+            Self.Steps[Index] = [Command, Now, Now]
+        else:
+            Step[2] = Now
+
+    def Encode(Self, Mode=TRACE_JSON):
+        Trace = {
+            "Wall": round(Self.Wall_Start, 6),
+            "Mono": round(Self.Mono_Start, 6),
+            "Mode": Self.Mode,
+            "Pacing": Self.Pacing,
+            "Steps": [[Index, Command, round(Start, 6), round(End, 6)] for Index, (Command, Start, End) in sorted(Self.Steps.items())],
+        }
+        Text = json.dumps(Trace, separators=(',', ':'))
+        if Mode == Self.TRACE_ZLIB:
+            return "TRACE_ZLIB:" + base64.b64encode(zlib.compress(Text.encode('utf-8'), 9)).decode('ascii')
+        return "TRACE:" + Text
+
+    # Host Side : AUDIT_COMPLETE:TRACE[_ZLIB]:... -> Trace Dict (Shared With The Verifier)
+    Decode = staticmethod(Decode_Trace)
+
 """
 +============================================================================================================+
 | BluetoothHIDServer Class                                                                                   |
@@ -516,62 +2390,504 @@ class RaspberryKeyboard:
 class BluetoothHIDServer:
     
     # Bluetooth HID Server Initialization 
-    def __init__(Self, Test_Mode=False):
+    #Python Define
+    # Script Execution Modes
+    # INTERPRET : Execute Action By Action (Legacy)
+    # TIMELINE  : Validate + Compile The Whole Script, Then Run It Against Absolute Deadlines
+    EXECUTION_INTERPRET = "INTERPRET"
+    EXECUTION_TIMELINE = "TIMELINE"
+    EXECUTION_MODES = (EXECUTION_INTERPRET, EXECUTION_TIMELINE)
+    # Prometheus Textfile Rewrite Interval (Seconds)
+    METRICS_INTERVAL = 10.0
+    # Time A Client Has To Answer AUTH_CHALLENGE (Seconds)
+    AUTH_TIMEOUT = 10.0
+
+    def __init__(Self, Test_Mode=False, Sequence_Mode="SINGLE", Pacing=None, Writer_Mode="BLOCKING", Writer_Thread=False,
+                 Execution_Mode="INTERPRET", Stream_Scripts=False, Transport=None, HID_Device=None, Record_Capacity=0,
+                 Metrics_File=None, Trace_Mode=None, Layout=None, Realtime=None, Secret=None, Record_Text=False):
         Self.Server_Sock = None
         Self.Client_Sock = None
         Self.Keyboard = None
         # Stacked Hardware Instance 
-        Self.Hardware = Hardware()
+        Self.Hardware = Hardware(Test_Mode=Test_Mode)
         Self.Running = False
         Self.Port = 1
         # UUID : 8CE255C0-200A-11E0-AC64-0800200C9A66
         Self.UUID = "8CE255C0-200A-11E0-AC64-0800200C9A66"
         Self.Service_Name = "RaspberryKeyboard"
+        # Listening Transport (RFCOMM Unless Given : TCPTransport / UnixTransport)
+        if Transport is None:
+            Transport = RFCOMMTransport(Port=Self.Port, UUID=Self.UUID, Service_Name=Self.Service_Name)
+        Self.Transport = Transport
+        # Shared Secret (Bytes) Every Client Must Prove Before Its Session Starts (None : No Authentication)
+        Self.Secret = Secret
         # Test Mode
         Self.Test_Mode = Test_Mode
+        # Keyboard Report Sequencer (SINGLE / ROLLOVER)
+        Self.Sequence_Mode = Sequence_Mode
+        # Default Pacing Profile - Every New Session Starts From It
+        Self.Default_Pacing = Pacing
+        # Default Keyboard Layout (Host's Layout) - Every New Session Starts From It, Compiled With The Keyboard
+        Self.Default_Layout = Layout or DEFAULT_LAYOUT
+        # Timing Model With The Costs Calibrated For The Default Profile (--Calibrate, See HID_Timing_Model)
+        Self.Timing = TimingModel.Load(Pacing)
+        # HID Writer Mode (BLOCKING / POLL)
+        Self.Writer_Mode = Writer_Mode
+        # Real-Time HID Output (RealtimePacer, None : Plain time.sleep Pacing) - Runs On The Writer Thread
+        Self.Realtime = Realtime
+        # Dedicated HID Writer Thread (HIDOutputQueue) - Receive Keeps Running While Keys Are Typed
+        Self.Writer_Thread = Writer_Thread or Realtime is not None
+        Self.Output = None
+        # Script Execution Mode (INTERPRET / TIMELINE) And Its Scheduler
+        Self.Execution_Mode = Execution_Mode
+        Self.Scheduler = None
+        # Reason The Last Script Was Rejected Before Execution (None : Accepted)
+        Self.Audit_Rejection = None
+        # Reason The Last Script Stopped Part Way (None : Ran To The End)
+        Self.Audit_Abort = None
+        # Set When A Newer Session Preempts The Running Script (Async Server) - Checked Between Actions
+        Self.Abort_Event = threading.Event()
+        # RAW Sessions : Start Executing JSON Scripts While They Are Still Arriving
+        Self.Stream_Scripts = Stream_Scripts
+        # HID Device Override And In-Memory Recording (0 : Write To The Device)
+        Self.HID_Device = HID_Device
+        Self.Record_Capacity = Record_Capacity
+        # Recording Summaries Print The Decoded Text (Debugging Only - Otherwise Just Its Length)
+        Self.Record_Text = Record_Text
 
         # Stats Flag
         Self.Total_Connections = 0
         Self.Total_Audit_Tasks = 0
+        # Latency Histograms (STATS Command) And Their Prometheus Textfile (None : Not Exported)
+        Self.Stats = ServerStats()
+        Self.Metrics_File = Metrics_File
+        # Execution Trace Returned With AUDIT_COMPLETE (None : Plain AUDIT_COMPLETE, See ExecutionTrace)
+        if Trace_Mode is not None and Trace_Mode not in ExecutionTrace.TRACE_MODES:
+            raise ValueError(f"Unknown Trace Mode {Trace_Mode!r} (Expected One Of {', '.join(ExecutionTrace.TRACE_MODES)})")
+        Self.Trace_Mode = Trace_Mode
+        # Trace Of The Last Executed Script (Read By Process_Payload Right After Execute_Actions)
+        Self.Trace = None
 
     def Initialize_Keyboard(Self):
         # Initialize HID Device
         try:
-            Self.Keyboard = RaspberryKeyboard(Test_Mode=Self.Test_Mode)
+            Self.Keyboard = RaspberryKeyboard(Test_Mode=Self.Test_Mode, Sequence_Mode=Self.Sequence_Mode, Pacing=Self.Default_Pacing, Writer_Mode=Self.Writer_Mode,
+                                              Device=Self.HID_Device, Layout=Self.Default_Layout)
+            if Self.Record_Capacity:
+                Self.Keyboard.Sink = RecordingHIDSink(Self.Record_Capacity)
             Self.Keyboard.Open_HID_Device()
+            Self.Keyboard.Pacer = Self.Realtime
+            Self.Keyboard.Stats = Self.Stats
+            Self.Scheduler = TimelineScheduler(Self.Keyboard)
+            Self.Scheduler.Stats = Self.Stats
+            # Keyboard Output Moves To The Writer Thread, Actions Only Queue Reports
+            if Self.Writer_Thread:
+                Self.Output = HIDOutputQueue(Self.Keyboard)
+                Self.Keyboard.Output = Self.Output
+                Self.Output.Start()
             return True
         except Exception as Error:
             print(f"[Bluetooth_Server] [Initialize_Keyboard] Keyboard Init Failed: {Error}")
             return False
 
-    def Setup_Bluetooth(Self):
+    def Setup_Transport(Self):
         try:
-            
-            # Self.Server_Sock : Create a New 'bluetooth Socket' Variable - Attach an Software Python Object
-            # bluetooth.BluetoothSocket() : Socket Creation
-            # bluetooth.RFCOMM : Protocol Definition
-            Self.Server_Sock = bluetooth.BluetoothSocket(bluetooth.RFCOMM)
-
-            # Channel Binding (Port = Channel in RFCOMM Protocol)
-            # It Support 1 - 30 Protocol
-            Self.Server_Sock.bind(("", Self.Port))
-            # Bluetooth RFCOMM Listen to ONLY 1 Device. 
-            Self.Server_Sock.listen(1)
-
-            # Bluetooth Advertisement Service Registration
-            bluetooth.advertise_service(
-                Self.Server_Sock,
-                Self.Service_Name,
-                service_id=Self.UUID,
-                service_classes=[Self.UUID, bluetooth.SERIAL_PORT_CLASS],
-                profiles=[bluetooth.SERIAL_PORT_PROFILE]
-                )
+            Self.Server_Sock = Self.Transport.Open()
             return True
-        
-        except Exception as BluetoothSetupError:
-            print(f"[ERR] Bluetooth Setup Failed: {BluetoothSetupError}")
+        except Exception as TransportSetupError:
+            print(f"[ERR] {Self.Transport.Name} Setup Failed: {TransportSetupError}")
+            return False
+
+    def Run_Hardware(Self, Command, Parameters):
+        """Hardware Signal / WAIT In Order With The Keystrokes (Queued Behind Them With The Writer Thread)"""
+        Runner = Self.Run_Timed_Wait if Command == "WAIT" else Self.Hardware.Run
+        if Self.Output is not None:
+            Self.Output.Put_Call(Runner, Command, Parameters)
+        else:
+            Runner(Command, Parameters)
+
+    def Run_Timed_Wait(Self, Command, Parameters):
+        """WAIT Recording Its Drift (Actual Minus Requested Sleep)"""
+        Start = time.monotonic()
+        Self.Hardware.Run(Command, Parameters)
+        try:
+            Requested = float(Parameters.get("Seconds", Hardware.DEFAULT_SLEEP_TIME))
+        except (TypeError, ValueError):
+            return
+        Self.Stats.Observe("Wait_Drift", time.monotonic() - Start - Requested)
+
+    def Run_Feedback(Self, Command, Parameters):
+        """Feedback Signal (Never Blocks Keystrokes) - Fired Once The Preceding Keystrokes Were Written"""
+        if Self.Output is not None:
+            Self.Output.Put_Call(Self.Hardware.Signal, Command, Parameters)
+        else:
+            Self.Hardware.Signal(Command, Parameters)
+
+    def Execute_Action(Self, P_Command, P_Parameters):
+        """Execute A Single Audit Action (See Handle_Audit_Sequence For Supported Commands)"""
+
+        if P_Command == "HID":
+            # Press A Specific Key
+            Key = P_Parameters.get("Key")
+            if Key:
+                print(f"[HID] Pressing {Key}")
+                Self.Keyboard.Type_Key(Key)
+            # Blink Yellow for confirmation
+            Self.Run_Feedback("LED", {"Color": "Yellow", "Duration": FEEDBACK_SECONDS["HID"]})
+
+        elif P_Command == "TYPE":
+            # Type A String
+            Text = P_Parameters.get("Text", "")
+            print(f"[HID] Typing: {Text}")
+            Self.Keyboard.Type_String(Text, P_Parameters.get("Sequencer"))
+            Self.Run_Feedback("LED", {"Color": "Blue", "Duration": FEEDBACK_SECONDS["TYPE"]})
+
+        elif P_Command == "DELETE_TEXT":
+            # Delete Text By Pressing Backspace (Count Given Directly Or By The Text Itself)
+            if "Count" in P_Parameters:
+                Self.Keyboard.Delete_Chars(int(P_Parameters["Count"]))
+            else:
+                Self.Keyboard.Delete_String(P_Parameters.get("Text", ""))
+            Self.Run_Feedback("LED", {"Color": "Red", "Duration": FEEDBACK_SECONDS["DELETE_TEXT"]})
+
+        elif P_Command == "DELETE_ROW":
+            # Delete Entire Row (BIOS Compatible)
+            Method = P_Parameters.get("Method", "BIOS")
+            Time = P_Parameters.get("Time", 30)
+            Self.Keyboard.Delete_Row(Method=Method, Time=Time)
+            Self.Run_Feedback("LED", {"Color": "Red", "Duration": FEEDBACK_SECONDS["DELETE_ROW"]})
+
+        elif P_Command == "PACING":
+            # Session Pacing Profile (Kept Until Changed Or The Client Disconnects)
+            if Self.Keyboard.Set_Pacing(P_Parameters) is not None:
+                print(f"[HID] Pacing Profile: {Self.Keyboard.Pacing_Profile}")
+
+        elif P_Command == "LAYOUT":
+            # Session Keyboard Layout (Kept Until Changed Or The Client Disconnects)
+            if Self.Keyboard.Set_Layout(P_Parameters) is not None:
+                print(f"[HID] Keyboard Layout: {Self.Keyboard.Layout.Name}")
+
+        elif P_Command == "FIELD":
+            # Declare The Focused Field's Contents (Exact DELETE_ROW From Here On)
+            try:
+                Self.Keyboard.Field.Declare(P_Parameters)
+                print(f"[HID] Field: {Self.Keyboard.Field.Snapshot()}")
+            except ValueError as Error:
+                print(f"[HID] Field Declaration Ignored : {Error}")
+
+        elif P_Command == "LED":
+            # LED Control
+            Self.Run_Hardware("LED", P_Parameters)
+
+        elif P_Command == "BEEP":
+            # Buzzer Control
+            Self.Run_Hardware("BEEP", P_Parameters)
+
+        elif P_Command == "WAIT":
+            # Wait/Sleep Control
+            Self.Run_Hardware("WAIT", P_Parameters)
+
+        else:
+            # Unknown Command Handler
+            print(f"[Handle_Audit_Sequence] Unknown Command: {P_Command}")
+
+    def Compile_Timeline(Self, Actions):
+        """
+        Validate The Whole Script And Lower It To A Sorted Timeline (See TimelineScheduler)
+        Raises ScriptCompileError On The First Invalid Action - Nothing Has Been Typed Yet
+        Returns (Timeline, Final_Pacing, Final_Field, Final_Layout) : Session Pacing (PACING Commands),
+        Shadow Field And Keyboard Layout (LAYOUT Commands) After The Script
+        """
+        Keyboard = Self.Keyboard
+        Timeline = []
+        Clock = 0.0
+        Session_Pacing = (Keyboard.Pacing_Profile, Keyboard.Pacing)
+        Session_Layout = Keyboard.Layout
+        # Shadow Field Simulated Through The Script (Exact DELETE_ROW Counts Are Known At Compile Time)
+        Field = Keyboard.Field.Copy()
+
+        def Seconds(Value, Name, Index):
+            try:
+                Value = float(Value)
+            except (TypeError, ValueError):
+                raise ScriptCompileError(f"Action {Index}: {Name} Must Be A Number")
+            if not 0.0 <= Value < float('inf'):
+                raise ScriptCompileError(f"Action {Index}: {Name} Must Be A Non-Negative Number")
+            return Value
+
+        def Reports(Sequence, Index):
+            nonlocal Clock
+            Release = Keyboard.RELEASE_REPORT
+            for Report in Sequence:
+                Timeline.append((Clock, "REPORT", Report, Index))
+                Clock += Pacing["Key_Release"] if Report is Release else Pacing["Key_Press"]
+
+        # Device -> [(Start, End, Action_Index), ...] On-Intervals, Merged Once The Script Is Compiled
+        Pulses = {}
+
+        def Pulse(Device, Start, Duration, Index):
+            Pulses.setdefault(Device, []).append((Start, Start + Duration, Index))
+
+        def Key_Entry(Name, Index):
+            Entry = Keyboard.Key_Table.get(Name.upper()) if len(Name) > 1 else Layout.Lookup(Name)
+            if Entry is None:
+                raise ScriptCompileError(f"Action {Index}: Unknown Key {Name!r}")
+            return Entry
+
+        for Index, Action in enumerate(Actions):
+            if not isinstance(Action, dict):
+                raise ScriptCompileError(f"Action {Index}: Must Be An Object")
+            P_Command = Action.get("Command")
+            P_Parameters = Action.get("Parameters", {})
+            if not isinstance(P_Parameters, dict):
+                raise ScriptCompileError(f"Action {Index}: Parameters Must Be An Object")
+
+            # Pacing For This Action : Session Pacing, Or The Per-Action Override
+            try:
+                Pacing = Resolve_Pacing(P_Parameters["Pacing"])[1] if "Pacing" in P_Parameters else Session_Pacing[1]
+            except (ValueError, TypeError) as Error:
+                raise ScriptCompileError(f"Action {Index}: {Error}")
+            # Keyboard Layout For This Action : Session Layout, Or The Per-Action Override
+            try:
+                Layout = Load_Layout(P_Parameters["Layout"]) if "Layout" in P_Parameters else Session_Layout
+            except ValueError as Error:
+                raise ScriptCompileError(f"Action {Index}: {Error}")
+
+            if P_Command == "HID":
+                Key = P_Parameters.get("Key")
+                if Key:
+                    Reports(Key_Entry(str(Key), Index)[2:], Index)
+                    Field.Press(str(Key))
+                Pulse(Self.Hardware.LEDs["Yellow"], Clock, FEEDBACK_SECONDS["HID"], Index)
+
+            elif P_Command == "TYPE":
+                Compiled, Skipped = Keyboard.Compile_String(str(P_Parameters.get("Text", "")), P_Parameters.get("Sequencer"), Layout)
+                if Skipped:
+                    raise ScriptCompileError(f"Action {Index}: Unmapped Characters {Skipped!r}")
+                Reports(Compiled, Index)
+                Field.Type_Text(str(P_Parameters.get("Text", "")))
+                Pulse(Self.Hardware.LEDs["Blue"], Clock, FEEDBACK_SECONDS["TYPE"], Index)
+
+            elif P_Command == "DELETE_TEXT":
+                if "Count" in P_Parameters:
+                    Count = P_Parameters["Count"]
+                    if not isinstance(Count, int) or Count < 0:
+                        raise ScriptCompileError(f"Action {Index}: Count Must Be A Non-Negative Integer")
+                else:
+                    Count = len(str(P_Parameters.get("Text", "")))
+                Backspace = Keyboard.Key_Table["BACKSPACE"][2:]
+                for Iteration in range(Count):
+                    Reports(Backspace, Index)
+                    Clock += Pacing["Backspace_Gap"]
+                    Field.Press("BACKSPACE")
+                Pulse(Self.Hardware.LEDs["Red"], Clock, FEEDBACK_SECONDS["DELETE_TEXT"], Index)
+
+            elif P_Command == "DELETE_ROW":
+                Time = Seconds(P_Parameters.get("Time", 30), "Time", Index)
+                Clear_Keys = Field.Clear_Keys()
+                if Clear_Keys is not None:
+                    # Known Field : Backspaces Before The Cursor, DELETEs After It (Delete_Known_Row)
+                    Presses = [("BACKSPACE", Clear_Keys[0]), ("DELETE", Clear_Keys[1])]
+                else:
+                    Reports(Keyboard.Key_Table["HOME"][2:], Index)
+                    Clock += Pacing["Row_Home"]
+                    Presses = [("DELETE", Keyboard.Row_Delete_Count(Time))]
+                for Key_Name, Count in Presses:
+                    for Iteration in range(Count):
+                        Reports(Keyboard.Key_Table[Key_Name][2:], Index)
+                        Clock += Pacing["Row_Delete"]
+                # Only An Exact Clear Leaves The Field Known (Empty) - See Delete_Row
+                if Clear_Keys is not None:
+                    Field.Reset()
+                else:
+                    Field.Forget()
+                Pulse(Self.Hardware.LEDs["Red"], Clock, FEEDBACK_SECONDS["DELETE_ROW"], Index)
+
+            elif P_Command == "PACING":
+                try:
+                    Session_Pacing = Resolve_Pacing(P_Parameters)
+                except (ValueError, TypeError) as Error:
+                    raise ScriptCompileError(f"Action {Index}: {Error}")
+
+            elif P_Command == "LAYOUT":
+                try:
+                    Session_Layout = Load_Layout(P_Parameters)
+                except ValueError as Error:
+                    raise ScriptCompileError(f"Action {Index}: {Error}")
+
+            elif P_Command == "FIELD":
+                try:
+                    Field.Declare(P_Parameters)
+                except ValueError as Error:
+                    raise ScriptCompileError(f"Action {Index}: {Error}")
+
+            elif P_Command == "LED":
+                Device = Self.Hardware.LEDs.get(P_Parameters.get("Color", Hardware.DEFAULT_LED_COLOR))
+                if Device is None:
+                    raise ScriptCompileError(f"Action {Index}: Unknown LED Color {P_Parameters.get('Color')!r}")
+                Duration = Seconds(P_Parameters.get("Duration", Hardware.DEFAULT_LED_SLEEP_TIME), "Duration", Index)
+                Pulse(Device, Clock, Duration, Index)
+                Clock += Duration
+
+            elif P_Command == "BEEP":
+                Duration = Hardware.BUZZER_PATTERNS.get(P_Parameters.get("Pattern"), Hardware.DEFAULT_BUZZER_LAST)
+                Repeat = int(Seconds(P_Parameters.get("Repeat", Hardware.DEFAULT_BUZZER_OCCUR), "Repeat", Index))
+                for Iteration in range(Repeat):
+                    Pulse(Self.Hardware.Buzzer, Clock, Duration, Index)
+                    Clock += Duration
+
+            elif P_Command == "WAIT":
+                Clock += Seconds(P_Parameters.get("Seconds", Hardware.DEFAULT_SLEEP_TIME), "Seconds", Index)
+
+            else:
+                raise ScriptCompileError(f"Action {Index}: Unknown Command {P_Command!r}")
+
+        # Same Union As Hardware.Merge_Intervals : Overlapping Pulses Of A Device Become One On / Off Pair,
+        # Switched On By The Earliest Action And Off By The One Ending Last
+        for Device, Intervals in Pulses.items():
+            Merged = []
+            for Start, End, Index in sorted(Intervals):
+                if Merged and Start <= Merged[-1][1]:
+                    if End > Merged[-1][1]:
+                        Merged[-1] = (Merged[-1][0], End, Merged[-1][2], Index)
+                else:
+                    Merged.append((Start, End, Index, Index))
+            for Start, End, On_Index, Off_Index in Merged:
+                Timeline.append((Start, "GPIO", (Device, True), On_Index))
+                Timeline.append((End, "GPIO", (Device, False), Off_Index))
+        # Script End : Time Spent In Trailing WAITs Has No Event Of Its Own
+        Timeline.append((Clock, "END", None, len(Actions) - 1))
+
+        # Stable Sort : Events Sharing An Offset Keep Script Order
+        Timeline.sort(key=lambda Entry: Entry[0])
+        return Timeline, Session_Pacing, Field, Session_Layout
+
+    def Execute_Timeline(Self, Actions, Finish=None):
+        """
+        TIMELINE Mode : Compile (Reject Invalid Scripts Up Front), Then Run Against Absolute Deadlines
+        Finish : Called Once The Timeline Ran (See Start_Script_Timer)
+        """
+        try:
+            Timeline, Final_Pacing, Final_Field, Final_Layout = Self.Compile_Timeline(Actions)
+        except ScriptCompileError as Error:
+            print(f"[Execute_Timeline] Script Rejected: {Error}")
+            Self.Audit_Rejection = str(Error)
+            return True
+
+        # PACING / LAYOUT Commands Inside The Script Stay Active For The Session, The Field Is Where The Script Leaves It
+        Self.Keyboard.Pacing_Profile, Self.Keyboard.Pacing = Final_Pacing
+        Self.Keyboard.Layout = Final_Layout
+        Self.Keyboard.Field = Final_Field
+
+        if Self.Trace is not None:
+            Self.Trace.Commands = [Action.get("Command") for Action in Actions]
+        if Self.Output is not None:
+            Self.Output.Put_Call(Self.Scheduler.Execute, Timeline, Self.Trace)
+        else:
+            Self.Scheduler.Execute(Timeline, Self.Trace)
+        if Finish is not None:
+            Self.Run_In_Order(Finish)
+        Self.Total_Audit_Tasks += 1
+        return True
+
+    def New_Trace(Self):
+        """ExecutionTrace For The Script About To Run (None : Tracing Disabled)"""
+        if not Self.Trace_Mode:
+            return None
+        return ExecutionTrace(Mode=Self.Execution_Mode, Pacing_Profile=Self.Keyboard.Pacing_Profile, Pacing=Self.Keyboard.Pacing)
+
+    def Execute_Actions(Self, Actions):
+        """Execute A Parsed Action List In Order (JSON Script Or Translated action_code)"""
+        Self.Audit_Rejection = None
+        Self.Audit_Abort = None
+        Self.Trace = Self.New_Trace()
+        Finish = Self.Start_Script_Timer(Actions)
+        if Self.Execution_Mode == Self.EXECUTION_TIMELINE:
+            return Self.Execute_Timeline(Actions, Finish)
+
+        for Action in Actions:
+            if Self.Abort_Event.is_set():
+                print("[Execute_Actions] Script Preempted - Remaining Actions Skipped")
+                Self.Audit_Abort = "PREEMPTED"
+                return True
+            Self.Run_Action(Action, Self.Trace)
+
+        if Finish is not None:
+            Self.Run_In_Order(Finish)
+        Self.Total_Audit_Tasks += 1
+        return True
+
+    def Start_Script_Timer(Self, Actions):
+        """
+        Predict The Script Duration With The Timing Model And Start Its Clock (In Order With The Keystrokes)
+        Returns The Finish Callable Recording Script_Overrun, None If The Script Cannot Be Predicted
+        """
+        # TIMELINE Scripts End With The Last Feedback Pulse, Interpreted Ones With The Last Action
+        Timeline_Mode = Self.Execution_Mode == Self.EXECUTION_TIMELINE
+        try:
+            Predicted = Self.Timing.Estimate_Actions(Actions, Self.Keyboard.Pacing, Feedback=Timeline_Mode)
+        except (ValueError, TypeError, AttributeError) as Error:
+            print(f"[Execute_Actions] No Duration Prediction : {Error}")
+            return None
+        print(f"[Execute_Actions] {len(Actions)} Actions, Predicted Duration {Predicted:.2f}s")
+
+        Started = []
+        Self.Run_In_Order(lambda: Started.append(time.monotonic()))
+
+        def Finish():
+            Self.Stats.Observe("Script_Overrun", time.monotonic() - Started[0] - Predicted)
+        return Finish
+
+    def Run_Action(Self, Action, Trace=None):
+        """Execute One Action Object With Its Optional Per-Action Pacing / Layout Overrides (Trace : ExecutionTrace Step)"""
+        P_Command = Action.get("Command")
+        P_Parameters = Action.get("Parameters", {})
+        if Trace is not None:
+            Self.Run_In_Order(Trace.Begin, P_Command)
+
+        # Per-Action Pacing Override : Applied For This Action Only
+        Action_Pacing = P_Parameters.get("Pacing")
+        Previous_Pacing = Self.Keyboard.Set_Pacing(Action_Pacing) if Action_Pacing else None
+        # Per-Action Layout Override (e.g. One TYPE On A Different Host Layout) : Same
+        Action_Layout = P_Parameters.get("Layout")
+        Previous_Layout = Self.Keyboard.Set_Layout(Action_Layout) if Action_Layout else None
+        Start = time.perf_counter()
+        try:
+            Self.Execute_Action(P_Command, P_Parameters)
+        finally:
+            Self.Keyboard.Restore_Pacing(Previous_Pacing)
+            Self.Keyboard.Restore_Layout(Previous_Layout)
+            Self.Stats.Observe_Action(P_Command, time.perf_counter() - Start)
+            if Trace is not None:
+                Self.Run_In_Order(Trace.End)
+
+    def Run_In_Order(Self, Function, *Args):
+        """Call Now, Or With The Writer Thread Once The Keystrokes Queued Before It Were Written"""
+        if Self.Output is not None:
+            Self.Output.Put_Call(Function, *Args)
+        else:
+            Function(*Args)
+
+    def Handle_Action_Code(Self, Raw_Data):
+        """
+        Execute A Compact action_code Payload (Forwarded Verbatim From The Backend)
+        Returns False If The Payload Is Not action_code (Caller Falls Back To Plain Text)
+        """
+        if not Looks_Like_Action_Code(Raw_Data):
+            return False
+        try:
+            Actions = Parse_Action_Code(Raw_Data)
+        except ValueError as Error:
+            if Self.Keyboard.Debug:
+                print(f"[DEBUG] [Handle_Action_Code] Payload Not action_code: {Error}")
             return False
 
+        print(f"[Handle_Action_Code] Audit Challenge Received. Executing {len(Actions)} Sets of Actions.")
+        try:
+            return Self.Execute_Actions(Actions)
+        except Exception as Error:
+            print(f"[Handle_Action_Code] [AUDIT_ERR] : {Error}")
+            return False
 
     def Handle_Audit_Sequence(Self, Raw_Data):
         """
@@ -591,101 +2907,416 @@ class BluetoothHIDServer:
         - {"Command": "HID", "Parameters": {"Key": "ENTER"}}
         + ==============================================================================
         - {"Command": "TYPE", "Parameters": {"Text": "hello"}}
+        - {"Command": "TYPE", "Parameters": {"Text": "hello", "Sequencer": "ROLLOVER"}}
         - {"Command": "DELETE_TEXT", "Parameters": {"Text": "hello"}}
+        - {"Command": "DELETE_TEXT", "Parameters": {"Count": 5}}
         - {"Command": "DELETE_ROW", "Parameters": {"Method": "BIOS", "Time": 30}}
+        - {"Command": "FIELD", "Parameters": {"Length": 0}}           (Field Is Empty : DELETE_ROW Clears Exactly)
+        - {"Command": "FIELD", "Parameters": {"Length": 12, "Cursor": 4}}
+        - {"Command": "FIELD", "Parameters": {"Known": false}}       (Back To The Blind DELETE_ROW Count)
         + ==============================================================================
         - {"Command": "LED", "Parameters": {"Color": "Red", "Duration": 1.0}}
         - {"Command": "BEEP", "Parameters": {"Repeat": 2, "Pattern": "Short"}}
         - {"Command": "WAIT", "Parameters": {"Seconds": 1.0}}
+        + ==============================================================================
+        - {"Command": "PACING", "Parameters": {"Profile": "OS_FAST"}}
+        - {"Command": "PACING", "Parameters": {"Profile": "CUSTOM", "Base": "UEFI", "Key_Press": 0.01}}
+        - Any Keystroke Action Accepts "Pacing" For That Action Only:
+          {"Command": "TYPE", "Parameters": {"Text": "hello", "Pacing": "UEFI"}}
+        + ==============================================================================
+        - {"Command": "LAYOUT", "Parameters": {"Name": "DE"}}         (Host Keyboard Layout : US, UK, DE, FR, JIS)
+        - Any Keystroke Action Accepts "Layout" For That Action Only:
+          {"Command": "TYPE", "Parameters": {"Text": "Grüße", "Layout": "DE"}}
+
+        Scripts Larger Than One RFCOMM Read Need A Framed Session (See FrameDecoder)
+        """
+
+        try:
+            # Clean up the Input Data - Remove Any BOM or Hidden Characters
+            Clean_Data = Raw_Data.strip()
+
+            # Load JSON Object Understanding into String
+            Actions = json.loads(Clean_Data)
+
+            print(f"[Handle_Audit_Sequence] Audit Challenge Received. Executing {len(Actions)} Sets of Actions.")
+
+            if isinstance(Actions, list):
+                return Self.Execute_Actions(Actions)
+                
+        except json.JSONDecodeError as Error:
+            # Payload is Not Valid JSON, Fallback To Normal String Mode
+            if Self.Keyboard.Debug:
+                print(f"[DEBUG] [Handle_Audit_Sequence] Payload Not JSON: {Error}")
+            return False
+        except Exception as Error:
+            print(f"[Handle_Audit_Sequence] [AUDIT_ERR] : {Error}")
+            return False
+        return False
+
+    def Send_Message(Self, Session, Message):
+        """
+        Send A Status Message To The Client (Framed Per Session) - False If The Client Is Gone
+        Message May Be A Callable, Built When Sent (Writer Thread : After The Queued Work Before It Ran)
+        """
+        if callable(Message):
+            Message = Message()
+        try:
+            Session.Sock.send(Session.Decoder.Encode(Message.encode('utf-8')))
+            return True
+        except Self.Transport.Errors:
+            print(f"[Handle_Client] Client lost during send: {Session.Info}")
+            return False
+
+    def Respond(Self, Session, Message):
+        """Send A Response Right Away, Or Once Everything Queued Before It Was Executed (Writer Thread)"""
+        if Self.Output is None:
+            return Self.Send_Message(Session, Message)
+        Self.Output.Put_Call(Self.Send_Message, Session, Message)
+        return True
+
+    def Respond_Complete(Self, Session, Trace):
+        """AUDIT_COMPLETE, Followed By The Execution Trace When --Trace Is Enabled"""
+        if Trace is None:
+            return Self.Respond(Session, "AUDIT_COMPLETE")
+        return Self.Respond(Session, lambda: "AUDIT_COMPLETE:" + Trace.Encode(Self.Trace_Mode))
+
+    def Respond_Typing(Self, Session, Success):
+        """OK / PARTIAL_FAIL For Plain Text - With The Writer Thread, Decided After The Reports Were Written"""
+        if Self.Output is None:
+            return Self.Send_Message(Session, "OK" if Success else "PARTIAL_FAIL")
+        Self.Output.Put_Call(
+            lambda: Self.Send_Message(Session, "OK" if Success and not Self.Output.Job_Failed else "PARTIAL_FAIL")
+        )
+        return True
+
+    def Auth_Challenge(Self):
+        """AUTH_CHALLENGE:<Nonce> Message And The Answer Expected For It (AUTH:<Hex HMAC-SHA256(Secret, Nonce)>)"""
+        Nonce = secrets.token_hex(16)
+        return f"AUTH_CHALLENGE:{Nonce}", "AUTH:" + hmac.new(Self.Secret, Nonce.encode('ascii'), hashlib.sha256).hexdigest()
+
+    def Check_Auth(Self, Client_Sock, Client_Info, Data, Expected):
+        """Compare The Client's Answer (Constant Time) - Failures Are Answered AUTH_FAILED"""
+        try:
+            Answer = Data.decode('ascii').strip()
+        except UnicodeDecodeError:
+            Answer = ""
+        if Answer and hmac.compare_digest(Answer, Expected):
+            return True
+        print(f"[Handle_Client] Authentication Failed: {Client_Info}")
+        try:
+            Client_Sock.send("AUTH_FAILED".encode('utf-8'))
+        except Self.Transport.Errors:
+            pass
+        return False
+
+    def Authenticate(Self, Client_Sock, Client_Info):
+        """Shared-Secret Challenge / Response Before READY_FOR_AUDIT - False : Client Rejected"""
+        Challenge, Expected = Self.Auth_Challenge()
+        Client_Sock.send(Challenge.encode('utf-8'))
+        Client_Sock.settimeout(Self.AUTH_TIMEOUT)
+        try:
+            Data = Client_Sock.recv(1024)
+        except Self.Transport.Errors:
+            Data = b''
+        finally:
+            Client_Sock.settimeout(None)
+        return Self.Check_Auth(Client_Sock, Client_Info, Data, Expected)
+
+    def Negotiate_Framing(Self, Session, Data):
+        """
+        Framing Negotiation (RAW Sessions Only) : Client Answers READY_FOR_AUDIT With "FRAMING:<MODE>[\n]"
+        Reply Is Sent Unframed ("FRAMING_OK:<MODE>" / "FRAMING_UNSUPPORTED"), Everything After Is Framed
+        Returns The Bytes Following The Negotiation Line (Already Framed Data From A Pipelining Client)
+        """
+        Line, Separator, Remainder = Data.partition(b'\n')
+        Mode = Line[len(FrameDecoder.NEGOTIATION_PREFIX):].strip().decode('latin-1').upper()
+
+        if Mode not in FrameDecoder.FRAMING_MODES:
+            Self.Send_Message(Session, "FRAMING_UNSUPPORTED")
+            return b''
+
+        Self.Send_Message(Session, f"FRAMING_OK:{Mode}")
+        Session.Decoder = FrameDecoder(Mode)
+        print(f"[Handle_Client] Framing Negotiated: {Mode} ({Session.Info})")
+        return Remainder
+
+    def Is_Streamed(Self, Session, Data):
+        """True If This Read Continues Or Starts A Streamed Script (RAW Sessions, --Stream, INTERPRET Mode)"""
+        return Self.Stream_Scripts and Self.Execution_Mode == Self.EXECUTION_INTERPRET and \
+            Session.Decoder.Mode == FrameDecoder.FRAMING_RAW and \
+            (Session.Stream is not None or Data.lstrip()[:1] == b'[')
+
+    def Drop_Stream_Data(Self, Session, Data):
+        """
+        Read Dropped Unexecuted (Preempted Session) : A Script Being Streamed Is Followed To Its ']',
+        So Its Later Chunks Are Discarded Too Instead Of Being Typed As Plain Text
+        """
+        if not Self.Is_Streamed(Session, Data):
+            return
+        Stream = Session.Stream
+        if Stream is None:
+            # Script Starts In The Dropped Read : Parsed Up To Where It Stands, Nothing Executed
+            Stream = StreamingActionParser()
+            try:
+                Stream.Feed(Data)
+            except NotAScriptError:
+                # Plain Text After All : Nothing Follows It
+                return
+            except ValueError:
+                pass
+            Data = b''
+        Stream.Discard()
+        Stream.Feed(Data)
+        Session.Stream = None if Stream.Finished else Stream
+        Session.Trace = None
+
+    def Stream_Script(Self, Session, Data):
         """
+        Streaming Execution (RAW Sessions) : Feed Received Bytes To The Session Stream,
+        Execute Every Action Completed So Far, Answer AUDIT_COMPLETE Once ']' Arrived
+        An Aborted Script Is Discarded Up To Its ']' : Its Remaining Chunks Are Never Typed As Plain Text
+        Returns False If The Client Is Gone
+        """
+        if Session.Stream is None:
+            Session.Stream = StreamingActionParser()
+            Session.Trace = Self.New_Trace()
+            print(f"[Stream_Script] Streaming Audit Challenge From {Session.Info}")
+        # Already Answered AUDIT_ABORTED : Only The End Of The Script Is Awaited
+        Aborted = Session.Stream.Discarding
 
         try:
-            # Clean up the Input Data - Remove Any BOM or Hidden Characters
-            Clean_Data = Raw_Data.strip()
+            for Action in Session.Stream.Feed(Data):
+                if Self.Abort_Event.is_set():
+                    raise RuntimeError("PREEMPTED")
+                Self.Run_Action(Action, Session.Trace)
+        except NotAScriptError as Error:
+            # Plain Text That Happens To Start With '[' (e.g. A Password) : Nothing Ran, Type It Instead
+            Session.Stream = Session.Trace = None
+            return Self.Process_Payload(Session, Error.Head)
+        except Exception as Error:
+            # Already Executed Actions Cannot Be Undone : Abort The Rest Of The Script
+            print(f"[Stream_Script] [AUDIT_ERR] : {Error}")
+            Session.Stream.Discard()
+            Session.Trace = None
+            if not Self.Respond(Session, f"AUDIT_ABORTED:{Error}"):
+                return False
+            Aborted = True
 
-            # Load JSON Object Understanding into String
-            Actions = json.loads(Clean_Data)
+        if not Session.Stream.Finished:
+            return True
 
-            print(f"[Handle_Audit_Sequence] Audit Challenge Received. Executing {len(Actions)} Sets of Actions.")
+        Leftover = Session.Stream.Leftover()
+        Trace, Session.Stream, Session.Trace = Session.Trace, None, None
+        if not Aborted:
+            Self.Total_Audit_Tasks += 1
+            if not Self.Respond_Complete(Session, Trace):
+                return False
+        # Next Message Started In The Same Read (Possibly Another Streamed Script)
+        if Leftover.lstrip()[:1] == '[':
+            return Self.Stream_Script(Session, Leftover.encode('utf-8'))
+        return Self.Process_Payload(Session, Leftover)
 
-            if isinstance(Actions, list):
-                for Action in Actions:
-                    P_Command = Action.get("Command")
-                    P_Parameters = Action.get("Parameters", {})
-
-                    if P_Command == "HID":
-                        # Press A Specific Key
-                        Key = P_Parameters.get("Key")
-                        if Key:
-                            print(f"[HID] Pressing {Key}")
-                            Self.Keyboard.Type_Key(Key)
-                        # Blink Yellow for confirmation
-                        Self.Hardware.Run("LED", {"Color": "Yellow", "Duration": 0.1})
-
-                    elif P_Command == "TYPE":
-                        # Type A String
-                        Text = P_Parameters.get("Text", "")
-                        print(f"[HID] Typing: {Text}")
-                        Self.Keyboard.Type_String(Text)
-                        Self.Hardware.Run("LED", {"Color": "Blue", "Duration": 0.1})
-
-                    elif P_Command == "DELETE_TEXT":
-                        # Delete Text By Pressing Backspace
-                        Text = P_Parameters.get("Text", "")
-                        Self.Keyboard.Delete_String(Text)
-                        Self.Hardware.Run("LED", {"Color": "Red", "Duration": 0.1})
-
-                    elif P_Command == "DELETE_ROW":
-                        # Delete Entire Row (BIOS Compatible)
-                        Method = P_Parameters.get("Method", "BIOS")
-                        Time = P_Parameters.get("Time", 30)
-                        Self.Keyboard.Delete_Row(Method=Method, Time=Time)
-                        Self.Hardware.Run("LED", {"Color": "Red", "Duration": 0.2})
-
-                    elif P_Command == "LED":
-                        # LED Control
-                        Self.Hardware.Run("LED", P_Parameters)
-
-                    elif P_Command == "BEEP":
-                        # Buzzer Control
-                        Self.Hardware.Run("BEEP", P_Parameters)
-
-                    elif P_Command == "WAIT":
-                        # Wait/Sleep Control
-                        Self.Hardware.Run("WAIT", P_Parameters)
+    def Process_Payload(Self, Session, Received_Payload):
+        """Execute One Complete Client Message - False If The Client Is Gone"""
 
-                    else:
-                        # Unknown Command Handler
-                        print(f"[Handle_Audit_Sequence] Unknown Command: {P_Command}")
+        # Ignore Empty or Whitespace-Only Payloads
+        if not Received_Payload.strip():
+            return True
+
+        # Control Channel : STATS Is Answered Right Away With A JSON Snapshot (Never Typed)
+        if Received_Payload.strip() == "STATS":
+            return Self.Send_Message(Session, "STATS:" + json.dumps(Self.Stats_Snapshot(), separators=(',', ':')))
+
+        # Check If Payload Is JSON Audit Command, Compact action_code, or Plain Text Password
+        if Self.Handle_Audit_Sequence(Received_Payload) or Self.Handle_Action_Code(Received_Payload):
+            # TIMELINE Mode : Invalid Script Rejected Before Any Key Was Pressed
+            if Self.Audit_Rejection is not None:
+                return Self.Respond(Session, f"AUDIT_REJECTED:{Self.Audit_Rejection}")
+            # Preempted By A Newer Session Part Way Through
+            if Self.Audit_Abort is not None:
+                return Self.Respond(Session, f"AUDIT_ABORTED:{Self.Audit_Abort}")
+            # Audit JSON Command Executed (Or Queued) Successfully - Send Confirmation
+            return Self.Respond_Complete(Session, Self.Trace)
+
+        # else Condition can be Removed as Plain Text Password is not needed anymore.
+        # Not JSON - Treat As Normal Keyboard String Input
+        # Remove Non-Printable Characters Except Newline and Tab
+        Printable_Payload = ''.join(C for C in Received_Payload if C.isprintable() or C in '\n\t')
+        if Printable_Payload:
+            # Type The Filtered String Via HID Keyboard
+            print(f"[HID] Typing Normal String: {repr(Printable_Payload)}")
+            if Self.Output is not None:
+                Self.Output.Put_Call(Self.Output.Reset_Job_Status)
+            Success = Self.Keyboard.Type_String(Printable_Payload)
+            # Send Response Based On Typing Success
+            return Self.Respond_Typing(Session, Success)
+
+        # Payload Was All Non-Printable Characters - Ignore It
+        return Self.Respond(Session, "IGNORED")
+
+    def Stats_Counters(Self):
+        Counters = {"Connections": Self.Total_Connections, "Audit_Tasks": Self.Total_Audit_Tasks}
+        if Self.Keyboard is not None:
+            Counters.update(Self.Keyboard.Write_Counters)
+        return Counters
+
+    def Stats_Snapshot(Self):
+        Snapshot = Self.Stats.Snapshot(Self.Stats_Counters())
+        Snapshot["Pacing"] = Self.Keyboard.Pacing_Profile if Self.Keyboard else None
+        Snapshot["Layout"] = Self.Keyboard.Layout.Name if Self.Keyboard else None
+        Snapshot["Field"] = Self.Keyboard.Field.Snapshot() if Self.Keyboard else None
+        Snapshot["Realtime"] = dict(Self.Realtime.Status) if Self.Realtime else None
+        return Snapshot
+
+    def Write_Metrics(Self):
+        """Rewrite The Prometheus Textfile (No-Op Without --Metrics-File)"""
+        if not Self.Metrics_File:
+            return
+        try:
+            Self.Stats.Write_Textfile(Self.Metrics_File, Self.Stats_Counters())
+        except OSError as Error:
+            print(f"[Write_Metrics] Failed To Write {Self.Metrics_File}: {Error}")
+
+    def Start_Metrics_Exporter(Self):
+        """Background Textfile Rewrite Every METRICS_INTERVAL Seconds"""
+        if not Self.Metrics_File:
+            return
+        def Metrics_Loop():
+            while True:
+                Self.Write_Metrics()
+                time.sleep(Self.METRICS_INTERVAL)
+        threading.Thread(target=Metrics_Loop, name="Metrics_Exporter", daemon=True).start()
 
-                Self.Total_Audit_Tasks += 1
+    def Calibrate(Self, Path=None, Repeat=3):
+        """
+        Calibration Mode : Time Real TYPE / DELETE_TEXT / WAIT Actions With The Default Pacing Profile,
+        Fit The Execution Costs (HID_Timing_Model.Fit_Costs) And Store Them For That Profile
+        Every TYPE Is Backspaced Again - Focus A Scratch Text Field On The Host First
+        Returns The Fitted Costs, None If The Keyboard Could Not Be Opened
+        """
+        if not Self.Initialize_Keyboard():
+            print("[FATAL] Keyboard Init Failed.")
+            return None
+        Profile = Self.Keyboard.Pacing_Profile
+        Text_Source = "abcdefghijklmnopqrstuvwxyz" * 2
+        Samples = {"TYPE": [], "DELETE_TEXT": [], "WAIT": []}
+        Measured = []
+
+        def Measure(Kind, Size, Parameters):
+            # Interpreted Path Of A Real Script, Until The Last Report Was Written
+            Start = time.monotonic()
+            Self.Run_Action({"Command": Kind, "Parameters": Parameters})
+            if Self.Output is not None:
+                Self.Output.Drain()
+            Elapsed = time.monotonic() - Start
+            Samples[Kind].append((Size, Elapsed))
+            Measured.append((Kind, Parameters, Elapsed))
+
+        print(f"[Calibrate] {Profile} Pacing, {Repeat} Rounds - Typing Into The Focused Field In 3 Seconds...")
+        time.sleep(3)
+        for Round in range(Repeat):
+            for Length in CALIBRATION_LENGTHS:
+                Measure("TYPE", Length, {"Text": Text_Source[:Length]})
+                Measure("DELETE_TEXT", Length, {"Count": Length})
+            for Seconds in CALIBRATION_WAITS:
+                Measure("WAIT", Seconds, {"Seconds": Seconds})
+            print(f"[Calibrate] Round {Round + 1}/{Repeat} Done")
+
+        Costs = Fit_Costs(Samples, Self.Keyboard.Pacing)
+        Details = {"Host": socket.gethostname(), "Samples": len(Measured), "Writer": Self.Writer_Mode,
+                   "Writer_Thread": bool(Self.Writer_Thread), "Sequencer": Self.Sequence_Mode,
+                   "Realtime": dict(Self.Realtime.Status) if Self.Realtime else None}
+        Saved_Path = Save_Calibration(Profile, Costs, Details, Path)
+        Self.Timing = TimingModel.Load(Profile, Saved_Path)
+
+        # Fit Quality : Largest Prediction Error Over The Calibration Samples
+        Worst = max(abs(Elapsed - Self.Timing.Action_Seconds(Kind, Parameters)) for Kind, Parameters, Elapsed in Measured)
+        print(f"[Calibrate] Costs: {json.dumps(Costs)}")
+        print(f"[Calibrate] Largest Sample Error {Worst * 1000:.2f} ms - Saved To {Saved_Path}")
+        return Costs
+
+    def Report_Recording(Self):
+        """
+        Recording Sink : Print What The Host Would Have Seen Since The Last Report, Then Start Over
+        The Typed Text (Passwords, Challenges) Ends Up In The Journal Only With --Record-Text
+        """
+        Sink = Self.Keyboard.Sink if Self.Keyboard else None
+        if Sink is None or not len(Sink):
+            return
+        Summary = HIDReportDecoder(Self.Keyboard.Char_map, Self.Keyboard.Layout).Decode(Sink.Snapshot())
+        Sink.Clear()
+        if not Self.Record_Text:
+            Summary = {"Text_Length": len(Summary.pop("Text")), **Summary}
+        print(f"[Recording] {json.dumps(Summary)}")
+
+    def Handle_Data(Self, Session, Data):
+        """Process One Received Chunk (Negotiation, Streaming, Framed Messages) - False Ends The Session"""
+
+        # Framing Negotiation (Switches This Session To LENGTH / LINE Frames)
+        if Session.Decoder.Mode == FrameDecoder.FRAMING_RAW and Data.startswith(FrameDecoder.NEGOTIATION_PREFIX):
+            Data = Self.Negotiate_Framing(Session, Data)
+            if not Data:
                 return True
-                
-        except json.JSONDecodeError as Error:
-            # Payload is Not Valid JSON, Fallback To Normal String Mode
-            if Self.Keyboard.Debug:
-                print(f"[DEBUG] [Handle_Audit_Sequence] Payload Not JSON: {Error}")
-            return False
-        except Exception as Error:
-            print(f"[Handle_Audit_Sequence] [AUDIT_ERR] : {Error}")
+
+        # Streaming Execution : Script Continues Or A New JSON Script Starts In This Read
+        if Self.Is_Streamed(Session, Data):
+            return Self.Stream_Script(Session, Data)
+
+        # Reassemble Complete Messages (RAW : Every Chunk Is One Message)
+        try:
+            Frames = Session.Decoder.Feed(Data)
+        except ValueError as Error:
+            print(f"[Handle_Client] Framing Error: {Error} ({Session.Info})")
+            Self.Send_Message(Session, "FRAME_ERROR")
             return False
-        return False
+
+        for Frame in Frames:
+            try:
+                # Attempt To Decode Received Bytes as UTF-8 String
+                Received_Payload = Frame.decode('utf-8')
+            except UnicodeDecodeError:
+                # Fallback To Latin-1 Encoding For Non-UTF8 Data
+                Received_Payload = Frame.decode('latin-1')
+
+            if not Self.Process_Payload(Session, Received_Payload):
+                return False
+        return True
 
     def Handle_Client(Self, Client_Sock, Client_Info):
         # Log Client Connection and Increment Total Connections Counter
         print(f"[Handle_Client] CLIENT Connected: {Client_Info}")
         Self.Total_Connections += 1
 
+        # Per-Connection State (Socket, Framing)
+        Session = ClientSession(Client_Sock, Client_Info)
+        Session_Start = time.monotonic()
+
+        # Session Pacing And Layout Start From The Server Default (PACING / LAYOUT Commands May Change Them)
+        Self.Keyboard.Set_Pacing(Self.Default_Pacing)
+        Self.Keyboard.Set_Layout(Self.Default_Layout)
+        # The Host May Have Been Used Since The Last Session : Field Contents Unknown Until Declared Or Cleared
+        Self.Keyboard.Field.Forget()
+
+        # Writer Thread : Tell This Client To Hold Off While The Report Queue Is Full
+        if Self.Output is not None:
+            Self.Output.Backpressure_Handler = lambda Blocked: Self.Send_Message(
+                Session, "BUSY" if Blocked else "READY"
+            )
+
         try:
+            # Shared Secret : Nothing Is Typed For A Client That Cannot Prove It
+            if Self.Secret is not None and not Self.Authenticate(Client_Sock, Client_Info):
+                return
+
             # Send Initial Handshake Message to Client Indicating Server is Ready
             Client_Sock.send("READY_FOR_AUDIT".encode('utf-8'))
 
             # Main Loop: Continuously Receive Data While Server is Running
             while Self.Running:
-                # Receive Up To 1024 Bytes of Data From Client
+                # Receive Up To Recv_Size Bytes of Data From Client (1024 In RAW Mode)
                 try:
-                    Data = Client_Sock.recv(1024)
-                except (bluetooth.btcommon.BluetoothError, ConnectionResetError, OSError):
+                    Data = Client_Sock.recv(Session.Decoder.Recv_Size)
+                except Self.Transport.Errors:
                     # Client Disconnected Abruptly (Connection Reset By Peer)
                     print(f"[Handle_Client] Client connection reset: {Client_Info}")
                     break
@@ -696,47 +3327,11 @@ class BluetoothHIDServer:
                     print(f"[Handle_Client] Client disconnected gracefully: {Client_Info}")
                     break
 
-                try:
-                    # Attempt To Decode Received Bytes as UTF-8 String
-                    Received_Payload = Data.decode('utf-8')
-                except UnicodeDecodeError:
-                    # Fallback To Latin-1 Encoding For Non-UTF8 Data
-                    Received_Payload = Data.decode('latin-1')
-
-                # Ignore Empty or Whitespace-Only Payloads
-                if not Received_Payload.strip():
-                    continue
-
-                # Check If Payload Is JSON Audit Command or Plain Text Password
-                if Self.Handle_Audit_Sequence(Received_Payload):
-                    # Audit JSON Command Executed Successfully - Send Confirmation
-                    try:
-                        Client_Sock.send("AUDIT_COMPLETE".encode('utf-8'))
-                    except (bluetooth.btcommon.BluetoothError, ConnectionResetError, OSError):
-                        print(f"[Handle_Client] Client lost during send: {Client_Info}")
-                        break
-                    # else Condition can be Removed as Plain Text Password is not needed anymore.
-                else:
-                    # Not JSON - Treat As Normal Keyboard String Input
-                    # Remove Non-Printable Characters Except Newline and Tab
-                    Printable_Payload = ''.join(C for C in Received_Payload if C.isprintable() or C in '\n\t')
-                    if Printable_Payload:
-                        # Type The Filtered String Via HID Keyboard
-                        print(f"[HID] Typing Normal String: {repr(Printable_Payload)}")
-                        Success = Self.Keyboard.Type_String(Printable_Payload)
-                        # Set Response Based On Typing Success
-                        Response = "OK" if Success else "PARTIAL_FAIL"
-                    else:
-                        # Payload Was All Non-Printable Characters - Ignore It
-                        Response = "IGNORED"
-                    # Send Response Status Back To Client
-                    try:
-                        Client_Sock.send(Response.encode('utf-8'))
-                    except (bluetooth.btcommon.BluetoothError, ConnectionResetError, OSError):
-                        print(f"[Handle_Client] Client lost during send: {Client_Info}")
-                        break
+                # Execute Everything This Read Completed
+                if not Self.Handle_Data(Session, Data):
+                    break
 
-        except (bluetooth.btcommon.BluetoothError, ConnectionResetError, OSError) as Error:
+        except Self.Transport.Errors as Error:
             # Client Connection Lost During Handshake Or Other Operation
             print(f"[Handle_Client] Client connection lost: {Client_Info} - {Error}")
         except Exception as Error:
@@ -744,6 +3339,14 @@ class BluetoothHIDServer:
             print(f"[ERR] Unexpected client error: {Error}")
             traceback.print_exc()
         finally:
+            # Writer Thread : Let Queued Keystrokes And Responses Finish Before Closing
+            if Self.Output is not None:
+                Self.Output.Drain()
+                Self.Output.Backpressure_Handler = None
+            Self.Report_Recording()
+            # Compiled Strings Are Keyed On The Typed Text (Passwords) : Gone With The Session
+            Self.Keyboard.Clear_Compiled_Cache()
+            Self.Stats.Observe("Session_Duration", time.monotonic() - Session_Start)
             # Always Close Client Socket When Done (Cleanup)
             try:
                 Client_Sock.close()
@@ -756,13 +3359,15 @@ class BluetoothHIDServer:
         if not Self.Initialize_Keyboard():
             print("[FATAL] Keyboard Init Failed.")
             return
-        # Initialize Bluetooth RFCOMM Server - Exit If Failed
-        if not Self.Setup_Bluetooth():
-            print("[FATAL] Bluetooth Init Failed.")
+        # Initialize Listening Transport (Bluetooth RFCOMM By Default) - Exit If Failed
+        if not Self.Setup_Transport():
+            print(f"[FATAL] {Self.Transport.Name} Init Failed.")
             return
 
+        Self.Start_Metrics_Exporter()
+
         # Log Server Startup Success and Supported Commands
-        print("[RFCOMM_SERVER] : Startup Successfully")
+        print(f"[RFCOMM_SERVER] : Startup Successfully ({Self.Transport.Describe()})")
         # Set Running Flag To True To Enable Main Loop
         Self.Running = True
 
@@ -770,23 +3375,17 @@ class BluetoothHIDServer:
             # Main Server Loop: Accept Incoming Bluetooth Connections
             while Self.Running:
                 try:
-                    # Block Until A Client Connects Via Bluetooth RFCOMM
+                    # Block Until A Client Connects (Bluetooth RFCOMM By Default)
                     print("[RFCOMM_SERVER] Waiting for connection...")
-                    Client_Sock, Client_Info = Self.Server_Sock.accept()
+                    Client_Sock, Client_Info = Self.Transport.Accept(Self.Server_Sock)
                     # Handle The Connected Client (Process Commands)
                     Self.Handle_Client(Client_Sock, Client_Info)
                     # After Client Disconnects, Loop Back To Accept Next Connection
                     print(f"[RFCOMM_SERVER] Session ended. Total connections: {Self.Total_Connections}")
-                except bluetooth.btcommon.BluetoothError as Error:
-                    # Bluetooth Accept Error - Continue Listening
+                except Self.Transport.Errors as Error:
+                    # Transport Accept Error - Continue Listening
                     if Self.Running:
-                        print(f"[RFCOMM_SERVER] Bluetooth error during accept: {Error}")
-                        time.sleep(1)
-                        continue
-                except OSError as Error:
-                    # OS-Level Socket Error - Continue Listening
-                    if Self.Running:
-                        print(f"[RFCOMM_SERVER] Socket error: {Error}")
+                        print(f"[RFCOMM_SERVER] {Self.Transport.Name} error during accept: {Error}")
                         time.sleep(1)
                         continue
         except KeyboardInterrupt:
@@ -797,12 +3396,288 @@ class BluetoothHIDServer:
         print("[SHUTDOWN] Cleaning Up...")
         
         Self.Running = False
+        Self.Write_Metrics()
         if Self.Keyboard:
             Self.Keyboard.Close_HID_Device()
         if Self.Server_Sock:
-            Self.Server_Sock.close()
+            Self.Transport.Close(Self.Server_Sock)
         sys.exit(0)
 
+"""
++============================================================================================================+
+| AsyncBluetoothHIDServer Class                                                                              |
+| Concurrent Client Sessions On One asyncio Loop - A Single Worker Arbitrates The HID Output                 |
++============================================================================================================+
+"""
+class AsyncBluetoothHIDServer(BluetoothHIDServer):
+
+    #Python Define
+    # Contention Policy : A Session Sends Work While Another Session's Work Is Still In Flight
+    # QUEUE   : Run It After The Other Session's Work (FIFO Across Sessions)
+    # REJECT  : Answer HID_BUSY, Nothing Is Executed
+    # PREEMPT : The Most Recently Connected Session Wins - Older Sessions' Queued Work Is Dropped (PREEMPTED),
+    #           Their Running Script Stops At The Next Action, Their New Work Is Answered HID_BUSY
+    CONTENTION_QUEUE = "QUEUE"
+    CONTENTION_REJECT = "REJECT"
+    CONTENTION_PREEMPT = "PREEMPT"
+    CONTENTION_POLICIES = (CONTENTION_QUEUE, CONTENTION_REJECT, CONTENTION_PREEMPT)
+    # Jobs In Flight Per Session Before Its Receive Loop Stops Reading (RFCOMM Flow Control Throttles The Client)
+    SESSION_JOB_LIMIT = 8
+
+    def __init__(Self, Contention_Policy="QUEUE", **Server_Options):
+        super().__init__(**Server_Options)
+        Self.Contention_Policy = Contention_Policy
+        Self.Loop = None
+        # Single Worker : Jobs Of Every Session Run One At A Time, In Submission Order
+        Self.HID_Executor = None
+        # Connected Sessions And Their Receive Tasks
+        Self.Sessions = []
+        Self.Client_Tasks = set()
+        Self.Session_Serial = 0
+
+    def Run(Self):
+        # Initialize HID Keyboard Device - Exit If Failed
+        if not Self.Initialize_Keyboard():
+            print("[FATAL] Keyboard Init Failed.")
+            return
+        # Initialize Listening Transport (Bluetooth RFCOMM By Default) - Exit If Failed
+        if not Self.Setup_Transport():
+            print(f"[FATAL] {Self.Transport.Name} Init Failed.")
+            return
+
+        Self.HID_Executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="HID_Session")
+        Self.Start_Metrics_Exporter()
+        print(f"[RFCOMM_SERVER] : Startup Successfully ({Self.Transport.Describe()}, Async, {Self.Contention_Policy} Contention Policy)")
+        Self.Running = True
+
+        try:
+            asyncio.run(Self.Accept_Loop())
+        except KeyboardInterrupt:
+            # Graceful Shutdown On Ctrl+C Interrupt
+            Self.Shutdown()
+
+    def Shutdown(Self):
+        if Self.HID_Executor is not None:
+            Self.HID_Executor.shutdown(wait=False, cancel_futures=True)
+        super().Shutdown()
+
+    async def Authenticate_Async(Self, Client_Sock, Client_Info):
+        """Authenticate Without Blocking The Event Loop (Other Sessions Keep Running)"""
+        Challenge, Expected = Self.Auth_Challenge()
+        try:
+            Client_Sock.send(Challenge.encode('utf-8'))
+            await asyncio.wait_for(Self.Wait_Readable(Client_Sock), Self.AUTH_TIMEOUT)
+            Data = Client_Sock.recv(1024)
+        except (asyncio.TimeoutError,) + tuple(Self.Transport.Errors):
+            Data = b''
+        return Self.Check_Auth(Client_Sock, Client_Info, Data, Expected)
+
+    async def Wait_Readable(Self, Sock):
+        """Suspend Until The Socket Is Readable - The Following recv / accept Does Not Block"""
+        Ready = Self.Loop.create_future()
+        File_No = Sock.fileno()
+        Self.Loop.add_reader(File_No, lambda: Ready.done() or Ready.set_result(None))
+        try:
+            await Ready
+        finally:
+            Self.Loop.remove_reader(File_No)
+
+    async def Accept_Loop(Self):
+        """Accept Clients For As Long As The Server Runs - Each Gets Its Own Receive Task"""
+        Self.Loop = asyncio.get_running_loop()
+        while Self.Running:
+            print("[RFCOMM_SERVER] Waiting for connection...")
+            await Self.Wait_Readable(Self.Server_Sock)
+            try:
+                Client_Sock, Client_Info = Self.Transport.Accept(Self.Server_Sock)
+            except Self.Transport.Errors as Error:
+                # Accept Error - Continue Listening
+                print(f"[RFCOMM_SERVER] Error during accept: {Error}")
+                await asyncio.sleep(1)
+                continue
+            Task = Self.Loop.create_task(Self.Serve_Client(Client_Sock, Client_Info))
+            Self.Client_Tasks.add(Task)
+            Task.add_done_callback(Self.Client_Tasks.discard)
+
+    def Session_Default_Layout(Self):
+        """KeyboardLayout Every New Session Starts From"""
+        try:
+            return Load_Layout(Self.Default_Layout)
+        except ValueError:
+            return Self.Keyboard.Layout
+
+    def Session_Default_Pacing(Self):
+        """(Profile_Name, Delays) Every New Session Starts From"""
+        try:
+            return Resolve_Pacing(Self.Default_Pacing)
+        except ValueError:
+            return (Self.Keyboard.Pacing_Profile, Self.Keyboard.Pacing)
+
+    async def Serve_Client(Self, Client_Sock, Client_Info):
+        """Per-Client Receive Loop - Every Received Chunk Becomes A Job On The HID Worker"""
+        print(f"[Handle_Client] CLIENT Connected: {Client_Info}")
+        Self.Total_Connections += 1
+
+        # Shared Secret : Checked Before The Session Exists (Unauthenticated Clients Never Reach The HID Worker)
+        if Self.Secret is not None and not await Self.Authenticate_Async(Client_Sock, Client_Info):
+            try:
+                Client_Sock.close()
+            except Exception:
+                pass
+            return
+
+        Self.Session_Serial += 1
+
+        Session = ClientSession(Client_Sock, Client_Info)
+        Session.Serial = Self.Session_Serial
+        Session.Pacing = Self.Session_Default_Pacing()
+        Session.Layout = Self.Session_Default_Layout()
+        Session.Job_Released = asyncio.Event()
+        Session.Task = asyncio.current_task()
+        # Field Contents Unknown Until Declared Or Cleared (In Order With The Jobs Already Queued)
+        Self.HID_Executor.submit(lambda: Self.Keyboard.Field.Forget())
+        Self.Sessions.append(Session)
+        Session_Start = time.monotonic()
+
+        try:
+            # Send Initial Handshake Message to Client Indicating Server is Ready
+            Client_Sock.send("READY_FOR_AUDIT".encode('utf-8'))
+
+            while Self.Running and Session.Alive:
+                await Self.Wait_Readable(Client_Sock)
+                try:
+                    Data = Client_Sock.recv(Session.Decoder.Recv_Size)
+                except Self.Transport.Errors:
+                    print(f"[Handle_Client] Client connection reset: {Client_Info}")
+                    break
+                if not Data:
+                    print(f"[Handle_Client] Client disconnected gracefully: {Client_Info}")
+                    break
+
+                if not Self.Admit_Job(Session):
+                    print(f"[Handle_Client] HID Busy With Another Session - Rejected: {Client_Info}")
+                    Self.Send_Message(Session, "HID_BUSY")
+                    continue
+
+                Session.Pending_Jobs += 1
+                Self.HID_Executor.submit(Self.Run_Session_Job, Session, Data)
+                while Session.Pending_Jobs >= Self.SESSION_JOB_LIMIT:
+                    Session.Job_Released.clear()
+                    await Session.Job_Released.wait()
+
+        except Self.Transport.Errors as Error:
+            # Client Connection Lost During Handshake Or Other Operation
+            print(f"[Handle_Client] Client connection lost: {Client_Info} - {Error}")
+        except Exception as Error:
+            print(f"[ERR] Unexpected client error: {Error}")
+            traceback.print_exc()
+        finally:
+            Self.Stats.Observe("Session_Duration", time.monotonic() - Session_Start)
+            Self.Sessions.remove(Session)
+            # Closed Once The Jobs Already Queued For This Session Ran
+            Self.HID_Executor.submit(Self.Close_Session, Session)
+
+    def Admit_Job(Self, Session):
+        """Apply The Contention Policy - True If The Session's New Job May Be Queued"""
+        # A Session Discarding An Aborted Script Types Nothing More : Never Busy, Always Admitted
+        # (A Rejected Chunk Could Hold The Script's ']' And Leave The Session Discarding For Good)
+        if Session.Stream is not None and Session.Stream.Discarding:
+            return True
+        Busy = [
+            Other for Other in Self.Sessions
+            if Other is not Session and (Other.Pending_Jobs or (Other.Stream is not None and not Other.Stream.Discarding))
+        ]
+        if not Busy or Self.Contention_Policy == Self.CONTENTION_QUEUE:
+            return True
+        if Self.Contention_Policy == Self.CONTENTION_REJECT:
+            return False
+
+        # PREEMPT : An Older Session Never Preempts A Newer One
+        if any(Other.Serial > Session.Serial for Other in Busy):
+            return False
+        for Other in Busy:
+            print(f"[Handle_Client] Session {Other.Info} Preempted By {Session.Info}")
+            Other.Preempted = True
+        Session.Preempting = True
+        Self.Abort_Event.set()
+        return True
+
+    def Run_Session_Job(Self, Session, Data):
+        """HID Worker : Execute One Received Chunk With The Session's Own Pacing And Backpressure Target"""
+        try:
+            if Session.Preempted:
+                # Queued Behind A Newer Session's Work : Dropped Unexecuted
+                Self.Drop_Stream_Data(Session, Data)
+                Self.Send_Message(Session, "PREEMPTED")
+                return
+            if Session.Preempting:
+                # Every Older Job Was Dropped Or Stopped By Now
+                Session.Preempting = False
+                Self.Abort_Event.clear()
+                if Self.Output is not None:
+                    Self.Output.Discard_Pending()
+
+            Self.Keyboard.Pacing_Profile, Self.Keyboard.Pacing = Session.Pacing
+            Self.Keyboard.Layout = Session.Layout
+            if Self.Output is not None:
+                Self.Output.Backpressure_Handler = lambda Blocked: Self.Send_Message(
+                    Session, "BUSY" if Blocked else "READY"
+                )
+            if not Self.Handle_Data(Session, Data):
+                Session.Alive = False
+            # PACING / LAYOUT Commands Stay Active For This Session Only
+            Session.Pacing = (Self.Keyboard.Pacing_Profile, Self.Keyboard.Pacing)
+            Session.Layout = Self.Keyboard.Layout
+        except Exception as Error:
+            print(f"[ERR] Unexpected client error: {Error}")
+            traceback.print_exc()
+        finally:
+            # With The Writer Thread A Job Lasts Until Its Queued Keystrokes Were Written
+            if Self.Output is not None:
+                Self.Output.Put_Call(Self.Loop.call_soon_threadsafe, Self.Job_Done, Session)
+            else:
+                Self.Loop.call_soon_threadsafe(Self.Job_Done, Session)
+
+    def Respond(Self, Session, Message):
+        """Writer Thread : A Preempted Session's Queued Responses Report PREEMPTED (Its Keystrokes Were Discarded)"""
+        if Self.Output is None:
+            return Self.Send_Message(Session, Message)
+        Self.Output.Put_Call(Self.Send_Queued_Response, Session, Message)
+        return True
+
+    def Send_Queued_Response(Self, Session, Message):
+        if Self.Output.Discarding and Session.Preempted:
+            Message = "PREEMPTED"
+        return Self.Send_Message(Session, Message)
+
+    def Job_Done(Self, Session):
+        """Event Loop : One Job Of The Session Finished"""
+        Session.Pending_Jobs -= 1
+        if Session.Pending_Jobs == 0:
+            Session.Preempted = False
+        Session.Job_Released.set()
+        # Client Gone Or Protocol Error : Stop Its Receive Loop
+        if not Session.Alive and not Session.Task.done():
+            Session.Task.cancel()
+
+    def Close_Session(Self, Session):
+        """HID Worker : Close The Client Socket After Its Queued Responses (And Drop The Compiled Strings)"""
+        if Self.Output is not None:
+            Self.Output.Put_Call(Self.Close_Socket, Session)
+        else:
+            Self.Close_Socket(Session)
+
+    def Close_Socket(Self, Session):
+        try:
+            Session.Sock.close()
+        except Exception:
+            pass
+        print(f"[Handle_Client] Connection cleaned up: {Session.Info}")
+        print(f"[RFCOMM_SERVER] Session ended. Total connections: {Self.Total_Connections}")
+        Self.Report_Recording()
+        # Compiled Strings Are Keyed On The Typed Text (Passwords) : Gone With The Session
+        Self.Keyboard.Clear_Compiled_Cache()
+
 """
 +============================================================================================================+
 | Test Sequence Logic                                                                                        |
@@ -903,7 +3778,7 @@ def Run_Test_Sequence(Test_Mode=False):
     Keyboard.Open_HID_Device()
 
     # Initialize Hardware Instance For LED and Buzzer Control
-    HW = Hardware()
+    HW = Hardware(Test_Mode=Test_Mode)
 
     # Delay Before Starting Test Sequence
     print("[COUNTDOWN] Starting Test In 3 Seconds...")
@@ -1021,6 +3896,102 @@ def Run_Test_Sequence(Test_Mode=False):
 # |                  | - Useful For Development And Debugging                   |
 # |                  | - Prints HID Reports To Console Instead Of Sending       |
 # +------------------+----------------------------------------------------------+
+# | --Sequencer MODE | Keyboard Report Sequencer (SINGLE Or ROLLOVER)           |
+# |                  | - SINGLE : Press + Release Report Per Key (Default)      |
+# |                  | - ROLLOVER : Overlap Keys In The Six Boot Report Slots   |
+# |                  | - ROLLOVER Roughly Halves Reports And Typing Time        |
+# +------------------+----------------------------------------------------------+
+# | --Pacing PROFILE | Default Keystroke Pacing (BIOS, UEFI, OS_FAST, HOST_SYNC)|
+# |                  | - BIOS : Slowest, Safest Timings (Default)               |
+# |                  | - Sessions May Switch With The PACING JSON Command       |
+# +------------------+----------------------------------------------------------+
+# | --Layout NAME    | Default Keyboard Layout Of The Host (US, UK, DE, FR, JIS)|
+# |                  | - US : Default, Must Match The Host's Layout Setting     |
+# |                  | - Dead Keys And AltGr Characters Typed As On The Host    |
+# |                  | - Sessions May Switch With The LAYOUT JSON Command       |
+# +------------------+----------------------------------------------------------+
+# | --Layout-File P  | Add Layout Definitions From A JSON File (Repeatable)     |
+# |                  | - {"Layouts": {"NAME": {"Rows": ..., "Dead": ...}}}      |
+# |                  | - Format As HID_Layouts.LAYOUTS                          |
+# +------------------+----------------------------------------------------------+
+# | --Writer MODE    | HID Writer (BLOCKING Or POLL)                            |
+# |                  | - BLOCKING : Blocking write() + Sleep-And-Retry (Default)|
+# |                  | - POLL : Non-Blocking + poll(), Paced By The Host Poll   |
+# |                  | - POLL Pairs With --Pacing HOST_SYNC                     |
+# +------------------+----------------------------------------------------------+
+# | --WriterThread   | Dedicated HID Writer Thread With A Bounded Report Queue  |
+# |                  | - Socket Keeps Receiving While Keys Are Typed            |
+# |                  | - Sends BUSY / READY While The Queue Is Full             |
+# +------------------+----------------------------------------------------------+
+# | --Realtime       | Real-Time HID Output For Hosts That Drop Uneven Keys     |
+# |                  | - Implies --WriterThread : Deadline Sleeps + Spin Tail   |
+# |                  | - GC Held Off During Bursts, Report_Jitter In STATS      |
+# |                  | - SCHED_FIFO Needs root / CAP_SYS_NICE (Else Logged)     |
+# +------------------+----------------------------------------------------------+
+# | --RT-Priority N  | SCHED_FIFO Priority Of The Writer Thread (Default 10)    |
+# |                  | - 0 : Normal Scheduling, Spin Tail / GC Still Apply      |
+# +------------------+----------------------------------------------------------+
+# | --RT-CPU N       | Pin The Writer Thread To CPU N (e.g. An isolcpus Core)   |
+# +------------------+----------------------------------------------------------+
+# | --RT-Spin MS     | Busy-Waited Tail Of Every Keystroke Sleep (Default 1.0)  |
+# +------------------+----------------------------------------------------------+
+# | --Execution MODE | Script Execution (INTERPRET Or TIMELINE)                 |
+# |                  | - INTERPRET : Action By Action (Default)                 |
+# |                  | - TIMELINE : Validate + Compile First, Absolute Deadlines|
+# |                  | - Invalid Scripts Answered With AUDIT_REJECTED:<Reason>  |
+# +------------------+----------------------------------------------------------+
+# | --Stream         | Execute JSON Scripts While They Are Still Arriving       |
+# |                  | - RAW Sessions With INTERPRET Execution Only             |
+# |                  | - Scripts May Span Any Number Of RFCOMM Reads            |
+# |                  | - Best Combined With --WriterThread                      |
+# +------------------+----------------------------------------------------------+
+# | --Async          | asyncio Server With Concurrent Client Sessions           |
+# |                  | - Reconnecting Clients Never Wait For A Stale Session    |
+# |                  | - One HID Worker Runs Every Session's Jobs In Order      |
+# +------------------+----------------------------------------------------------+
+# | --Contention POL | Async HID Contention Policy (QUEUE, REJECT, PREEMPT)     |
+# |                  | - QUEUE : Run After The Other Session's Work (Default)   |
+# |                  | - REJECT : Answer HID_BUSY                               |
+# |                  | - PREEMPT : Newest Connection Wins, Older Work Dropped   |
+# +------------------+----------------------------------------------------------+
+# | --Transport NAME | Listening Transport (RFCOMM, TCP, UNIX)                  |
+# |                  | - RFCOMM : Bluetooth Classic Serial Port (Default)       |
+# |                  | - TCP : Wi-Fi / LAN, Far Faster For Bulk Scripts         |
+# |                  | - UNIX : Local Socket For On-Device Tools And Benchmarks |
+# +------------------+----------------------------------------------------------+
+# | --Listen ADDRESS | Transport Address                                        |
+# |                  | - RFCOMM : Channel (Default 1)                           |
+# |                  | - TCP : [Host:]Port (Default 127.0.0.1:8765)             |
+# |                  | - TCP On The LAN : 0.0.0.0:8765 With --Secret-File       |
+# |                  | - UNIX : Socket Path (Default /run/bluetooth_hid.sock)   |
+# +------------------+----------------------------------------------------------+
+# | --Secret-File P  | Shared Secret Every Client Must Prove (HMAC Challenge)   |
+# |                  | - AUTH_CHALLENGE:<Nonce> -> AUTH:<HMAC-SHA256 Hex>       |
+# |                  | - Secret Never Crosses The Link, Wrong Answer : Closed   |
+# +------------------+----------------------------------------------------------+
+# | --Device PATH    | HID Device Path (Default /dev/hidg0)                     |
+# |                  | - A FIFO Stands In For The Gadget Without Hardware       |
+# +------------------+----------------------------------------------------------+
+# | --Record [N]     | Record Up To N Reports In Memory Instead Of Writing Them |
+# |                  | - Decoded Summary Printed At The End Of Every Session    |
+# |                  | - Text Length, Stuck Keys, Chars/s, Inter-Report Jitter  |
+# |                  | - --Record-Text : Print The Typed Text (Debugging Only)  |
+# +------------------+----------------------------------------------------------+
+# | --Decode PATH    | Host-Side Decoder For Reports Written To A FIFO / File   |
+# +------------------+----------------------------------------------------------+
+# | --Metrics-File P | Prometheus Textfile With Latency Histograms / Counters   |
+# |                  | - Per-Command Latency, WAIT Drift, Sessions, EAGAIN      |
+# |                  | - Same Data Over The Socket : Send STATS                 |
+# +------------------+----------------------------------------------------------+
+# | --Trace MODE     | Per-Action Start / End Timestamps With AUDIT_COMPLETE    |
+# |                  | - JSON : AUDIT_COMPLETE:TRACE:{...}                      |
+# |                  | - ZLIB : AUDIT_COMPLETE:TRACE_ZLIB:<base64>              |
+# +------------------+----------------------------------------------------------+
+# | --Calibrate [P]  | Measure Real Key / Action Costs For The Timing Model     |
+# |                  | - Types And Backspaces Text : Focus A Scratch Field      |
+# |                  | - Fitted For --Pacing, Stored In HID_Timing_Calibration  |
+# |                  | - Backend estimated_duration Reads The Same File         |
+# +------------------+----------------------------------------------------------+
 #
 # Examples:
 #   python3 Bluetooth_HID_Server.py                  # Default: Run Server Mode
@@ -1028,6 +3999,22 @@ def Run_Test_Sequence(Test_Mode=False):
 #   python3 Bluetooth_HID_Server.py --Test           # Run Hardware Test Sequence
 #   python3 Bluetooth_HID_Server.py --TestMode       # Run Server Without HID Output
 #   python3 Bluetooth_HID_Server.py --Test --TestMode # Run Test Without HID Output
+#   python3 Bluetooth_HID_Server.py --Sequencer ROLLOVER # Run Server With Rollover Typing
+#   python3 Bluetooth_HID_Server.py --Pacing OS_FAST # Run Server With OS Login Pacing
+#   python3 Bluetooth_HID_Server.py --Writer POLL --Pacing HOST_SYNC # Host-Poll-Paced Output
+#   python3 Bluetooth_HID_Server.py --Layout DE      # Host Uses A German Keyboard Layout
+#   python3 Bluetooth_HID_Server.py --WriterThread   # Pipeline Commands While Typing
+#   python3 Bluetooth_HID_Server.py --Realtime --RT-CPU 3 # Even Key Spacing For BIOS Prompts
+#   python3 Bluetooth_HID_Server.py --Execution TIMELINE # Drift-Free Compiled Scripts
+#   python3 Bluetooth_HID_Server.py --Stream --WriterThread # Type While The Script Arrives
+#   python3 Bluetooth_HID_Server.py --Async --Contention PREEMPT # Reconnects Take Over
+#   python3 Bluetooth_HID_Server.py --Transport TCP --Listen 0.0.0.0:8765 --Secret-File /etc/hid_secret # Wi-Fi
+#   python3 Bluetooth_HID_Server.py --Transport UNIX --TestMode # Local Socket, No HID
+#   python3 Bluetooth_HID_Server.py --Transport UNIX --Record # Measure Output Without HID
+#   python3 Bluetooth_HID_Server.py --Decode /tmp/hidg # Decode A Server Using --Device /tmp/hidg
+#   python3 Bluetooth_HID_Server.py --Metrics-File /var/lib/node_exporter/hid.prom # Field Metrics
+#   python3 Bluetooth_HID_Server.py --Trace ZLIB # Compressed Trace For Video Alignment
+#   python3 Bluetooth_HID_Server.py --Calibrate --Pacing BIOS # Measure Key Costs For estimated_duration
 #
 # ==============================================================================
 
@@ -1045,6 +4032,22 @@ Examples:
   python3 Bluetooth_HID_Server.py --Test           # Run Hardware Test Sequence
   python3 Bluetooth_HID_Server.py --TestMode       # Run Server Without HID Output
   python3 Bluetooth_HID_Server.py --Test --TestMode # Run Test Without HID Output
+  python3 Bluetooth_HID_Server.py --Sequencer ROLLOVER # Run Server With Rollover Typing
+  python3 Bluetooth_HID_Server.py --Pacing OS_FAST # Run Server With OS Login Pacing
+  python3 Bluetooth_HID_Server.py --Writer POLL --Pacing HOST_SYNC # Host-Poll-Paced Output
+  python3 Bluetooth_HID_Server.py --Layout DE      # Host Uses A German Keyboard Layout
+  python3 Bluetooth_HID_Server.py --WriterThread   # Pipeline Commands While Typing
+  python3 Bluetooth_HID_Server.py --Realtime --RT-CPU 3 # Even Key Spacing For BIOS Prompts
+  python3 Bluetooth_HID_Server.py --Execution TIMELINE # Drift-Free Compiled Scripts
+  python3 Bluetooth_HID_Server.py --Stream --WriterThread # Type While The Script Arrives
+  python3 Bluetooth_HID_Server.py --Async --Contention PREEMPT # Reconnects Take Over
+  python3 Bluetooth_HID_Server.py --Transport TCP --Listen 0.0.0.0:8765 --Secret-File /etc/hid_secret # Wi-Fi
+  python3 Bluetooth_HID_Server.py --Transport UNIX --TestMode # Local Socket, No HID
+  python3 Bluetooth_HID_Server.py --Transport UNIX --Record # Measure Output Without HID
+  python3 Bluetooth_HID_Server.py --Decode /tmp/hidg # Decode A Server Using --Device /tmp/hidg
+  python3 Bluetooth_HID_Server.py --Metrics-File /var/lib/node_exporter/hid.prom # Field Metrics
+  python3 Bluetooth_HID_Server.py --Trace ZLIB # Compressed Trace For Video Alignment
+  python3 Bluetooth_HID_Server.py --Calibrate --Pacing BIOS # Measure Key Costs For estimated_duration
 
 Supported JSON Commands:
   HID        - Press Keyboard Keys (UP, DOWN, LEFT, RIGHT, ENTER, etc.)
@@ -1054,6 +4057,29 @@ Supported JSON Commands:
   LED        - Control LEDs (Red, Yellow, Blue, White)
   BEEP       - Control Buzzer (Short, Long Pattern)
   WAIT       - Wait/Sleep For Specified Seconds
+  PACING     - Select Keystroke Pacing Profile (BIOS, UEFI, OS_FAST, CUSTOM)
+  LAYOUT     - Select The Host Keyboard Layout (US, UK, DE, FR, JIS)
+  FIELD      - Declare The Focused Field's Contents (DELETE_ROW Then Clears Exactly)
+
+Compact action_code (Forwarded Verbatim From The Backend):
+  H"text";W2.3;D6;K"UP"  - Type, Wait, Backspace x N, Press Key
+
+Protocol Framing:
+  Answer READY_FOR_AUDIT With FRAMING:LENGTH (4-Byte Big-Endian Length Prefix)
+  Or FRAMING:LINE (Newline-Delimited) To Send Scripts Of Any Size And Several
+  Messages Per Read. Without Negotiation Every Read Is One Message (RAW).
+
+Control Messages:
+  STATS      - Answered With STATS:<JSON> (Counters, Latency Percentiles)
+
+Authentication (--Secret-File):
+  AUTH_CHALLENGE:<Nonce> Is Sent Before READY_FOR_AUDIT - Answer AUTH:<Hex
+  HMAC-SHA256(Secret, Nonce)>. A Wrong Or Late Answer Gets AUTH_FAILED And Is Closed.
+
+Concurrent Sessions (--Async):
+  HID_BUSY   - Work Refused, Another Session Owns The HID (REJECT / PREEMPT)
+  PREEMPTED  - Queued Work Dropped, A Newer Session Took The HID (PREEMPT)
+  AUDIT_ABORTED:PREEMPTED - Running Script Stopped At The Next Action (PREEMPT)
         """
     )
 
@@ -1078,11 +4104,217 @@ Supported JSON Commands:
         help='Enable Test Mode - Simulate HID Without Actual /dev/hidg0 Output'
     )
 
+    # --Sequencer : Keyboard Report Sequencer Mode
+    Parser.add_argument(
+        '--Sequencer',
+        choices=RaspberryKeyboard.SEQUENCE_MODES,
+        default=RaspberryKeyboard.SEQUENCE_SINGLE,
+        help='Keyboard Report Sequencer - SINGLE (Press/Release Per Key) Or ROLLOVER (6-Key Rollover)'
+    )
+
+    # --Pacing : Default Keystroke Pacing Profile
+    Parser.add_argument(
+        '--Pacing',
+        choices=tuple(PACING_PROFILES),
+        default=DEFAULT_PACING_PROFILE,
+        help='Default Keystroke Pacing Profile - BIOS (Safest), UEFI, OS_FAST Or HOST_SYNC'
+    )
+
+    # --Layout : Default Keyboard Layout Of The Host
+    Parser.add_argument(
+        '--Layout',
+        type=str.upper,
+        default=DEFAULT_LAYOUT,
+        metavar='NAME',
+        help=f'Keyboard Layout The Host Is Set To - {", ".join(Layout_Names())} Or One From --Layout-File (Default {DEFAULT_LAYOUT})'
+    )
+
+    # --Layout-File : Additional Layout Definitions
+    Parser.add_argument(
+        '--Layout-File',
+        action='append',
+        default=[],
+        metavar='PATH',
+        help='Register The Keyboard Layouts Of A JSON File ({"Layouts": {...}}, Format As HID_Layouts.LAYOUTS)'
+    )
+
+    # --Writer : HID Writer Mode
+    Parser.add_argument(
+        '--Writer',
+        choices=RaspberryKeyboard.WRITER_MODES,
+        default=RaspberryKeyboard.WRITER_BLOCKING,
+        help='HID Writer - BLOCKING (Sleep-And-Retry) Or POLL (Synchronized To The Host Poll)'
+    )
+
+    # --WriterThread : Dedicated HID Writer Thread
+    Parser.add_argument(
+        '--WriterThread',
+        action='store_true',
+        help='Run Keyboard Output On A Dedicated Writer Thread (Pipelined Commands, BUSY/READY Backpressure)'
+    )
+
+    # --Realtime : Real-Time HID Output
+    Parser.add_argument(
+        '--Realtime',
+        action='store_true',
+        help='Real-Time HID Output - Writer Thread With Deadline Sleeps, Spin Tail And GC Held Off During Bursts (Implies --WriterThread)'
+    )
+
+    # --RT-Priority : SCHED_FIFO Priority Of The Writer Thread
+    Parser.add_argument(
+        '--RT-Priority',
+        type=int,
+        default=RealtimePacer.DEFAULT_PRIORITY,
+        metavar='N',
+        help=f'SCHED_FIFO Priority Of The Writer Thread With --Realtime (1-99, 0 : Normal Scheduling, Default {RealtimePacer.DEFAULT_PRIORITY})'
+    )
+
+    # --RT-CPU : Writer Thread CPU Affinity
+    Parser.add_argument(
+        '--RT-CPU',
+        type=int,
+        metavar='N',
+        help='Pin The Writer Thread To CPU N With --Realtime (Best A Core Kept Free With isolcpus=N)'
+    )
+
+    # --RT-Spin : Busy-Waited Sleep Tail
+    Parser.add_argument(
+        '--RT-Spin',
+        type=float,
+        default=RealtimePacer.DEFAULT_SPIN_TAIL * 1000,
+        metavar='MS',
+        help=f'Busy-Wait The Last MS Milliseconds Of Every Keystroke Sleep With --Realtime (Default {RealtimePacer.DEFAULT_SPIN_TAIL * 1000})'
+    )
+
+    # --Execution : Script Execution Mode
+    Parser.add_argument(
+        '--Execution',
+        choices=BluetoothHIDServer.EXECUTION_MODES,
+        default=BluetoothHIDServer.EXECUTION_INTERPRET,
+        help='Script Execution - INTERPRET (Action By Action) Or TIMELINE (Validated, Absolute Deadlines)'
+    )
+
+    # --Stream : Streaming Execution Of JSON Scripts
+    Parser.add_argument(
+        '--Stream',
+        action='store_true',
+        help='Execute JSON Scripts While They Are Still Arriving (RAW Sessions, INTERPRET Execution)'
+    )
+
+    # --Async : asyncio Server With Concurrent Client Sessions
+    Parser.add_argument(
+        '--Async',
+        action='store_true',
+        help='Serve Several Clients Concurrently (asyncio) - HID Output Arbitrated By --Contention'
+    )
+
+    # --Contention : Async Session Contention Policy
+    Parser.add_argument(
+        '--Contention',
+        choices=AsyncBluetoothHIDServer.CONTENTION_POLICIES,
+        default=AsyncBluetoothHIDServer.CONTENTION_QUEUE,
+        help='Sessions Competing For The HID - QUEUE (In Order), REJECT (HID_BUSY) Or PREEMPT (Newest Wins)'
+    )
+
+    # --Transport : Listening Transport
+    Parser.add_argument(
+        '--Transport',
+        choices=tuple(TRANSPORTS),
+        default="RFCOMM",
+        help='Listening Transport - RFCOMM (Bluetooth, Default), TCP (Wi-Fi / LAN) Or UNIX (Local Tools)'
+    )
+
+    # --Listen : Transport Address
+    Parser.add_argument(
+        '--Listen',
+        metavar='ADDRESS',
+        help=f'RFCOMM Channel, TCP [Host:]Port (Default {TCPTransport.DEFAULT_HOST}:{TCPTransport.DEFAULT_PORT}, 0.0.0.0 For The LAN) '
+             f'Or UNIX Socket Path (Default {UnixTransport.DEFAULT_PATH})'
+    )
+
+    # --Secret-File : Shared-Secret Client Authentication
+    Parser.add_argument(
+        '--Secret-File',
+        metavar='PATH',
+        help='File Holding A Shared Secret - Clients Must Answer An HMAC-SHA256 Challenge Before Their Session Starts'
+    )
+
+    # --Device : HID Device Path Override
+    Parser.add_argument(
+        '--Device',
+        metavar='PATH',
+        help='HID Device Path (Default /dev/hidg0) - e.g. A FIFO Read By --Decode On The Same Box'
+    )
+
+    # --Record : In-Memory Recording Sink
+    Parser.add_argument(
+        '--Record',
+        nargs='?',
+        type=int,
+        const=RecordingHIDSink.DEFAULT_CAPACITY,
+        default=0,
+        metavar='REPORTS',
+        help='Record Reports In Memory Instead Of Writing Them, Print A Decoded Summary Per Session'
+    )
+
+    # --Record-Text : Typed Text In The Recording Summary
+    Parser.add_argument(
+        '--Record-Text',
+        action='store_true',
+        help='Print The Decoded Text With --Record (Debugging Only - Typed Passwords End Up In The Log)'
+    )
+
+    # --Decode : Host-Side Report Decoder
+    Parser.add_argument(
+        '--Decode',
+        metavar='PATH',
+        help='Read Reports From A FIFO / Capture File And Print What The Host Would See (JSON)'
+    )
+
+    # --Metrics-File : Prometheus Textfile Export
+    Parser.add_argument(
+        '--Metrics-File',
+        metavar='PATH',
+        help='Export Latency Histograms And Write Counters As A Prometheus Textfile (Rewritten Every 10s)'
+    )
+
+    # --Trace : Execution Trace With AUDIT_COMPLETE
+    Parser.add_argument(
+        '--Trace',
+        type=str.upper,
+        choices=ExecutionTrace.TRACE_MODES,
+        help='Return A Per-Action Timestamp Trace With AUDIT_COMPLETE (ZLIB : Compressed, Base64)'
+    )
+
+    # --Calibrate : Timing Model Calibration
+    Parser.add_argument(
+        '--Calibrate',
+        nargs='?',
+        const='',
+        metavar='PATH',
+        help=f'Measure Real Keystroke / Action Costs With --Pacing And Store Them For The Timing Model (Default {Calibration_Path()})'
+    )
+
     # Parse Command Line Arguments
     Args = Parser.parse_args()
 
+    # Custom Layouts First, Then Compile The Default Layout Once Up Front (Unknown Names Fail Here, Not Per Session)
+    try:
+        for Layout_Path in Args.Layout_File:
+            print(f"[LAYOUT] {Layout_Path}: {', '.join(Load_Layout_File(Layout_Path))}")
+        Load_Layout(Args.Layout)
+    except (ValueError, OSError) as Error:
+        Parser.error(f"--Layout / --Layout-File : {Error}")
+
+    # Real-Time Output : Pacer Applied To The Writer Thread Once It Starts
+    Realtime = None
+    if Args.Realtime:
+        if not 0 <= Args.RT_Priority <= 99:
+            Parser.error(f"--RT-Priority : {Args.RT_Priority} Outside 0-99")
+        Realtime = RealtimePacer(Priority=Args.RT_Priority or None, CPU=Args.RT_CPU, Spin_Tail=Args.RT_Spin / 1000)
+
     # Determine If Running In Test Mode (No Actual HID Hardware)
-    Test_Mode_Enabled = Args.TestMode or not os.path.exists('/dev/hidg0')
+    Test_Mode_Enabled = Args.TestMode or not os.path.exists(Args.Device or '/dev/hidg0')
 
     # Log Current Mode Status
     print("=" * 60)
@@ -1092,6 +4324,9 @@ Supported JSON Commands:
         print("[MODE] Test Mode Enabled - No Actual HID Output")
     else:
         print("[MODE] Live Mode - HID Output To /dev/hidg0")
+    if Realtime is not None:
+        print(f"[MODE] Real-Time HID Output - SCHED_FIFO {Realtime.Priority or 'Off'}, "
+              f"CPU {'Any' if Realtime.CPU is None else Realtime.CPU}, Spin Tail {Realtime.Spin_Tail * 1000:.2f} ms")
     print("=" * 60)
 
     # Execute Based On Selected Mode
@@ -1099,15 +4334,66 @@ Supported JSON Commands:
         # Run Hardware Test Sequence
         print("[ACTION] Running HID Hardware Test Sequence...")
         Run_Test_Sequence(Test_Mode=Test_Mode_Enabled)
+    elif Args.Decode:
+        # Decode Reports Written By A Server Running With --Device <FIFO>
+        print(f"[ACTION] Decoding HID Reports From {Args.Decode} (Ctrl+C To Stop)...")
+        Summary = Decode_HID_Stream(Args.Decode, RaspberryKeyboard(Test_Mode=True).Char_map, Layout=Load_Layout(Args.Layout))
+        print(json.dumps(Summary, indent=2))
+    elif Args.Calibrate is not None:
+        # Time Real Actions On This Pi And Update The Shared Timing Model (Types Into The Focused Field)
+        print("[ACTION] Calibrating The Timing Model...")
+        Server = BluetoothHIDServer(Test_Mode=Test_Mode_Enabled, Sequence_Mode=Args.Sequencer, Pacing=Args.Pacing,
+                                    Writer_Mode=Args.Writer, Writer_Thread=Args.WriterThread, HID_Device=Args.Device,
+                                    Layout=Args.Layout, Realtime=Realtime)
+        Server.Calibrate(Args.Calibrate or None)
     else:
-        # Run Bluetooth RFCOMM Server (Default Mode)
-        print("[ACTION] Starting Bluetooth RFCOMM Server...")
-        
+        # Run Server (Default Mode, Bluetooth RFCOMM Unless --Transport Given)
+        try:
+            Transport = Make_Transport(Args.Transport, Args.Listen)
+        except ValueError as Error:
+            Parser.error(f"--Listen : {Error}")
+        print(f"[ACTION] Starting {Transport.Describe()} Server...")
+
+        # Shared Secret : Read Once, Never Logged
+        Secret = None
+        if Args.Secret_File:
+            try:
+                with open(Args.Secret_File, 'rb') as Secret_File:
+                    Secret = Secret_File.read().strip()
+            except OSError as Error:
+                Parser.error(f"--Secret-File : {Error}")
+            if not Secret:
+                Parser.error(f"--Secret-File : {Args.Secret_File} Is Empty")
+        elif Transport.Name == "TCP" and not Transport.Is_Loopback():
+            print(f"[WARN] {Transport.Describe()} Without --Secret-File : Anyone On This Network Can Type Into The Host")
+
         # Force Bluetooth Hardware State For RPi Zero 2 W
-        os.system("hciconfig hci0 up")
-        os.system("hciconfig hci0 piscan")
-        time.sleep(1)
+        if Transport.Name == "RFCOMM":
+            os.system("hciconfig hci0 up")
+            os.system("hciconfig hci0 piscan")
+            time.sleep(1)
 
         # Initialize And Run Server
-        Server = BluetoothHIDServer(Test_Mode=Test_Mode_Enabled)
+        Server_Options = dict(
+            Test_Mode=Test_Mode_Enabled,
+            Sequence_Mode=Args.Sequencer,
+            Pacing=Args.Pacing,
+            Layout=Args.Layout,
+            Writer_Mode=Args.Writer,
+            Writer_Thread=Args.WriterThread,
+            Realtime=Realtime,
+            Execution_Mode=Args.Execution,
+            Stream_Scripts=Args.Stream,
+            Transport=Transport,
+            HID_Device=Args.Device,
+            Record_Capacity=Args.Record,
+            Record_Text=Args.Record_Text,
+            Metrics_File=Args.Metrics_File,
+            Trace_Mode=Args.Trace,
+            Secret=Secret
+        )
+        if Args.Async:
+            Server = AsyncBluetoothHIDServer(Contention_Policy=Args.Contention, **Server_Options)
+        else:
+            Server = BluetoothHIDServer(**Server_Options)
         Server.Run()
\ No newline at end of file
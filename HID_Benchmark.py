@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+
+"""
++============================================================================================================+
+| HID Benchmark Suite                                                                                        |
+| - Hardware-Free Performance Measurements For The Keystroke, Script And Backend Hot Paths                   |
+|                                                                                                            |
+| Instructions:                                                                                              |
+| 1. python3 HID_Benchmark.py                          # Print JSON Results                                  |
+| 2. python3 HID_Benchmark.py --Output Base.json       # Save Results (e.g. Before A Change)                  |
+| 3. python3 HID_Benchmark.py --Compare Base.json      # Compare This Tree Against Saved Results             |
+|                                                                                                            |
+| Stubs : gpiozero (LED / Buzzer), boto3 (DynamoDB Client), /dev/hidg0 (RecordingHIDSink)                    |
+| COLD_START : Fresh Processes, Real boto3 (When Installed) Against A Local DynamoDB Stand-In                |
+| Intentional Waits (Pacing, WAIT, LED / Buzzer Durations) Are Recorded, Not Slept :                         |
+| Every Timing Below Is Pure Software Overhead                                                               |
++============================================================================================================+
+"""
+
+" Python Imports "
+import sys
+import os
+import io
+import json
+import time
+import types
+import random
+import string
+import platform
+import statistics
+import subprocess
+import contextlib
+import threading
+import http.server
+import importlib.machinery
+
+"""
++============================================================================================================+
+| Hardware & Cloud Stubs                                                                                     |
+| Installed Before The Repo Modules Are Imported - Benchmarks Never Touch GPIO Pins Or AWS                   |
++============================================================================================================+
+"""
+class StubPin:
+    """gpiozero LED / Buzzer Stand-In"""
+    def __init__(Self, Pin):
+        Self.Pin = Pin
+        Self.is_active = False
+
+    def on(Self):
+        Self.is_active = True
+
+    def off(Self):
+        Self.is_active = False
+
+    def close(Self):
+        pass
+
+class StubClientError(Exception):
+    """botocore ClientError Stand-In (Error Code In .response)"""
+    def __init__(Self, Code):
+        super().__init__(Code)
+        Self.response = {"Error": {"Code": Code}}
+
+class StubDynamoDBClient:
+    """Low-Level DynamoDB Client Stand-In - Keeps Written Items In Memory, Counts Would-Be Round Trips"""
+    def __init__(Self):
+        Self.Items = {}
+        Self.Round_Trips = 0
+
+    def put_item(Self, TableName, Item, **Options):
+        Self.Round_Trips += 1
+        Key = (TableName, Item["session_id"]["S"])
+        # Only The Backend's attribute_not_exists(session_id) Condition Is Modelled
+        if "ConditionExpression" in Options and Key in Self.Items:
+            raise StubClientError("ConditionalCheckFailedException")
+        Self.Items[Key] = Item
+        return {}
+
+    def batch_write_item(Self, RequestItems, **Options):
+        Self.Round_Trips += 1
+        for TableName, Requests in RequestItems.items():
+            for Request in Requests:
+                Item = Request["PutRequest"]["Item"]
+                Self.Items[(TableName, Item["session_id"]["S"])] = Item
+        return {"UnprocessedItems": {}}
+
+def Install_Stubs():
+    Gpiozero = types.ModuleType("gpiozero")
+    Gpiozero.LED = StubPin
+    Gpiozero.Buzzer = StubPin
+    sys.modules["gpiozero"] = Gpiozero
+
+    Boto3 = types.ModuleType("boto3")
+    Boto3.DynamoDB = StubDynamoDBClient()
+    Boto3.client = lambda Service_Name, **Options: Boto3.DynamoDB
+    sys.modules["boto3"] = Boto3
+
+class LocalDynamoDBHandler(http.server.BaseHTTPRequestHandler):
+    """DynamoDB JSON Protocol (PutItem / BatchWriteItem) Served From A StubDynamoDBClient"""
+    def do_POST(Self):
+        Operation = Self.headers.get("X-Amz-Target", "").rpartition('.')[2]
+        Request = json.loads(Self.rfile.read(int(Self.headers.get("Content-Length", 0))) or b"{}")
+        try:
+            if Operation == "PutItem":
+                Status, Body = 200, Self.server.Client.put_item(**Request)
+            elif Operation == "BatchWriteItem":
+                Status, Body = 200, Self.server.Client.batch_write_item(**Request)
+            else:
+                Status, Body = 400, {"__type": "com.amazonaws.dynamodb.v20120810#UnknownOperationException"}
+        except StubClientError as Error:
+            Status, Body = 400, {"__type": f"com.amazonaws.dynamodb.v20120810#{Error.response['Error']['Code']}"}
+        Payload = json.dumps(Body).encode('utf-8')
+        Self.send_response(Status)
+        Self.send_header("Content-Type", "application/x-amz-json-1.0")
+        Self.send_header("Content-Length", str(len(Payload)))
+        Self.end_headers()
+        Self.wfile.write(Payload)
+
+    def log_message(Self, Format, *Args):
+        pass
+
+class LocalDynamoDB(http.server.ThreadingHTTPServer):
+    """Local DynamoDB Stand-In On 127.0.0.1 (Real boto3 Talks To It Through DYNAMODB_ENDPOINT)"""
+    def __init__(Self):
+        super().__init__(("127.0.0.1", 0), LocalDynamoDBHandler)
+        Self.Client = StubDynamoDBClient()
+        Self.Endpoint = f"http://127.0.0.1:{Self.server_address[1]}"
+
+    def __enter__(Self):
+        threading.Thread(target=Self.serve_forever, daemon=True).start()
+        return Self
+
+    def __exit__(Self, *Exception_Info):
+        Self.shutdown()
+        Self.server_close()
+
+class WaitRecorder:
+    """
+    Stands In For The time Module Of A Benchmarked Module : sleep() Is Recorded, Not Slept
+    monotonic() Advances By Every Recorded Sleep, So Deadline Schedulers See Their Waits Elapse
+    """
+    def __init__(Self):
+        Self.Requested = 0.0
+
+    def __getattr__(Self, Name):
+        return getattr(time, Name)
+
+    def sleep(Self, Seconds):
+        Self.Requested += max(0.0, Seconds)
+
+    def monotonic(Self):
+        return time.monotonic() + Self.Requested
+
+Install_Stubs()
+
+# Repo Modules (Imported After The Stubs)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import Bluetooth_HID_Server as Server
+import AuditableHID_Backend as Backend
+
+# Every Module-Level time.sleep() Of The Server Is Virtual From Here On
+Waits = WaitRecorder()
+Server.time = Waits
+
+"""
++============================================================================================================+
+| Benchmarks                                                                                                 |
+| Each Returns {Case: {Metric: Value}} - Best Of --Repeat Runs Unless Named Otherwise                        |
++============================================================================================================+
+"""
+BENCHMARKS = ("TYPE_STRING", "AUDIT", "ACTIONS", "BACKEND", "COLD_START")
+
+def Quiet():
+    """Server Log Lines Would Dominate The Timings - Send Them Nowhere"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+def Timed(Function, Repeat, Before=None):
+    """Run Function Repeat Times, Return [Seconds, ...] (Before Runs Untimed Ahead Of Each Run)"""
+    Timings = []
+    for Iteration in range(Repeat):
+        if Before:
+            Before()
+        Start = time.perf_counter()
+        Function()
+        Timings.append(time.perf_counter() - Start)
+    return Timings
+
+def Make_Server(Execution_Mode="INTERPRET"):
+    Benchmark_Server = Server.BluetoothHIDServer(
+        Test_Mode=True,
+        Pacing="HOST_SYNC",
+        Execution_Mode=Execution_Mode,
+        Record_Capacity=Server.RecordingHIDSink.DEFAULT_CAPACITY
+    )
+    with Quiet():
+        Benchmark_Server.Initialize_Keyboard()
+    return Benchmark_Server
+
+def Bench_Type_String(Repeat, Text_Length=4096):
+    """Type_String Report Generation Rate, Cold (Compile) And Warm (Cached) Per Sequencer"""
+    Text = ''.join(random.choices(string.ascii_letters + string.digits + string.punctuation + ' ', k=Text_Length))
+    Results = {}
+    for Mode in Server.RaspberryKeyboard.SEQUENCE_MODES:
+        Keyboard = Server.RaspberryKeyboard(Test_Mode=True, Sequence_Mode=Mode, Pacing="HOST_SYNC")
+        Keyboard.Sink = Server.RecordingHIDSink()
+        for Cache in ("Cold", "Warm"):
+            def Reset():
+                Keyboard.Sink.Clear()
+                if Cache == "Cold":
+                    Keyboard.Clear_Compiled_Cache()
+            with Quiet():
+                Keyboard.Type_String(Text)
+                Best = min(Timed(lambda: Keyboard.Type_String(Text), Repeat, Reset))
+            Results[f"{Mode}_{Cache}"] = {
+                "Reports_Per_Second": len(Keyboard.Sink) / Best,
+                "Chars_Per_Second": Text_Length / Best,
+                "Seconds": Best,
+            }
+    return Results
+
+def Representative_Scripts():
+    """(Name, Payload) - Backend Challenge (Both Formats), Arrow Audit, Long Password"""
+    Script, Action_Code, Estimated_Duration = Backend.generate_random_script()
+    Challenge = Server.Parse_Action_Code(Action_Code)
+    Arrow_Audit = []
+    for Key, Color in (("UP", "Red"), ("DOWN", "Blue"), ("LEFT", "Yellow"), ("RIGHT", "White")):
+        Arrow_Audit.append({"Command": "LED", "Parameters": {"Color": Color, "Duration": 1.0}})
+        Arrow_Audit.append({"Command": "HID", "Parameters": {"Key": Key}})
+        Arrow_Audit.append({"Command": "WAIT", "Parameters": {"Seconds": 0.5}})
+    Long_Type = [
+        {"Command": "TYPE", "Parameters": {"Text": ''.join(random.choices(string.ascii_letters, k=1024))}},
+        {"Command": "DELETE_TEXT", "Parameters": {"Count": 1024}},
+    ]
+    return (
+        ("Challenge_Action_Code", Action_Code),
+        ("Challenge_JSON", json.dumps(Challenge)),
+        ("Arrow_Audit_JSON", json.dumps(Arrow_Audit)),
+        ("Long_Type_JSON", json.dumps(Long_Type)),
+    )
+
+def Bench_Audit(Repeat):
+    """End-To-End Latency Of A Received Payload (Parse + Execute) Per Execution Mode"""
+    Results = {}
+    Scripts = Representative_Scripts()
+    for Execution_Mode in Server.BluetoothHIDServer.EXECUTION_MODES:
+        Benchmark_Server = Make_Server(Execution_Mode)
+        for Name, Payload in Scripts:
+            Handler = Benchmark_Server.Handle_Action_Code if Name.endswith("Action_Code") else Benchmark_Server.Handle_Audit_Sequence
+            Waits_Before = Waits.Requested
+            with Quiet():
+                Timings = Timed(lambda: Handler(Payload), Repeat, Benchmark_Server.Keyboard.Sink.Clear)
+            Results[f"{Execution_Mode}_{Name}"] = {
+                "Best_ms": min(Timings) * 1e3,
+                "Median_ms": statistics.median(Timings) * 1e3,
+                "Reports": len(Benchmark_Server.Keyboard.Sink),
+                "Intentional_Wait_s": (Waits.Requested - Waits_Before) / Repeat,
+            }
+    return Results
+
+ACTION_SAMPLES = (
+    ("HID", {"Key": "UP"}),
+    ("TYPE", {"Text": "abcd1234"}),
+    ("DELETE_TEXT", {"Count": 8}),
+    ("DELETE_ROW", {"Method": "BIOS", "Time": 30}),
+    ("LED", {"Color": "Red", "Duration": 0.1}),
+    ("BEEP", {"Repeat": 1, "Pattern": "Short"}),
+    ("WAIT", {"Seconds": 0.5}),
+    ("PACING", {"Profile": "HOST_SYNC"}),
+)
+
+def Bench_Actions(Repeat, Iterations=200):
+    """Per-Action Overhead Of Execute_Action, Intentional Waits Excluded"""
+    Results = {}
+    Benchmark_Server = Make_Server()
+    for Command, Parameters in ACTION_SAMPLES:
+        def Run_Batch():
+            for Iteration in range(Iterations):
+                # Every Iteration Starts On An Unknown Field (DELETE_ROW Measures The Blind Clear)
+                Benchmark_Server.Keyboard.Field.Forget()
+                Benchmark_Server.Execute_Action(Command, Parameters)
+        with Quiet():
+            Best = min(Timed(Run_Batch, Repeat, Benchmark_Server.Keyboard.Sink.Clear))
+        Results[Command] = {
+            "Overhead_us": Best / Iterations * 1e6,
+            "Reports": len(Benchmark_Server.Keyboard.Sink) // Iterations,
+        }
+    return Results
+
+# lambda_handler Variants : (Event, Pool Size, Sessions Per Call)
+BACKEND_VARIANTS = {
+    "lambda_handler": ({}, 0, 1),
+    "lambda_handler_pool": ({}, 32, 1),
+    "lambda_handler_batch": ({"queryStringParameters": {"count": "25"}}, 0, 25),
+}
+
+def Bench_Backend(Repeat, Calls=2000):
+    """
+    lambda_handler Throughput And Latency Against The Stubbed Table
+    Round_Trips_Per_Session : DynamoDB Requests A Real Table Would Have Served (The Latency The Stub Hides)
+    """
+    Results = {}
+    Table = Backend.get_client()
+    Saved_Pool = Backend.POOL_SIZE, Backend.POOL_LOW_WATER
+    try:
+        for Name, (Event, Pool_Size, Sessions_Per_Call) in BACKEND_VARIANTS.items():
+            Backend.POOL_SIZE, Backend.POOL_LOW_WATER = Pool_Size, Pool_Size // 2
+            Backend.challenge_pool.clear()
+            Latencies = []
+            Failures = 0
+            Best = None
+            Round_Trips = Table.Round_Trips
+            for Iteration in range(Repeat):
+                Start = time.perf_counter()
+                for Call in range(Calls):
+                    Call_Start = time.perf_counter()
+                    with Quiet():
+                        Response = Backend.lambda_handler(Event, None)
+                    Latencies.append(time.perf_counter() - Call_Start)
+                    if Response["statusCode"] != 200:
+                        Failures += 1
+                Elapsed = time.perf_counter() - Start
+                Best = Elapsed if Best is None else min(Best, Elapsed)
+
+            Latencies.sort()
+            Results[Name] = {
+                "Calls_Per_Second": Calls / Best,
+                "Sessions_Per_Second": Calls * Sessions_Per_Call / Best,
+                "P50_us": Latencies[len(Latencies) // 2] * 1e6,
+                "P99_us": Latencies[int(len(Latencies) * 0.99)] * 1e6,
+                "Round_Trips_Per_Session": (Table.Round_Trips - Round_Trips) / (Calls * Repeat * Sessions_Per_Call),
+                "Failures": Failures,
+            }
+    finally:
+        Backend.POOL_SIZE, Backend.POOL_LOW_WATER = Saved_Pool
+        Backend.challenge_pool.clear()
+    return Results
+
+# Runs In A Fresh Interpreter Per Cold Start : argv = [Repo, "BOTO3" | "STUB"]
+COLD_START_PROBE = r"""
+import sys, time, json, types
+Repo, Mode = sys.argv[1], sys.argv[2]
+if Mode == "STUB":
+    # boto3 Not Installed : Bare In-Process Client (boto3 Import Cost Not Included)
+    class Client:
+        def put_item(Self, **Request):
+            return {}
+        def batch_write_item(Self, **Request):
+            return {"UnprocessedItems": {}}
+    Boto3 = types.ModuleType("boto3")
+    Boto3.client = lambda Service_Name, **Options: Client()
+    sys.modules["boto3"] = Boto3
+sys.path.insert(0, Repo)
+Start = time.perf_counter()
+import AuditableHID_Backend as Backend
+Imported = time.perf_counter()
+Status = Backend.lambda_handler({}, None)["statusCode"]
+First_Done = time.perf_counter()
+Backend.lambda_handler({}, None)
+Warm_Done = time.perf_counter()
+print(json.dumps({
+    "Import_ms": (Imported - Start) * 1e3,
+    "First_Call_ms": (First_Done - Imported) * 1e3,
+    "Warm_Call_ms": (Warm_Done - First_Done) * 1e3,
+    "Status": Status,
+}))
+"""
+
+def Bench_Cold_Start(Repeat, Processes=5):
+    """
+    Backend Cold Start : Interpreter Launch, Module Import, First And Second lambda_handler Call
+    With boto3 Installed, The Real Client Writes To A LocalDynamoDB Stand-In Over HTTP
+    Median Over max(Repeat, Processes) Fresh Processes
+    """
+    Real_Boto3 = importlib.machinery.PathFinder.find_spec("boto3") is not None
+    Environment = dict(os.environ, CHALLENGE_POOL_SIZE="0", AWS_ACCESS_KEY_ID="local",
+                       AWS_SECRET_ACCESS_KEY="local", AWS_DEFAULT_REGION="us-east-1")
+    Repo = os.path.dirname(os.path.abspath(__file__))
+    Samples = []
+    with LocalDynamoDB() as Stand_In:
+        Environment["DYNAMODB_ENDPOINT"] = Stand_In.Endpoint
+        for Process in range(max(Repeat, Processes)):
+            Start = time.perf_counter()
+            Output = subprocess.run(
+                [sys.executable, "-c", COLD_START_PROBE, Repo, "BOTO3" if Real_Boto3 else "STUB"],
+                env=Environment, capture_output=True, text=True, check=True
+            ).stdout
+            Sample = json.loads(Output.strip().splitlines()[-1])
+            Sample["Process_ms"] = (time.perf_counter() - Start) * 1e3
+            Samples.append(Sample)
+
+    Result = {
+        Metric: statistics.median(Sample[Metric] for Sample in Samples)
+        for Metric in ("Process_ms", "Import_ms", "First_Call_ms", "Warm_Call_ms")
+    }
+    Result["Failures"] = sum(Sample["Status"] != 200 for Sample in Samples)
+    Result["Real_Boto3"] = int(Real_Boto3)
+    return {"lambda_handler": Result}
+
+BENCHMARK_FUNCTIONS = {
+    "TYPE_STRING": Bench_Type_String,
+    "AUDIT": Bench_Audit,
+    "ACTIONS": Bench_Actions,
+    "BACKEND": Bench_Backend,
+    "COLD_START": Bench_Cold_Start,
+}
+
+"""
++============================================================================================================+
+| Results                                                                                                    |
++============================================================================================================+
+"""
+def Git_Revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def Flatten(Results):
+    """{Benchmark: {Case: {Metric: Value}}} -> {"Benchmark/Case/Metric": Value}"""
+    Flat = {}
+    for Benchmark, Cases in Results.items():
+        for Case, Metrics in Cases.items():
+            for Metric, Value in Metrics.items():
+                Flat[f"{Benchmark}/{Case}/{Metric}"] = Value
+    return Flat
+
+def Compare(Baseline, Current):
+    """Print Every Metric Present In Both Runs With Its Relative Change"""
+    Old = Flatten(Baseline["Results"])
+    New = Flatten(Current["Results"])
+    print(f"Baseline {Baseline['Meta'].get('Revision')} -> Current {Current['Meta'].get('Revision')}", file=sys.stderr)
+    for Key in sorted(Old.keys() & New.keys()):
+        Change = f"{(New[Key] - Old[Key]) / Old[Key] * 100:+.1f}%" if Old[Key] else "n/a"
+        print(f"  {Key:<60} {Old[Key]:>14.3f} -> {New[Key]:>14.3f}  {Change}", file=sys.stderr)
+
+def Run_Benchmarks(Selected, Repeat, Seed):
+    Results = {}
+    for Name in Selected:
+        print(f"[HID_Benchmark] Running {Name}...", file=sys.stderr)
+        # Same Random Text / Challenges On Every Run : Results Stay Comparable
+        random.seed(Seed)
+        Results[Name] = BENCHMARK_FUNCTIONS[Name](Repeat)
+    return {
+        "Meta": {
+            "Revision": Git_Revision(),
+            "Python": platform.python_version(),
+            "Platform": platform.platform(),
+            "Timestamp": int(time.time()),
+            "Repeat": Repeat,
+            "Seed": Seed,
+        },
+        "Results": Results,
+    }
+
+if __name__ == '__main__':
+    import argparse
+
+    Parser = argparse.ArgumentParser(description='Hardware-Free HID Server / Backend Benchmarks')
+    Parser.add_argument('--Only', nargs='+', choices=BENCHMARKS, default=list(BENCHMARKS),
+                        help='Benchmarks To Run (Default : All)')
+    Parser.add_argument('--Repeat', type=int, default=5, help='Runs Per Case (Best / Median Reported)')
+    Parser.add_argument('--Seed', type=int, default=1, help='Random Seed For Generated Text And Scripts')
+    Parser.add_argument('--Output', metavar='PATH', help='Write JSON Results To PATH Instead Of stdout')
+    Parser.add_argument('--Compare', metavar='PATH', help='Compare Against Results Saved With --Output')
+    Args = Parser.parse_args()
+
+    Current = Run_Benchmarks(Args.Only, max(1, Args.Repeat), Args.Seed)
+
+    if Args.Output:
+        with open(Args.Output, 'w') as Output_File:
+            json.dump(Current, Output_File, indent=2)
+    else:
+        print(json.dumps(Current, indent=2))
+
+    if Args.Compare:
+        with open(Args.Compare) as Baseline_File:
+            Compare(json.load(Baseline_File), Current)
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+
+"""
++============================================================================================================+
+| HID Keyboard Layouts                                                                                       |
+| - Which Key Strokes Type A Character On A Host Set To A Given Keyboard Layout                              |
+|                                                                                                            |
+| Instructions:                                                                                              |
+| 1. Layout Definitions : What Every Physical Key Types Per Layer (Normal, Shift, AltGr, Shift+AltGr)        |
+| 2. Dead Keys : Accent Key Then Letter (Precomposed Via Unicode NFC), Accent Key Then Space For The Accent  |
+| 3. Compiled Once Per Layout (On First Use, Then Cached) Into Array-Indexed Report Tables                   |
+|                                                                                                            |
+| The Layout Must Match The Host's Configured Layout - The Keyboard Only Sends Key Positions                 |
++============================================================================================================+
+"""
+
+" Python Imports "
+import json
+import unicodedata
+from types import MappingProxyType
+
+"""
++============================================================================================================+
+| Key Positions                                                                                              |
+| Usage IDs Of The Main Block, Row By Row, Named By The Key Caps Of A US Keyboard                            |
++============================================================================================================+
+| Number Row : `  1  2  3  4  5  6  7  8  9  0  -  =                                                         |
+| Top Row    : Q  W  E  R  T  Y  U  I  O  P  [  ]  \                                                         |
+| Home Row   : A  S  D  F  G  H  J  K  L  ;  '  #     (# : ISO Key Left Of Enter, 0x32)                      |
+| Bottom Row : \  Z  X  C  V  B  N  M  ,  .  /        (\ : ISO Key Right Of Left Shift, 0x64)                |
++============================================================================================================+
+| JIS Yen / Ro Keys (0x89 / 0x87) Lie Outside The Gadget Report Descriptor (Usage Maximum 0x65)              |
++============================================================================================================+
+"""
+ROW_SCAN_CODES = (
+    (0x35, 0x1e, 0x1f, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27, 0x2d, 0x2e),
+    (0x14, 0x1a, 0x08, 0x15, 0x17, 0x1c, 0x18, 0x0c, 0x12, 0x13, 0x2f, 0x30, 0x31),
+    (0x04, 0x16, 0x07, 0x09, 0x0a, 0x0b, 0x0d, 0x0e, 0x0f, 0x33, 0x34, 0x32),
+    (0x64, 0x1d, 0x1b, 0x06, 0x19, 0x05, 0x11, 0x10, 0x36, 0x37, 0x38),
+)
+# Highest Key Usage The Gadget Report Descriptor Accepts
+MAX_SCAN_CODE = 0x65
+
+# Layer Modifiers : Normal, Left Shift, Right Alt (AltGr), Left Shift + AltGr
+LAYER_MODIFIERS = (0x00, 0x02, 0x40, 0x42)
+# Placeholder In A Layer String : This Key Types Nothing On This Layer (Or Is A Dead Key)
+NO_CHARACTER = " "
+
+# Same Keys On Every Layout
+COMMON_STROKES = {
+    ' ': (0x2c, 0),       # Space
+    '\n': (0x28, 0),      # Enter
+    '\t': (0x2b, 0),      # Tab
+}
+
+# Dead Key Accent -> Combining Mark Applied To The Next Letter
+COMBINING_MARKS = {
+    "^": "\u0302",        # Circumflex
+    "´": "\u0301",        # Acute
+    "`": "\u0300",        # Grave
+    "¨": "\u0308",        # Diaeresis
+    "~": "\u0303",        # Tilde
+}
+# Dead Keys Only Compose Latin-1 Letters (â, é, ñ ... - Not ĉ, ẑ : The Host Types Accent + Letter Instead)
+COMPOSED_LIMIT = 0x100
+
+"""
++============================================================================================================+
+| Layout Definitions                                                                                         |
++============================================================================================================+
+| Rows : One Tuple Per Row Of ROW_SCAN_CODES - (Normal, Shift[, AltGr[, Shift+AltGr]]) Layer Strings,        |
+|        One Character Per Key, NO_CHARACTER For Nothing, Shorter Strings Leave The Trailing Keys Out        |
+| Dead : Accent -> (Scan_Code, Layer) Of Every Dead Key (Left As NO_CHARACTER In Rows)                       |
++============================================================================================================+
+| Windows Default Layouts - Register_Layouts / Load_Layout_File Add Or Replace Definitions                   |
++============================================================================================================+
+"""
+LAYOUTS = {
+    "US": {
+        "Description": "English (United States)",
+        "Rows": (
+            ("`1234567890-=", "~!@#$%^&*()_+"),
+            ("qwertyuiop[]\\", "QWERTYUIOP{}|"),
+            ("asdfghjkl;'", "ASDFGHJKL:\""),
+            (" zxcvbnm,./", " ZXCVBNM<>?"),
+        ),
+    },
+    "UK": {
+        "Description": "English (United Kingdom)",
+        "Rows": (
+            ("`1234567890-=", "¬!\"£$%^&*()_+", "¦   €"),
+            ("qwertyuiop[]", "QWERTYUIOP{}", "  é   úíó", "  É   ÚÍÓ"),
+            ("asdfghjkl;'#", "ASDFGHJKL:@~", "á", "Á"),
+            ("\\zxcvbnm,./", "|ZXCVBNM<>?"),
+        ),
+    },
+    "DE": {
+        "Description": "German (QWERTZ)",
+        "Rows": (
+            (" 1234567890ß ", "°!\"§$%&/()=? ", "  ²³   {[]}\\"),
+            ("qwertzuiopü+", "QWERTZUIOPÜ*", "@ €        ~"),
+            ("asdfghjklöä#", "ASDFGHJKLÖÄ'"),
+            ("<yxcvbnm,.-", ">YXCVBNM;:_", "|      µ"),
+        ),
+        "Dead": {"^": (0x35, 0), "´": (0x2e, 0), "`": (0x2e, 1)},
+    },
+    "FR": {
+        "Description": "French (AZERTY)",
+        "Rows": (
+            ("²&é\"'(-è_çà)=", " 1234567890°+", "   #{[| \\^@]}"),
+            ("azertyuiop $", "AZERTYUIOP £", "  €        ¤"),
+            ("qsdfghjklmù*", "QSDFGHJKLM%µ"),
+            ("<wxcvbn,;:!", ">WXCVBN?./§"),
+        ),
+        "Dead": {"^": (0x2f, 0), "¨": (0x2f, 1), "~": (0x1f, 2), "`": (0x24, 2)},
+    },
+    "JIS": {
+        "Description": "Japanese (JIS, Alphanumeric Input - No Yen / Ro Keys : No \\ | _)",
+        "Rows": (
+            (" 1234567890-^", " !\"#$%&'() =~"),
+            ("qwertyuiop@[", "QWERTYUIOP`{"),
+            ("asdfghjkl;:]", "ASDFGHJKL+*}"),
+            (" zxcvbnm,./", " ZXCVBNM<>?"),
+        ),
+    },
+}
+DEFAULT_LAYOUT = "US"
+
+# Boot Keyboard Report : [Modifier, Reserved, Key1 .. Key6] - All Zero Releases Every Key (Shared, Never Rebuilt)
+REPORT_LENGTH = 8
+RELEASE_REPORT = bytes(REPORT_LENGTH)
+# Single-Stroke Characters Below TABLE_SIZE Index The Table Directly (ASCII + Latin-1), See KeyboardLayout
+TABLE_SIZE = 0x100
+
+"""
++============================================================================================================+
+| Compiled Layouts                                                                                           |
++============================================================================================================+
+| Entry : (Scan_Code, Modifier, Press_Report, Release_Report[, Press_Report, Release_Report ...])            |
+|   Scan_Code / Modifier Of The First Stroke - Dead Key Characters Carry The Letter's Stroke After It        |
+|   Entry[2:] Is The Whole Report Sequence Of The Character                                                  |
+| Table : Tuple Indexed By Code Point, Single-Stroke Characters Only (None : Look In Extra)                  |
+| Extra : Read-Only Mapping Of Dead Key Characters And Code Points Past TABLE_SIZE (€ ...)                   |
+|   Plain Keys Stay On The Table Fast Path, The Few Composed Characters Take The Miss Path                   |
++============================================================================================================+
+"""
+class KeyboardLayout:
+
+    def __init__(Self, Name, Description, Strokes, Dead_Keys=None):
+        Self.Name = Name
+        Self.Description = Description
+        # Character -> ((Scan_Code, Modifier), ...) : Source Of The Tables (Host-Side Decoder)
+        Self.Strokes = MappingProxyType(Strokes)
+        # (Scan_Code, Modifier) -> Accent Of Every Dead Key (Host-Side Decoder)
+        Self.Dead_Keys = MappingProxyType(dict(Dead_Keys or {}))
+
+        Table = [None] * TABLE_SIZE
+        Extra = {}
+        # One Press Report Object Per Stroke, Shared By Every Entry Using It
+        Presses = {}
+        for Char, Char_Strokes in Strokes.items():
+            Reports = ()
+            for Scan_Code, Modifier in Char_Strokes:
+                Press = Presses.get((Scan_Code, Modifier))
+                if Press is None:
+                    Press = Presses[(Scan_Code, Modifier)] = bytes([Modifier, 0, Scan_Code, 0, 0, 0, 0, 0])
+                Reports += (Press, RELEASE_REPORT)
+            Entry = Char_Strokes[0] + Reports
+            if ord(Char) < TABLE_SIZE and len(Char_Strokes) == 1:
+                Table[ord(Char)] = Entry
+            else:
+                Extra[Char] = Entry
+
+        Self.Table = tuple(Table)
+        Self.Extra = MappingProxyType(Extra)
+
+    def __repr__(Self):
+        return f"KeyboardLayout({Self.Name!r})"
+
+    def Lookup(Self, Char):
+        """Return The Precompiled Entry For A Single Character (None If Not On This Layout)"""
+        Code_Point = ord(Char)
+        Entry = Self.Table[Code_Point] if Code_Point < TABLE_SIZE else None
+        return Entry if Entry is not None else Self.Extra.get(Char)
+
+def Layout_Strokes(Definition):
+    """Character -> Key Strokes ((Scan_Code, Modifier), ...) Of A Layout Definition"""
+    Strokes = {Char: (Stroke,) for Char, Stroke in COMMON_STROKES.items()}
+
+    # Layer By Layer : A Character On Several Keys Uses The One With The Fewest Modifiers
+    for Layer, Modifier in enumerate(LAYER_MODIFIERS):
+        for Scan_Codes, Row in zip(ROW_SCAN_CODES, Definition["Rows"]):
+            if Layer < len(Row):
+                for Scan_Code, Char in zip(Scan_Codes, Row[Layer]):
+                    if Char != NO_CHARACTER:
+                        Strokes.setdefault(Char, ((Scan_Code, Modifier),))
+
+    # Dead Keys : Accent + Letter -> Precomposed Letter, Accent + Space -> The Accent Itself
+    # Characters On A Key Of Their Own Keep That Key (One Stroke Beats Two)
+    Letters = [Char for Char in Strokes if Char.isascii() and Char.isalpha()]
+    for Accent, (Scan_Code, Layer) in Definition.get("Dead", {}).items():
+        Dead_Stroke = (Scan_Code, LAYER_MODIFIERS[Layer])
+        Strokes.setdefault(Accent, (Dead_Stroke,) + Strokes[" "])
+        for Letter in Letters:
+            Composed = unicodedata.normalize("NFC", Letter + COMBINING_MARKS[Accent])
+            if len(Composed) == 1 and ord(Composed) < COMPOSED_LIMIT:
+                Strokes.setdefault(Composed, (Dead_Stroke,) + Strokes[Letter])
+
+    return Strokes
+
+def Check_Definition(Name, Definition):
+    """Validate A Layout Definition (JSON Files Included), Return It In Canonical Form - Raises ValueError"""
+    if not isinstance(Definition, dict):
+        raise ValueError(f"Layout {Name}: Must Be An Object")
+    Rows = Definition.get("Rows")
+    if not isinstance(Rows, (list, tuple)) or not 0 < len(Rows) <= len(ROW_SCAN_CODES):
+        raise ValueError(f"Layout {Name}: Rows Must List 1 To {len(ROW_SCAN_CODES)} Rows")
+    for Index, (Scan_Codes, Row) in enumerate(zip(ROW_SCAN_CODES, Rows)):
+        if not isinstance(Row, (list, tuple)) or not 0 < len(Row) <= len(LAYER_MODIFIERS):
+            raise ValueError(f"Layout {Name}: Row {Index} Must List 1 To {len(LAYER_MODIFIERS)} Layer Strings")
+        for Layer in Row:
+            if not isinstance(Layer, str) or len(Layer) > len(Scan_Codes):
+                raise ValueError(f"Layout {Name}: Row {Index} Layers Must Be Strings Of At Most {len(Scan_Codes)} Characters")
+
+    Dead = {}
+    for Accent, Position in dict(Definition.get("Dead", {})).items():
+        if Accent not in COMBINING_MARKS:
+            raise ValueError(f"Layout {Name}: Unknown Dead Key Accent {Accent!r} (Expected One Of {''.join(COMBINING_MARKS)})")
+        try:
+            Scan_Code, Layer = (int(Value) for Value in Position)
+        except (TypeError, ValueError):
+            raise ValueError(f"Layout {Name}: Dead Key {Accent!r} Must Be [Scan_Code, Layer]")
+        if not 0 < Scan_Code <= MAX_SCAN_CODE or not 0 <= Layer < len(LAYER_MODIFIERS):
+            raise ValueError(f"Layout {Name}: Dead Key {Accent!r} Position Out Of Range")
+        Dead[Accent] = (Scan_Code, Layer)
+
+    return {
+        "Description": str(Definition.get("Description", Name)),
+        "Rows": tuple(tuple(Row) for Row in Rows),
+        "Dead": Dead,
+    }
+
+"""
++============================================================================================================+
+| Layout Registry                                                                                            |
+| Compiled On First Use (Startup Compiles The Server Default), Cached For The Life Of The Process            |
++============================================================================================================+
+"""
+COMPILED_LAYOUTS = {}
+
+def Layout_Names():
+    return tuple(LAYOUTS)
+
+def Load_Layout(Spec=None):
+    """
+    Compiled KeyboardLayout For A Layout Specification
+    - None / "DE"        : Named Layout (None : DEFAULT_LAYOUT)
+    - {"Name": "DE"}     : LAYOUT Command Parameters
+    Raises ValueError On Unknown Layouts
+    """
+    if isinstance(Spec, dict):
+        Spec = Spec.get("Name")
+    Name = str(Spec or DEFAULT_LAYOUT).upper()
+
+    Layout = COMPILED_LAYOUTS.get(Name)
+    if Layout is None:
+        Definition = LAYOUTS.get(Name)
+        if Definition is None:
+            raise ValueError(f"Unknown Keyboard Layout: {Name} (Expected One Of {', '.join(LAYOUTS)})")
+        Dead_Keys = {(Scan_Code, LAYER_MODIFIERS[Layer]): Accent for Accent, (Scan_Code, Layer) in Definition.get("Dead", {}).items()}
+        Layout = COMPILED_LAYOUTS[Name] = KeyboardLayout(Name, Definition.get("Description", Name), Layout_Strokes(Definition), Dead_Keys)
+    return Layout
+
+def Register_Layouts(Definitions):
+    """Add Or Replace Layout Definitions (Name -> Definition), All Validated First - Returns The Names"""
+    Checked = {str(Name).upper(): Check_Definition(Name, Definition) for Name, Definition in Definitions.items()}
+    for Name, Definition in Checked.items():
+        LAYOUTS[Name] = Definition
+        # Replaced Layouts Compile Again On Next Use
+        COMPILED_LAYOUTS.pop(Name, None)
+    return tuple(Checked)
+
+def Load_Layout_File(Path):
+    """
+    Register The Layouts Of A JSON File : {"Layouts": {"NAME": Definition, ...}}
+    Definition As In LAYOUTS (Lists For Tuples) - Raises ValueError / OSError
+    """
+    with open(Path, encoding='utf-8') as Layout_File:
+        try:
+            Contents = json.load(Layout_File)
+        except json.JSONDecodeError as Error:
+            raise ValueError(f"{Path}: {Error}")
+    if not isinstance(Contents, dict) or not isinstance(Contents.get("Layouts"), dict):
+        raise ValueError(f"{Path}: Expected {{\"Layouts\": {{...}}}}")
+    return Register_Layouts(Contents["Layouts"])
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+
+"""
++============================================================================================================+
+| HID Timing Model                                                                                           |
+| - How Long A Script Takes On The Pi : Pacing Sleeps + WAITs + Per-Key / Per-Action Execution Costs         |
+|                                                                                                            |
+| Shared By:                                                                                                 |
+| 1. Bluetooth_HID_Server  (Pacing Profiles, Script_Overrun Metric, --Calibrate)                             |
+| 2. AuditableHID_Backend  (estimated_duration : Recording Window And Client Timeout)                        |
+| 3. AuditableHID_Generator (Same Estimate, Vectorized Over A Batch)                                         |
+| 4. AuditableHID_Verifier  (Expected Step Durations, Execution Trace Decoding)                              |
+|                                                                                                            |
+| Standard Library Only : Imported By The Lambda Cold Start                                                  |
++============================================================================================================+
+"""
+
+" Python Imports "
+import os
+import json
+import math
+import time
+
+"""
++============================================================================================================+
+| Keystroke Pacing Profiles                                                                                  |
+| Delays (Seconds) Between HID Reports - Tuned Per Target Class                                              |
++============================================================================================================+
+| Key_Press     : After Every Press Report                                                                    |
+| Key_Release   : After Every All-Zero Release Report                                                        |
+| Row_Home      : After HOME In Delete_Row                                                                   |
+| Row_Delete    : Extra Gap After Every DELETE In Delete_Row                                                 |
+| Backspace_Gap : Extra Gap After Every Backspace In Delete_String                                           |
++============================================================================================================+
+"""
+PACING_PROFILES = {
+    # Slowest BIOS Password Prompts (Original Hard-Coded Timings, ~15 Chars/s)
+    "BIOS": {"Key_Press": 0.03, "Key_Release": 0.03, "Row_Home": 0.05, "Row_Delete": 0.02, "Backspace_Gap": 0.03},
+    # UEFI Setup / Boot Menus Poll The Keyboard Faster
+    "UEFI": {"Key_Press": 0.015, "Key_Release": 0.015, "Row_Home": 0.02, "Row_Delete": 0.005, "Backspace_Gap": 0.01},
+    # OS Login Screens : One USB Poll Interval (8 ms Full-Speed) Per Report
+    "OS_FAST": {"Key_Press": 0.008, "Key_Release": 0.008, "Row_Home": 0.01, "Row_Delete": 0.0, "Backspace_Gap": 0.0},
+    # No Sleeps At All : Pair With The POLL Writer, The Host Poll Itself Paces Every Report
+    "HOST_SYNC": {"Key_Press": 0.0, "Key_Release": 0.0, "Row_Home": 0.0, "Row_Delete": 0.0, "Backspace_Gap": 0.0},
+}
+DEFAULT_PACING_PROFILE = "BIOS"
+# CUSTOM Starts From A Base Profile And Overrides Individual Delays
+CUSTOM_PACING_PROFILE = "CUSTOM"
+PACING_PROFILE_NAMES = tuple(PACING_PROFILES) + (CUSTOM_PACING_PROFILE,)
+
+def Resolve_Pacing(Spec):
+    """
+    Resolve A Pacing Specification Into (Profile_Name, Delays)
+    - None / "BIOS" / "UEFI" / "OS_FAST"                                   : Named Profile
+    - {"Profile": "UEFI"}                                                   : Named Profile
+    - {"Profile": "CUSTOM", "Base": "UEFI", "Key_Press": 0.01, ...}         : Base Profile + Overrides
+    Raises ValueError On Unknown Profiles, Unknown Delay Names Or Negative Delays
+    """
+    if Spec is None:
+        Spec = DEFAULT_PACING_PROFILE
+    if isinstance(Spec, str):
+        Spec = {"Profile": Spec}
+    if not isinstance(Spec, dict):
+        raise ValueError(f"Pacing Must Be A Profile Name Or Object, Got {type(Spec).__name__}")
+
+    Name = str(Spec.get("Profile", CUSTOM_PACING_PROFILE)).upper()
+    if Name == CUSTOM_PACING_PROFILE:
+        Base = str(Spec.get("Base", DEFAULT_PACING_PROFILE)).upper()
+    else:
+        Base = Name
+    if Base not in PACING_PROFILES:
+        raise ValueError(f"Unknown Pacing Profile: {Base}")
+
+    Delays = dict(PACING_PROFILES[Base])
+    # Only CUSTOM Accepts Individual Delay Overrides
+    if Name == CUSTOM_PACING_PROFILE:
+        for Key, Value in Spec.items():
+            if Key in ("Profile", "Base"):
+                continue
+            if Key not in Delays:
+                raise ValueError(f"Unknown Pacing Delay: {Key}")
+            Value = float(Value)
+            if Value < 0:
+                raise ValueError(f"Pacing Delay {Key} Must Not Be Negative")
+            Delays[Key] = Value
+
+    return Name, Delays
+
+def Row_Delete_Count(Time=30):
+    """Number Of DELETE Presses Used By Delete_Row For A Given Time Class"""
+    DELETE_TIME_30 = 30
+    DELETE_TIME_50 = 50
+    DELETE_TIME_80 = 80
+
+    if Time <= 30:
+        return DELETE_TIME_30
+    elif Time <= 50:
+        return DELETE_TIME_50
+    return DELETE_TIME_80
+
+"""
++============================================================================================================+
+| Execution Costs                                                                                            |
+| Seconds The Pi Spends On Top Of The Pacing Sleeps - Measured By Bluetooth_HID_Server.py --Calibrate        |
++============================================================================================================+
+| Key_Cost       : Per Keystroke (Press + Release) - Two Report Writes, Two Sleep Overshoots, Table Lookup   |
+| Backspace_Cost : Per DELETE_TEXT Backspace - As Key_Cost, Plus Its Log Line And The Backspace_Gap Sleep    |
+| Action_Cost    : Per Action - Dispatch, Logging, LED Feedback Signal                                       |
+| Wait_Cost      : Per WAIT / LED / BEEP - Sleep Overshoot On Top Of The Requested Seconds                   |
++============================================================================================================+
+| Feedback Blinks Run Beside The Keystrokes (Fire-And-Forget) : Only The Last One Outlasts The Script        |
++============================================================================================================+
+"""
+# Uncalibrated Pi Zero 2 W Estimates (Deliberately On The High Side : Overestimates Only Cost Video Seconds)
+DEFAULT_COSTS = {"Key_Cost": 0.002, "Backspace_Cost": 0.003, "Action_Cost": 0.005, "Wait_Cost": 0.002}
+
+# LED Feedback Blink After Each Keystroke Action (Seconds, See Execute_Action / Compile_Timeline)
+FEEDBACK_SECONDS = {"HID": 0.1, "TYPE": 0.1, "DELETE_TEXT": 0.1, "DELETE_ROW": 0.2}
+
+# Hardware Defaults (Hardware Class) : LED On-Time, Buzzer Repeat / Pattern Lengths, WAIT Seconds
+DEFAULT_LED_SECONDS = 2.0
+DEFAULT_BEEP_REPEAT = 1
+DEFAULT_BEEP_SECONDS = 2.0
+BEEP_PATTERN_SECONDS = {"Short": 0.1, "Long": 0.5}
+DEFAULT_WAIT_SECONDS = 2.0
+
+# Calibration File : Fitted Costs Per Pacing Profile (HID_TIMING_CALIBRATION Overrides The Path)
+CALIBRATION_ENV = "HID_TIMING_CALIBRATION"
+DEFAULT_CALIBRATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "HID_Timing_Calibration.json")
+
+def Calibration_Path(Path=None):
+    return Path or os.environ.get(CALIBRATION_ENV) or DEFAULT_CALIBRATION_FILE
+
+def Load_Calibration(Path=None):
+    """Calibration File Contents ({"Profiles": {Name: {"Costs": {...}, ...}}}) - Empty If Never Calibrated"""
+    try:
+        with open(Calibration_Path(Path)) as Calibration_File:
+            return json.load(Calibration_File)
+    except FileNotFoundError:
+        return {}
+
+def Save_Calibration(Profile, Costs, Details=None, Path=None):
+    """Store The Costs Fitted For One Pacing Profile, Keeping The Other Profiles (Atomic Replace)"""
+    Path = Calibration_Path(Path)
+    Calibration = Load_Calibration(Path)
+    Entry = dict(Details or {})
+    Entry["Costs"] = Costs
+    Entry["Calibrated"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    Calibration.setdefault("Profiles", {})[Profile] = Entry
+    Temporary_Path = f"{Path}.tmp"
+    with open(Temporary_Path, 'w') as Calibration_File:
+        json.dump(Calibration, Calibration_File, indent=2, sort_keys=True)
+    os.replace(Temporary_Path, Path)
+    return Path
+
+def Round_Up(Seconds):
+    """Round Up To The Next Tenth (estimated_duration Must Never Fall Short) - Float Noise Is Not Rounded Up"""
+    return math.ceil(round(Seconds * 10, 6)) / 10
+
+def Script_Actions(Action_Script):
+    """
+    Lower A Backend action_script ({"cmd", "params"}) To Server Action Objects ({"Command", "Parameters"})
+    Same Mapping As action_code : TYPE -> H, DELETE -> D, PRESS -> K, WAIT -> W
+    """
+    Actions = []
+    for Step in Action_Script:
+        Params = Step.get("params", {})
+        if Step.get("cmd") == "WAIT":
+            Actions.append({"Command": "WAIT", "Parameters": {"Seconds": Params.get("seconds", 0)}})
+        elif Params.get("action") == "TYPE":
+            Actions.append({"Command": "TYPE", "Parameters": {"Text": Params.get("text", "")}})
+        elif Params.get("action") == "DELETE":
+            Actions.append({"Command": "DELETE_TEXT", "Parameters": {"Count": int(Params.get("count", 0))}})
+        elif Params.get("action") == "PRESS":
+            Actions.append({"Command": "HID", "Parameters": {"Key": Params.get("key")}})
+    return Actions
+
+def Decode_Trace(Message):
+    """
+    Execution Trace Returned With AUDIT_COMPLETE (--Trace JSON / ZLIB) -> Trace Dict
+    Accepts AUDIT_COMPLETE:TRACE[_ZLIB]:... Or The Part After AUDIT_COMPLETE: (Encoded By ExecutionTrace)
+    """
+    # Imported Here : Only Hosts Decoding Traces Need Them, Never The Lambda Cold Start
+    import zlib
+    import base64
+    if Message.startswith("AUDIT_COMPLETE:"):
+        Message = Message[len("AUDIT_COMPLETE:"):]
+    Kind, Separator, Body = Message.partition(':')
+    if Kind == "TRACE_ZLIB":
+        Body = zlib.decompress(base64.b64decode(Body)).decode('utf-8')
+    elif Kind != "TRACE":
+        raise ValueError(f"Not An Execution Trace: {Message[:32]!r}")
+    return json.loads(Body)
+
+class TimingModel:
+    """
+    Script Duration Prediction : Pacing Sleeps And Requested Seconds Plus The Calibrated Execution Costs
+    Keystrokes Are Counted As SINGLE Sequencing (One Press + Release Per Character) - ROLLOVER Is Never Slower
+    """
+
+    def __init__(Self, Pacing=None, Costs=None):
+        # Attrib Initialization
+        Self.Pacing_Profile, Self.Pacing = Resolve_Pacing(Pacing)
+        Self.Costs = dict(DEFAULT_COSTS)
+        if Costs:
+            Self.Costs.update({Key: float(Value) for Key, Value in Costs.items() if Key in DEFAULT_COSTS})
+
+    @classmethod
+    def Load(Cls, Pacing=None, Path=None):
+        """Model For A Pacing Profile With The Costs Calibrated For It (DEFAULT_COSTS If Never Calibrated)"""
+        Name = Resolve_Pacing(Pacing)[0]
+        Entry = Load_Calibration(Path).get("Profiles", {}).get(Name, {})
+        return Cls(Pacing, Entry.get("Costs"))
+
+    def Key_Seconds(Self, Pacing=None):
+        """One Keystroke : Press + Release Sleeps And Key_Cost"""
+        Pacing = Pacing or Self.Pacing
+        return Pacing["Key_Press"] + Pacing["Key_Release"] + Self.Costs["Key_Cost"]
+
+    def Backspace_Seconds(Self, Pacing=None):
+        """One DELETE_TEXT Backspace : Press + Release + Backspace_Gap Sleeps And Backspace_Cost"""
+        Pacing = Pacing or Self.Pacing
+        return Pacing["Key_Press"] + Pacing["Key_Release"] + Pacing["Backspace_Gap"] + Self.Costs["Backspace_Cost"]
+
+    def Action_Seconds(Self, Command, Parameters, Pacing=None):
+        """Seconds One Action Holds The Script (Feedback Blinks Excluded) - ValueError On Invalid Numbers"""
+        Pacing = Pacing or Self.Pacing
+        Seconds = Self.Costs["Action_Cost"]
+
+        if Command == "HID":
+            if Parameters.get("Key"):
+                Seconds += Self.Key_Seconds(Pacing)
+        elif Command == "TYPE":
+            Seconds += len(str(Parameters.get("Text", ""))) * Self.Key_Seconds(Pacing)
+        elif Command == "DELETE_TEXT":
+            Count = int(Parameters["Count"]) if "Count" in Parameters else len(str(Parameters.get("Text", "")))
+            Seconds += Count * Self.Backspace_Seconds(Pacing)
+        elif Command == "DELETE_ROW":
+            # Blind Count (Unknown Field) : An Upper Bound, A Known Field Clears With Fewer Keys
+            Seconds += Self.Key_Seconds(Pacing) + Pacing["Row_Home"]
+            Seconds += Row_Delete_Count(float(Parameters.get("Time", 30))) * (Self.Key_Seconds(Pacing) + Pacing["Row_Delete"])
+        elif Command == "LED":
+            Seconds += float(Parameters.get("Duration", DEFAULT_LED_SECONDS)) + Self.Costs["Wait_Cost"]
+        elif Command == "BEEP":
+            Pattern = BEEP_PATTERN_SECONDS.get(Parameters.get("Pattern"), DEFAULT_BEEP_SECONDS)
+            Seconds += int(Parameters.get("Repeat", DEFAULT_BEEP_REPEAT)) * Pattern + Self.Costs["Wait_Cost"]
+        elif Command == "WAIT":
+            Seconds += float(Parameters.get("Seconds", DEFAULT_WAIT_SECONDS)) + Self.Costs["Wait_Cost"]
+        return Seconds
+
+    def Estimate_Actions(Self, Actions, Pacing=None, Feedback=True):
+        """
+        Predicted Seconds From The First Action To The Last Feedback Blink Going Dark (Feedback=False : To The Last Action)
+        Pacing : Session Delays At The Start (Default : The Model's Profile) - PACING Commands And
+        Per-Action "Pacing" Overrides Apply As On The Server (Invalid Ones Are Ignored There Too)
+        """
+        Session_Pacing = Pacing or Self.Pacing
+        Clock = 0.0
+        Dark_At = 0.0
+
+        for Action in Actions:
+            Command = Action.get("Command")
+            Parameters = Action.get("Parameters", {})
+            Action_Pacing = Session_Pacing
+            try:
+                if Command == "PACING":
+                    Session_Pacing = Action_Pacing = Resolve_Pacing(Parameters)[1]
+                elif "Pacing" in Parameters:
+                    Action_Pacing = Resolve_Pacing(Parameters["Pacing"])[1]
+            except ValueError:
+                pass
+
+            Clock += Self.Action_Seconds(Command, Parameters, Action_Pacing)
+            if Feedback and Command in FEEDBACK_SECONDS:
+                Dark_At = max(Dark_At, Clock + FEEDBACK_SECONDS[Command])
+
+        return max(Clock, Dark_At)
+
+    def Estimate_Script(Self, Action_Script):
+        """Predicted Seconds For A Backend action_script"""
+        return Self.Estimate_Actions(Script_Actions(Action_Script))
+
+    def Linear_Seconds(Self, Wait_Seconds=0.0, Typed=0, Deleted=0, Keys=0, Waits=0, Actions=0, Tail=0.0):
+        """
+        Estimate_Actions From Counts Alone (Model Pacing Throughout) - Tail : Last Feedback Blink
+        Plain Arithmetic, So NumPy Arrays Work Too (AuditableHID_Generator Estimates Whole Batches)
+        """
+        return (Wait_Seconds + Waits * Self.Costs["Wait_Cost"] + (Typed + Keys) * Self.Key_Seconds()
+                + Deleted * Self.Backspace_Seconds() + Actions * Self.Costs["Action_Cost"] + Tail)
+
+"""
++============================================================================================================+
+| Calibration Fit                                                                                            |
+| Samples Measured On The Pi (Bluetooth_HID_Server.py --Calibrate) -> Execution Costs                        |
++============================================================================================================+
+| TYPE        (Chars, Seconds)      : Slope - Press/Release Sleeps = Key_Cost,       Intercept = Action_Cost |
+| DELETE_TEXT (Backspaces, Seconds) : Slope - Sleeps And Gap       = Backspace_Cost, Intercept = Action_Cost |
+| WAIT        (Requested, Seconds)  : Mean Overshoot - Action_Cost = Wait_Cost                               |
++============================================================================================================+
+"""
+CALIBRATION_LENGTHS = (4, 8, 16, 32)
+CALIBRATION_WAITS = (0.5, 1.0)
+
+def Fit_Costs(Samples, Pacing):
+    """
+    Samples : {"TYPE": [(Chars, Seconds)], "DELETE_TEXT": [(Backspaces, Seconds)], "WAIT": [(Requested, Seconds)]}
+    Returns The Fitted Costs (Never Negative : A Cost Below Measurement Noise Is Zero)
+    """
+    # Imported Here : statistics Pulls In decimal / fractions, Which The Lambda Cold Start Never Needs
+    import statistics
+    Type_Slope, Type_Intercept = statistics.linear_regression(*zip(*Samples["TYPE"]))
+    Delete_Slope, Delete_Intercept = statistics.linear_regression(*zip(*Samples["DELETE_TEXT"]))
+    Action_Cost = max(0.0, (Type_Intercept + Delete_Intercept) / 2)
+    Overshoot = statistics.fmean(Seconds - Requested for Requested, Seconds in Samples["WAIT"])
+
+    Keystroke = Pacing["Key_Press"] + Pacing["Key_Release"]
+    return {
+        "Key_Cost": round(max(0.0, Type_Slope - Keystroke), 6),
+        "Backspace_Cost": round(max(0.0, Delete_Slope - Keystroke - Pacing["Backspace_Gap"]), 6),
+        "Action_Cost": round(Action_Cost, 6),
+        "Wait_Cost": round(max(0.0, Overshoot - Action_Cost), 6),
+    }
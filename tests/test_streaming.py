@@ -0,0 +1,59 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Bluetooth_HID_Server as Server
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data):
+        self.sent.append(bytes(data))
+        return len(data)
+
+def make_server():
+    server = Server.BluetoothHIDServer(Test_Mode=True, Pacing="HOST_SYNC", Stream_Scripts=True,
+                                       Record_Capacity=Server.RecordingHIDSink.DEFAULT_CAPACITY)
+    server.Initialize_Keyboard()
+    return server, Server.ClientSession(FakeSocket(), "test")
+
+ABORTED_HEAD = b'[{"Command":"TYPE","Parameters":{"Text":x}}'
+ABORTED_TAIL = b',{"Command":"TYPE","Parameters":{"Text":"sec]ret"}},{"Command":"HID","Parameters":{"Key":"UP"}}]'
+
+def test_aborted_stream_is_discarded_not_typed():
+    server, session = make_server()
+    assert server.Handle_Data(session, ABORTED_HEAD)
+    assert session.Sock.sent[-1].startswith(b"AUDIT_ABORTED:")
+    assert session.Stream is not None and session.Stream.Discarding
+    assert server.Handle_Data(session, ABORTED_TAIL)
+    assert session.Stream is None
+    assert len(server.Keyboard.Sink) == 0
+    assert session.Sock.sent[-1].startswith(b"AUDIT_ABORTED:")
+
+def test_message_after_aborted_stream_runs():
+    server, session = make_server()
+    server.Handle_Data(session, ABORTED_HEAD)
+    server.Handle_Data(session, ABORTED_TAIL + b'[{"Command":"TYPE","Parameters":{"Text":"ok"}}]')
+    assert session.Sock.sent[-1] == b"AUDIT_COMPLETE"
+    assert len(server.Keyboard.Sink) == 4
+
+def test_preempted_stream_is_discarded_not_typed():
+    server, session = make_server()
+    server.Handle_Data(session, b'[{"Command":"TYPE","Parameters":{"Text":"a"}}')
+    reports = len(server.Keyboard.Sink)
+    server.Abort_Event.set()
+    server.Handle_Data(session, b',{"Command":"TYPE","Parameters":{"Text":"b"}}')
+    server.Abort_Event.clear()
+    server.Handle_Data(session, b',{"Command":"TYPE","Parameters":{"Text":"c"}}]')
+    assert session.Sock.sent[-1] == b"AUDIT_ABORTED:PREEMPTED"
+    assert len(server.Keyboard.Sink) == reports
+
+def test_dropped_stream_start_discards_its_later_chunks():
+    server, session = make_server()
+    server.Drop_Stream_Data(session, b'[{"Command":"TYPE","Parameters":{"Text":"a"}}')
+    assert session.Stream.Discarding
+    server.Handle_Data(session, b',{"Command":"TYPE","Parameters":{"Text":"secret"}}]')
+    assert session.Stream is None
+    assert len(server.Keyboard.Sink) == 0
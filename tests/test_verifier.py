@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Bluetooth_HID_Server as Server
+import AuditableHID_Verifier as Verifier
+from HID_Timing_Model import Script_Actions, Decode_Trace
+
+# Same shape as generate_random_script: keystroke steps separated by WAITs
+ACTION_SCRIPT = [
+    {"cmd": "HID", "params": {"action": "TYPE", "text": "abc123"}},
+    {"cmd": "WAIT", "params": {"seconds": 0.3}},
+    {"cmd": "HID", "params": {"action": "DELETE", "count": 6}},
+    {"cmd": "WAIT", "params": {"seconds": 0.2}},
+    {"cmd": "WAIT", "params": {"seconds": 0.1}},
+    {"cmd": "HID", "params": {"action": "PRESS", "key": "UP"}},
+]
+
+def run_traced(mode, pacing):
+    server = Server.BluetoothHIDServer(Test_Mode=True, Pacing=pacing, Execution_Mode=mode, Trace_Mode="JSON",
+                                       Record_Capacity=Server.RecordingHIDSink.DEFAULT_CAPACITY)
+    server.Initialize_Keyboard()
+    server.Execute_Actions(Script_Actions(ACTION_SCRIPT))
+    return "AUDIT_COMPLETE:" + server.Trace.Encode()
+
+@pytest.mark.parametrize("mode", ["INTERPRET", "TIMELINE"])
+@pytest.mark.parametrize("pacing", ["HOST_SYNC", "BIOS"])
+def test_trace_verifies_at_the_pacing_it_ran(mode, pacing):
+    session = {"session_id": "s1", "action_script": ACTION_SCRIPT}
+    record, = Verifier.verify_sessions([session], {"s1": run_traced(mode, pacing)})
+    assert record["verified"], record
+    assert record["score"] == 1.0
+    assert record["failed_step"] == -1
+
+def test_stored_pacing_profile_when_the_trace_has_none():
+    trace = Decode_Trace(run_traced("TIMELINE", "HOST_SYNC"))
+    del trace["Pacing"]
+    session = {"session_id": "s1", "action_script": ACTION_SCRIPT, "pacing_profile": "HOST_SYNC"}
+    record, = Verifier.verify_sessions([session], {"s1": trace})
+    assert record["verified"], record